@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks for the reading and splitting stages.
+
+Usage:
+    uv run python scripts/benchmark.py pdfplumber [--pages 200]
+    uv run python scripts/benchmark.py docling [--pages 20]
+    uv run python scripts/benchmark.py textract [--pages 20] [--latency 0.5]
+    uv run python scripts/benchmark.py fixed [--mb 256]
+    uv run python scripts/benchmark.py recursive [--mb 10 100]
+    uv run python scripts/benchmark.py sentence [--mb 50]
+    uv run python scripts/benchmark.py startup
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+# Allow running the script from the project root without installing the package.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.infrastructure.helpers.sample_pdf import write_sample_pdf  # noqa: E402
+
+SAMPLE_PDF = "data/test/input/test_1.pdf"
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def timeit(fn: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Returns the best wall time of `repeat` runs of `fn`, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_pdfplumber(args: argparse.Namespace) -> None:
+    """
+    Compares the `fast` and `accurate` PDFPlumberReader profiles.
+    """
+    from src.domain.reader.readers.pdfplumber_reader import PDFPlumberReader
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = {
+            "test_1.pdf": SAMPLE_PDF,
+            f"text-only x{args.pages}": write_sample_pdf(
+                os.path.join(tmp, "text.pdf"), args.pages
+            ),
+            f"ruled tables x{args.pages}": write_sample_pdf(
+                os.path.join(tmp, "tables.pdf"), args.pages, tables=True
+            ),
+        }
+        print(f"{'input':<24}{'accurate (s)':>14}{'fast (s)':>12}{'same output':>14}")
+        for name, path in inputs.items():
+            accurate = PDFPlumberReader(profile="accurate")
+            fast = PDFPlumberReader(profile="fast")
+            same = accurate.convert(path) == fast.convert(path)
+            print(
+                f"{name:<24}{timeit(lambda: accurate.convert(path), args.repeat):>14.3f}"
+                f"{timeit(lambda: fast.convert(path), args.repeat):>12.3f}{str(same):>14}"
+            )
+
+
+def bench_docling(args: argparse.Namespace) -> None:
+    """
+    Compares the `fast`, `balanced` and `accurate` DoclingReader profiles. Converters are
+    built, and their models loaded, before timing.
+    """
+    from src.domain.reader.readers.docling_reader import DoclingReader
+
+    profiles = DoclingReader.profiles
+    readers = {profile: DoclingReader(profile=profile) for profile in profiles}
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = {
+            "test_1.pdf": SAMPLE_PDF,
+            f"text-only x{args.pages}": write_sample_pdf(
+                os.path.join(tmp, "text.pdf"), args.pages
+            ),
+            f"ruled tables x{args.pages}": write_sample_pdf(
+                os.path.join(tmp, "tables.pdf"), args.pages, tables=True
+            ),
+        }
+        print(f"{'input':<24}" + "".join(f"{p + ' (s)':>16}" for p in profiles))
+        for name, path in inputs.items():
+            for reader in readers.values():
+                reader.convert(path)  # Warm-up: lazily loaded models.
+            times = [
+                timeit(lambda: reader.convert(path), args.repeat)
+                for reader in readers.values()
+            ]
+            print(f"{name:<24}" + "".join(f"{t:>16.3f}" for t in times))
+
+
+def bench_textract(args: argparse.Namespace) -> None:
+    """
+    Measures TextractReader page fan-out against the offline LocalTextractClient, whose
+    `latency` stands in for the Textract round trip.
+    """
+    from src.domain.reader.readers.textract_reader import TextractReader
+    from src.infrastructure.model.models.local_textract_client import (
+        LocalTextractClient,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_sample_pdf(os.path.join(tmp, "invoice.pdf"), args.pages)
+        print(f"{'concurrency':<14}{'time (s)':>10}{'pages/s':>10}")
+        for concurrency in (1, 4, 8, 16):
+            reader = TextractReader(
+                client=LocalTextractClient(latency=args.latency),
+                concurrency=concurrency,
+            )
+            elapsed = timeit(lambda: reader.convert(path), args.repeat)
+            print(f"{concurrency:<14}{elapsed:>10.3f}{args.pages / elapsed:>10.1f}")
+
+
+def bench_fixed(args: argparse.Namespace) -> None:
+    """
+    Compares FixedSplitter on the decoded text of a large UTF-8 file with `split_file`,
+    which cuts the memory-mapped bytes without decoding them.
+    """
+    from src.domain.splitter.splitters.fixed_splitter import FixedSplitter
+
+    splitter = FixedSplitter(size=8192)
+    line = "Plain-text dump line with some accents: áéíóú, ñ and € signs.\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dump.txt")
+        block = (line * (1024 * 1024 // len(line))).encode("utf-8")
+        with open(path, "wb") as f:
+            for _ in range(args.mb):
+                f.write(block)
+
+        def decode_and_split() -> None:
+            with open(path, encoding="utf-8") as f:
+                for _ in splitter.split(f.read()):
+                    pass
+
+        def split_file() -> None:
+            for _ in splitter.split_file(path):
+                pass
+
+        print(f"{'mode':<22}{'time (s)':>10}{'MB/s':>10}")
+        for name, fn in (
+            ("decode + split", decode_and_split),
+            ("split_file", split_file),
+        ):
+            elapsed = timeit(fn, args.repeat)
+            print(f"{name:<22}{elapsed:>10.3f}{args.mb / elapsed:>10.1f}")
+
+
+def bench_recursive(args: argparse.Namespace) -> None:
+    """
+    Compares RecursiveSplitter with langchain's RecursiveCharacterTextSplitter (a dev
+    dependency) at the default size and overlap of `config.yaml`, on Markdown-like text.
+    """
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    from src.domain.splitter.splitters.recursive_splitter import RecursiveSplitter
+
+    native = RecursiveSplitter(size=8192, overlap=256)
+    langchain = RecursiveCharacterTextSplitter(chunk_size=8192, chunk_overlap=256)
+    sentences = "A paragraph of a converted document, with several sentences. " * 12
+    table = "| a | table | row |\n| --- | --- | --- |\n\n"
+    paragraph = f"## Section\n\n{sentences}\n{table}"
+    print(
+        f"{'size (MB)':<12}{'langchain (s)':>15}{'native (s)':>12}{'same chunks':>14}"
+    )
+    for mb in args.mb:
+        text = paragraph * (mb * 1024 * 1024 // len(paragraph))
+        same = native.split(text) == langchain.split_text(text)
+        print(
+            f"{mb:<12}{timeit(lambda: langchain.split_text(text), args.repeat):>15.3f}"
+            f"{timeit(lambda: native.split(text), args.repeat):>12.3f}{str(same):>14}"
+        )
+
+
+def bench_sentence(args: argparse.Namespace) -> None:
+    """
+    Compares SentenceSplitter with the previous implementation (regex split of the whole
+    text, then strip and group), at the 500 sentences per chunk of `config.yaml`.
+    """
+    import re
+
+    from src.domain.splitter.splitters.sentence_splitter import SentenceSplitter
+
+    def previous(text: str, num_sentences: int = 500) -> list:
+        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = [s.strip() for s in sentences if s.strip()]
+        return [
+            " ".join(sentences[i : i + num_sentences])
+            for i in range(0, len(sentences), num_sentences)
+        ]
+
+    splitter = SentenceSplitter(num_sentences=500)
+    sentence = "The quick brown fox jumps over the lazy dog near the river bank. "
+    text = sentence * (args.mb * 1024 * 1024 // len(sentence))
+    print(f"{'implementation':<20}{'time (s)':>10}{'MB/s':>10}")
+    for name, fn in (
+        ("previous", lambda: previous(text)),
+        ("split", lambda: splitter.split(text)),
+        ("split_spans", lambda: splitter.split_spans(text)),
+    ):
+        elapsed = timeit(fn, args.repeat)
+        print(f"{name:<20}{elapsed:>10.3f}{args.mb / elapsed:>10.1f}")
+
+
+def bench_startup(args: argparse.Namespace) -> None:
+    """
+    Measures the import time of the entry points in fresh interpreters, and the cost of the
+    first use of each reader (which imports its backend).
+    """
+    targets = {
+        "python": "pass",
+        "api app": "import src.application.api.app",
+        "managers": (
+            "from src.domain.reader.read_manager import ReadManager\n"
+            "from src.domain.splitter.split_manager import SplitManager"
+        ),
+    }
+    for method in ("custom", "markitdown", "pdfplumber", "docling"):
+        targets[f"first {method} reader"] = (
+            "from src.domain.reader.read_manager import ReadManager\n"
+            f"ReadManager({{'reader': {{'method': '{method}'}}}})._get_reader()"
+        )
+
+    print(f"{'target':<26}{'time (s)':>10}")
+    for name, code in targets.items():
+        command = [sys.executable, "-c", code]
+        elapsed = timeit(
+            lambda: subprocess.run(command, cwd=ROOT, check=True, capture_output=True),
+            args.repeat,
+        )
+        print(f"{name:<26}{elapsed:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement.")
+    subparsers = parser.add_subparsers(dest="target", required=True)
+
+    pdfplumber_parser = subparsers.add_parser(
+        "pdfplumber", help="PDFPlumberReader profiles."
+    )
+    pdfplumber_parser.add_argument("--pages", type=int, default=200)
+    pdfplumber_parser.set_defaults(func=bench_pdfplumber)
+
+    docling_parser = subparsers.add_parser("docling", help="DoclingReader profiles.")
+    docling_parser.add_argument("--pages", type=int, default=20)
+    docling_parser.set_defaults(func=bench_docling)
+
+    textract_parser = subparsers.add_parser(
+        "textract", help="TextractReader page fan-out with the local client."
+    )
+    textract_parser.add_argument("--pages", type=int, default=20)
+    textract_parser.add_argument("--latency", type=float, default=0.5)
+    textract_parser.set_defaults(func=bench_textract)
+
+    fixed_parser = subparsers.add_parser(
+        "fixed", help="FixedSplitter on decoded text versus memory-mapped bytes."
+    )
+    fixed_parser.add_argument("--mb", type=int, default=256)
+    fixed_parser.set_defaults(func=bench_fixed)
+
+    recursive_parser = subparsers.add_parser(
+        "recursive", help="RecursiveSplitter against langchain's splitter."
+    )
+    recursive_parser.add_argument("--mb", type=int, nargs="+", default=[10, 100])
+    recursive_parser.set_defaults(func=bench_recursive)
+
+    sentence_parser = subparsers.add_parser(
+        "sentence", help="SentenceSplitter against the previous implementation."
+    )
+    sentence_parser.add_argument("--mb", type=int, default=50)
+    sentence_parser.set_defaults(func=bench_sentence)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Import time of the entry points and first reader use."
+    )
+    startup_parser.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,20 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.application.api.routers import health, split
+from src.application.api.warmup import ReaderWarmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts warming up the readers in the background; `/health/ready` reports when done.
+    """
+    app.state.warmup = ReaderWarmup()
+    app.state.warmup.start()
+    yield
+
 
 app = FastAPI(
     title="Document Splitter API",
@@ -10,10 +24,12 @@ This API allows you to upload a document and split it into chunks using a select
 
 **Endpoints:**
 - **`GET` - `/health-check`**: Health check.
+- **`GET` - `/health/ready`**: Readiness check (readers warmed up).
 - **`POST` - `/documents/split`**: Upload and process a document.
 """,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Register application routers
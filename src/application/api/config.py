@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -18,4 +20,17 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra fields not explicitly defined in Settings
 
 
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Returns the application settings. They are loaded and validated on the first call, so
+    importing this module does not require the environment to be configured.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keeps `from src.application.api.config import settings` working, lazily.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,12 +13,30 @@ class ReaderMethodEnum(str, Enum):
         docling (str): Uses the Docling tool to extract structured text and metadata.
         pdfplumber (str): Uses PDFPlumber to extract text and tables from PDF documents.
         textract (str): Uses AWS Textract to extract text from a variety of document formats.
+        custom (str): Reads plain-text documents (txt, md, csv, json...) as they are.
     """
 
     markitdown = "markitdown"
     docling = "docling"
     pdfplumber = "pdfplumber"
     textract = "textract"
+    custom = "custom"
+
+
+class ReaderProfileEnum(str, Enum):
+    """
+    Speed profiles of the readers that support them (docling and pdfplumber).
+
+    Attributes:
+        fast (str): Skips the most expensive steps. Docling runs neither OCR nor table
+            structure recognition; pdfplumber only looks for tables on ruled pages.
+        balanced (str): Docling only: no OCR, tables recognized with the fast model.
+        accurate (str): Runs every step (OCR and accurate table recognition with Docling).
+    """
+
+    fast = "fast"
+    balanced = "balanced"
+    accurate = "accurate"
 
 
 class SplitMethodEnum(str, Enum):
@@ -31,6 +49,7 @@ class SplitMethodEnum(str, Enum):
         paragraph (str): Splits content by paragraphs.
         fixed (str): Splits content into fixed-size character chunks.
         recursive (str): Uses a recursive strategy for adaptive chunking with overlap.
+        token (str): Fills chunks up to a number of tokens of an offline tokenizer.
     """
 
     word = "word"
@@ -40,6 +59,7 @@ class SplitMethodEnum(str, Enum):
     fixed = "fixed"
     # paged = "paged"
     recursive = "recursive"
+    token = "token"
     # row_column = "row-column"
     # schema_based = "schema-based"
     # auto = "auto"
@@ -103,6 +123,11 @@ class ChunkResponse(BaseModel):
         metadata (Optional[List[str]]): Any additional metadata associated with the document.
         ocr_method (OCRMethodEnum): The OCR or VLM method used during processing.
         reader_method (Optional[str]): The reader backend used for parsing the document.
+        reader_profile (Optional[str]): The reader speed profile, if any.
+        token_counts (Optional[List[int]]): The number of tokens of each chunk, with the
+            token split method.
+        chunk_spans (Optional[List[List[int]]]): The start and end offsets of each chunk in
+            the document text, if requested.
     """
 
     chunks: List[str]
@@ -115,3 +140,6 @@ class ChunkResponse(BaseModel):
     metadata: Optional[List[str]] = []
     ocr_method: OCRMethodEnum
     reader_method: Optional[str] = None
+    reader_profile: Optional[str] = None
+    token_counts: Optional[List[int]] = None
+    chunk_spans: Optional[List[List[int]]] = None
@@ -1,12 +1,14 @@
 """
 Health endpoints for the API.
 
-This module defines a health check endpoint wrapped in a class for documentation purposes.
+This module defines the health check and readiness endpoints wrapped in a class for
+documentation purposes.
 """
 
 import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 __all__ = ["HealthAPI"]
 
@@ -18,7 +20,8 @@ class HealthAPI:
     """
     A class to encapsulate health check endpoints.
 
-    Use the static method `health_check` to verify that the service is running.
+    Use the static method `health_check` to verify that the service is running, and
+    `readiness_check` to verify that it is ready to serve requests quickly.
     """
 
     @staticmethod
@@ -31,3 +34,20 @@ class HealthAPI:
             dict: A JSON response with the application status and the current UTC time.
         """
         return {"status": "ok", "timestamp": datetime.datetime.utcnow().isoformat()}
+
+    @staticmethod
+    @router.get("/health/ready", tags=["Health"])
+    async def readiness_check(request: Request):
+        """
+        Readiness endpoint. The service is ready once the readers have been warmed up at
+        startup (see `ReaderWarmup`).
+
+        Returns:
+            JSONResponse: 200 with the warm-up time of each reader (and the readers that
+                failed to warm up) when ready, 503 while warming up.
+        """
+        warmup = getattr(request.app.state, "warmup", None)
+        if warmup is None:
+            return {"status": "ready", "readers": {}, "errors": {}}
+        status = warmup.status()
+        return JSONResponse(status, status_code=200 if warmup.ready else 503)
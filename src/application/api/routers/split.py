@@ -4,7 +4,7 @@ import json
 import os
 import uuid
 import zipfile
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
@@ -13,6 +13,7 @@ from src.application.api.models import (
     ChunkResponse,
     OCRMethodEnum,
     ReaderMethodEnum,
+    ReaderProfileEnum,
     SplitMethodEnum,
 )
 from src.domain.chunker.chunk_manager import ChunkManager
@@ -21,6 +22,60 @@ from src.domain.splitter.split_manager import SplitManager
 
 router = APIRouter()
 
+# Reader methods accepting a `profile` option, with the profiles each one supports.
+READER_PROFILES = {
+    "docling": ("fast", "balanced", "accurate"),
+    "pdfplumber": ("fast", "accurate"),
+}
+
+# Images of a document captioned concurrently, as `ocr.concurrency` in config.yaml.
+DEFAULT_OCR_CONCURRENCY = 8
+
+# Memory budget of the image caption cache, as `ocr.cache.memory_max_mb` in config.yaml.
+CAPTION_CACHE_MEMORY_MB = 16
+
+
+def build_read_config(
+    input_path: str,
+    ocr_method: str,
+    reader_method: str,
+    reader_profile: Optional[str] = None,
+    ocr_concurrency: int = DEFAULT_OCR_CONCURRENCY,
+) -> Dict:
+    """
+    Builds the ReadManager configuration of a request. Readers are pooled by this
+    configuration, so the API warm-up uses it too.
+
+    Args:
+        input_path (str): Directory the documents are read from.
+        ocr_method (str): OCR client ("none", "openai" or "azure").
+        reader_method (str): Reader method.
+        reader_profile (Optional[str]): Speed profile of the reader (see READER_PROFILES).
+        ocr_concurrency (int): Images of a document captioned concurrently.
+
+    Returns:
+        Dict: The ReadManager configuration.
+
+    Raises:
+        ValueError: If the reader does not support the profile.
+    """
+    reader_config = {"method": reader_method, "cache": {"enabled": True}}
+    if reader_profile:
+        if reader_profile not in READER_PROFILES.get(reader_method, ()):
+            raise ValueError(
+                f"Reader {reader_method} does not support the {reader_profile} profile"
+            )
+        reader_config["methods"] = {reader_method: {"profile": reader_profile}}
+    return {
+        "file_io": {"input_path": input_path},
+        "ocr": {
+            "method": ocr_method,
+            "concurrency": ocr_concurrency,
+            "cache": {"enabled": True, "memory_max_mb": CAPTION_CACHE_MEMORY_MB},
+        },
+        "reader": reader_config,
+    }
+
 
 class SplitAPI:
     """
@@ -64,6 +119,14 @@ class SplitAPI:
             description="OCR client to use for image processing."
             "Available options: 'none', 'openai', or 'azure'.",
         ),
+        ocr_concurrency: int = Form(
+            DEFAULT_OCR_CONCURRENCY,
+            ge=1,
+            description=(
+                "Images of a document captioned concurrently by the OCR client. "
+                "1 captions them one after another."
+            ),
+        ),
         reader_method: ReaderMethodEnum = Form(
             ...,
             description=(
@@ -71,6 +134,14 @@ class SplitAPI:
                 "Available options: markitdown, docling, pdfplumber."
             ),
         ),
+        reader_profile: Optional[ReaderProfileEnum] = Form(
+            None,
+            description=(
+                "Speed profile of the reader. docling: fast (no OCR nor table "
+                "recognition, for born-digital PDFs), balanced or accurate; "
+                "pdfplumber: fast or accurate. Leave empty for the reader default."
+            ),
+        ),
         metadata: Optional[List[str]] = Form([], description="Optional metadata tags."),
         split_params: str = Form(
             "{}",
@@ -83,6 +154,14 @@ class SplitAPI:
             False,
             description="If true, returns the chunks in a ZIP archive instead of JSON.",
         ),
+        chunk_spans: bool = Form(
+            False,
+            description=(
+                "If true, the response includes the [start, end] offsets of each chunk in "
+                "the document text. Word, sentence and paragraph chunks normalize the "
+                "whitespace of the document, so their text may differ from their span."
+            ),
+        ),
     ) -> Union[ChunkResponse, StreamingResponse]:
         """
         Splits a document into chunks and returns the results.
@@ -142,11 +221,17 @@ class SplitAPI:
                 }
 
             # Prepare ReadManager configuration, now including reader_method.
-            read_config = {
-                "file_io": {"input_path": file_dir},
-                "ocr": {"method": ocr_method.value},
-                "reader": {"method": reader_method},
-            }
+            profile = reader_profile.value if reader_profile else None
+            try:
+                read_config = build_read_config(
+                    file_dir,
+                    ocr_method.value,
+                    reader_method.value,
+                    profile,
+                    ocr_concurrency,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
 
             # Instantiate managers.
             read_manager = ReadManager(config=read_config)
@@ -164,7 +249,16 @@ class SplitAPI:
                 else read_manager.read_file(file_name)
             )
 
-            chunks = split_manager.split_text(markdown_text)
+            spans = token_counts = None
+            if chunk_spans or split_method == SplitMethodEnum.token:
+                spans, token_counts = split_manager.split_counted(markdown_text)
+            if spans is not None and not split_manager.splitter.normalizes_whitespace:
+                # Chunk texts are only materialized as they are written out.
+                chunks = spans
+            else:
+                chunks = split_manager.split_text(markdown_text)
+            if not chunk_spans:
+                spans = None
             if not chunks:
                 raise HTTPException(
                     status_code=400, detail="No chunks generated from the document."
@@ -198,7 +292,7 @@ class SplitAPI:
                 )
 
             return ChunkResponse(
-                chunks=chunks,
+                chunks=list(chunks),
                 chunk_id=chunk_ids,
                 chunk_path=chunk_path,
                 document_id=document_id,
@@ -208,6 +302,13 @@ class SplitAPI:
                 metadata=metadata,
                 ocr_method=ocr_method,
                 reader_method=reader_method,
+                reader_profile=profile,
+                token_counts=token_counts,
+                chunk_spans=(
+                    [list(span) for span in spans.spans()]
+                    if spans is not None
+                    else None
+                ),
             )
 
         except HTTPException as http_exc:
@@ -0,0 +1,107 @@
+"""
+Reader warm-up for the API.
+
+Building a reader and running its first conversion imports its backend and, for Docling,
+loads the layout and table models. `ReaderWarmup` does this in a background thread when the
+API starts, so that no request pays for it; `/health/ready` reports when it is done.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.application.api.routers.split import build_read_config
+from src.domain.reader.read_manager import ReadManager
+
+DEFAULT_WARMUP_READERS = "markitdown,docling,pdfplumber,custom"
+
+
+def warmup_readers_from_env() -> List[str]:
+    """
+    Returns the reader methods listed in `WARMUP_READERS` (comma-separated; empty disables
+    the warm-up).
+    """
+    value = os.getenv("WARMUP_READERS", DEFAULT_WARMUP_READERS)
+    return [method.strip() for method in value.split(",") if method.strip()]
+
+
+class ReaderWarmup:
+    """
+    Warms up readers in a background thread and tracks readiness.
+
+    A reader that fails to warm up is logged and reported in `errors`; it does not keep the
+    service from becoming ready, as it would then fail on every request anyway.
+
+    Attributes:
+        methods (List[str]): Reader methods to warm up.
+        durations (Dict[str, float]): Seconds spent on each warmed-up reader.
+        errors (Dict[str, str]): Error message of each reader that failed to warm up.
+    """
+
+    def __init__(self, methods: Optional[List[str]] = None) -> None:
+        """
+        Initialize the warm-up.
+
+        Args:
+            methods (Optional[List[str]]): Reader methods to warm up. Defaults to
+                `warmup_readers_from_env()`.
+        """
+        self.methods = warmup_readers_from_env() if methods is None else methods
+        self.durations: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """
+        Runs the warm-up in a daemon thread.
+        """
+        self._thread = threading.Thread(
+            target=self.run, name="reader-warmup", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the warm-up has finished. Returns whether it has.
+        """
+        return self._ready.wait(timeout)
+
+    def run(self) -> None:
+        """
+        Warms up every reader, one after another.
+        """
+        self.started_at = time.time()
+        try:
+            for method in self.methods:
+                try:
+                    read_manager = ReadManager(
+                        config=build_read_config("data/input", "none", method)
+                    )
+                    self.durations.update(read_manager.warm_up([method]))
+                except Exception as e:
+                    logging.error(f"Reader warm-up failed | Method: {method} | {e}")
+                    self.errors[method] = str(e)
+        finally:
+            self.finished_at = time.time()
+            self._ready.set()
+
+    def status(self) -> Dict:
+        """
+        Returns the readiness status as a JSON-serializable dictionary.
+        """
+        return {
+            "status": "ready" if self.ready else "warming_up",
+            "readers": {
+                method: round(seconds, 3) for method, seconds in self.durations.items()
+            },
+            "errors": self.errors,
+        }
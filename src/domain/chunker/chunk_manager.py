@@ -1,7 +1,7 @@
 import datetime
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from src.domain.splitter.split_manager import SplitManager
 
@@ -19,7 +19,8 @@ class ChunkManager:
         split_method (str): The method used for splitting the text.
 
     Methods:
-        save_chunks(chunks: List[str], file_name: str, extension: str, split_method: str) -> None:
+        save_chunks(chunks: Iterable[str], file_name: str, extension: str,
+                    split_method: str) -> None:
             Saves each chunk to the output directory, naming them based on the original file name
             and chunk index.
     """
@@ -69,7 +70,7 @@ class ChunkManager:
 
     def save_chunks(
         self,
-        chunks: List[str],
+        chunks: Iterable[str],
         base_filename: str,
         original_extension: str,
         splitter_method: str,
@@ -83,7 +84,9 @@ class ChunkManager:
         `{base_filename}_{original_extension}_{date}_{time}_chunk_{i}.md`.
 
         Args:
-            chunks (List[str]): A list of text chunks to be saved.
+            chunks (Iterable[str]): The text chunks to be saved: a list, or `ChunkSpans`,
+                whose chunks are then materialized one at a time as they are written. UTF-8
+                encoded chunks (bytes or memoryviews) are written as they are.
             base_filename (str): The base name of the original file used to construct output
                 filenames.
             original_extension (str): The file extension of the original file (e.g., ".md").
@@ -104,8 +107,13 @@ class ChunkManager:
             chunk_filename = f"{base_filename}_chunk_{i}.md"
             filepath = os.path.join(folder_path, chunk_filename)
             try:
-                with open(filepath, "w", encoding="utf-8") as f:
-                    f.write(chunk)
+                if isinstance(chunk, str):
+                    with open(filepath, "w", encoding="utf-8") as f:
+                        f.write(chunk)
+                else:
+                    # UTF-8 bytes (e.g. memoryviews from FixedSplitter.split_file).
+                    with open(filepath, "wb") as f:
+                        f.write(chunk)
                 saved_files.append(filepath)
                 logging.info(f"Chunk {i} saved to {filepath}")
             except Exception as e:
@@ -1,11 +1,182 @@
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from src.domain.reader.document import PAGE_BREAK, Document
 
 
 class BaseReader(ABC):
     """
     Abstract class which implements Readers.
+
+    Attributes:
+        embeds_file_name (bool): Whether the output contains the name of the converted file
+            (e.g., a "# Document: <name>" header). Used to build conversion cache keys.
+        supports_stream (bool): Whether the reader converts streams natively in
+            `convert_stream`, so that uploads are not staged on disk first.
+        converts_batches (bool): Whether `convert_batch` converts several files together
+            more efficiently than one by one, so that callers should batch them.
     """
 
+    embeds_file_name: bool = False
+    supports_stream: bool = False
+    converts_batches: bool = False
+
     @abstractmethod
     def convert(self, file_path: str) -> str | dict:
         pass
+
+    def convert_stream(self, stream: BinaryIO, file_name: str) -> str | dict:
+        """
+        Convert the content of a binary file-like object. Readers that set `supports_stream`
+        convert the stream directly; by default it is copied to a temporary file that keeps
+        the original file name, which is converted with `convert`.
+
+        Args:
+            stream (BinaryIO): Seekable binary stream with the document content.
+            file_name (str): Original name of the document, used to infer its format.
+
+        Returns:
+            str | dict: The converted content.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, os.path.basename(file_name))
+            with open(tmp_path, "wb") as tmp:
+                shutil.copyfileobj(stream, tmp)
+            return self.convert(tmp_path)
+
+    def iter_convert(self, file_path: str) -> Iterator[str]:
+        """
+        Convert a file, yielding the Markdown output in consecutive pieces. Readers that
+        produce their output incrementally (page by page, block by block) override this so
+        that callers never hold the whole output at once; by default `convert` is called
+        and its output yielded in one piece.
+
+        Args:
+            file_path (str): The path to the file that will be converted.
+
+        Yields:
+            str: Consecutive pieces of the converted content.
+        """
+        yield self.convert(file_path)
+
+    def convert_document(self, file_path: str) -> Document:
+        """
+        Convert a file to a structured `Document` (blocks with their type, page, heading
+        level and offsets). Readers that know the structure of what they convert override
+        this; by default the Markdown output of `convert` is parsed.
+
+        Args:
+            file_path (str): The path to the file that will be converted.
+
+        Returns:
+            Document: The converted document, whose text is the output of `convert`.
+        """
+        return Document.from_markdown(self.convert(file_path))
+
+    def convert_pages(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> str | dict:
+        """
+        Convert only some pages of a document. Readers that can skip pages while converting
+        override this; by default the whole document is converted and the pages, separated
+        by form feeds (as in MarkItDown's PDF output), are filtered afterwards. Documents
+        without form feeds are a single page.
+
+        Args:
+            file_path (str): The path to the file that will be converted.
+            pages (Optional[Iterable[int]]): 1-based page numbers to keep. None keeps all.
+            max_pages (Optional[int]): Keep at most this many of the selected pages.
+
+        Returns:
+            str | dict: The converted content of the selected pages.
+        """
+        return filter_pages(self.convert(file_path), pages, max_pages)
+
+    def convert_batch(
+        self, file_paths: List[str]
+    ) -> Iterator[Tuple[str, str | dict | Exception]]:
+        """
+        Convert several files. Readers whose backend converts batches more efficiently
+        override this; by default files are converted one by one.
+
+        A file that fails to convert yields its exception instead of a result, so one bad
+        file does not stop the batch.
+
+        Args:
+            file_paths (List[str]): Paths of the files to convert.
+
+        Yields:
+            Tuple[str, str | dict | Exception]: Each path, in order, with its converted
+                content or the error raised converting it.
+        """
+        for file_path in file_paths:
+            try:
+                yield file_path, self.convert(file_path)
+            except Exception as e:
+                yield file_path, e
+
+    def close(self) -> None:
+        """
+        Release the resources held by the reader (threads, clients...). Called when the
+        reader is removed from the reader pool; does nothing by default.
+        """
+        pass
+
+
+def select_page_numbers(
+    page_count: Optional[int],
+    pages: Optional[Iterable[int]] = None,
+    max_pages: Optional[int] = None,
+) -> List[int]:
+    """
+    Resolves a page selection to sorted, unique 1-based page numbers.
+
+    Args:
+        page_count (Optional[int]): Number of pages of the document. If None, `pages` is not
+            bounded and is required unless `max_pages` is given.
+        pages (Optional[Iterable[int]]): Page numbers to keep. None selects every page.
+        max_pages (Optional[int]): Keep at most this many pages (the first ones).
+
+    Returns:
+        List[int]: The selected page numbers.
+
+    Raises:
+        ValueError: If a page number or `max_pages` is lower than 1.
+    """
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be greater than 0")
+    if pages is None:
+        if page_count is None and max_pages is None:
+            raise ValueError("page_count or max_pages is required to select every page")
+        last = page_count if max_pages is None else max_pages
+        if page_count is not None:
+            last = min(last, page_count)
+        return list(range(1, last + 1))
+    selected = sorted(set(pages))
+    if selected and selected[0] < 1:
+        raise ValueError("Page numbers start at 1")
+    if page_count is not None:
+        selected = [page for page in selected if page <= page_count]
+    return selected[:max_pages]
+
+
+def filter_pages(
+    content: str | dict,
+    pages: Optional[Iterable[int]] = None,
+    max_pages: Optional[int] = None,
+) -> str | dict:
+    """
+    Keeps the selected pages of a converted document whose pages are separated by form
+    feeds. Non-text content is returned unchanged.
+    """
+    if not isinstance(content, str) or (pages is None and max_pages is None):
+        return content
+    page_texts = content.split(PAGE_BREAK)
+    selected = select_page_numbers(len(page_texts), pages, max_pages)
+    return PAGE_BREAK.join(page_texts[page - 1] for page in selected)
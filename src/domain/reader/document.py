@@ -0,0 +1,369 @@
+import json
+import re
+from array import array
+from bisect import bisect_right
+from enum import IntEnum
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+PAGE_BREAK = "\f"
+
+_LINE_END = re.compile(r"[\n\f]")
+_HEADING = re.compile(r"(#{1,6})\s")
+_SETEXT_UNDERLINE = re.compile(r"(?:=+|-{2,})$")
+_LIST_ITEM = re.compile(r"\s*(?:[-*+]|\d+[.)])\s")
+
+
+class BlockType(IntEnum):
+    """
+    Kinds of blocks of a `Document`.
+    """
+
+    PARAGRAPH = 0
+    HEADING = 1
+    TABLE = 2
+    LIST = 3
+    CODE = 4
+    IMAGE = 5
+
+
+class Block(NamedTuple):
+    """
+    A view of one block of a `Document`.
+
+    Attributes:
+        kind (BlockType): Block type.
+        page (int): 1-based page number the block starts on.
+        level (int): Heading level (1-6) for headings, 0 otherwise.
+        start (int): Offset of the block in the document text.
+        end (int): Offset right after the block in the document text.
+        text (str): The block text.
+    """
+
+    kind: BlockType
+    page: int
+    level: int
+    start: int
+    end: int
+    text: str
+
+
+class Document:
+    """
+    Intermediate representation of a converted document.
+
+    The document is its Markdown text plus one entry per block (paragraph, heading, table,
+    list, code or image) in parallel arrays: type, page, heading level and the start and end
+    offsets of the block in the text. Blocks are views: no block text is stored twice, and
+    pages, sections and the block at an offset are found from the arrays without scanning
+    the text again.
+
+    Readers that know the structure of what they convert (pages, tables...) build documents
+    with a `DocumentBuilder`; any other Markdown is parsed with `from_markdown`.
+
+    Attributes:
+        text (str): The Markdown rendering of the document.
+        kinds (array): Block types (`BlockType` values).
+        pages (array): 1-based page number of each block.
+        levels (array): Heading level of each block (0 if not a heading).
+        starts (array): Start offset of each block in `text`.
+        ends (array): End offset of each block in `text`.
+    """
+
+    __slots__ = ("text", "kinds", "pages", "levels", "starts", "ends")
+
+    def __init__(
+        self,
+        text: str = "",
+        kinds: Optional[array] = None,
+        pages: Optional[array] = None,
+        levels: Optional[array] = None,
+        starts: Optional[array] = None,
+        ends: Optional[array] = None,
+    ) -> None:
+        self.text = text
+        self.kinds = kinds if kinds is not None else array("B")
+        self.pages = pages if pages is not None else array("I")
+        self.levels = levels if levels is not None else array("B")
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __iter__(self) -> Iterator[Block]:
+        return (self.block(index) for index in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def block(self, index: int) -> Block:
+        """
+        Returns the block at a given index.
+        """
+        start, end = self.starts[index], self.ends[index]
+        return Block(
+            BlockType(self.kinds[index]),
+            self.pages[index],
+            self.levels[index],
+            start,
+            end,
+            self.text[start:end],
+        )
+
+    def block_at(self, offset: int) -> Optional[Block]:
+        """
+        Returns the last block starting at or before a text offset, or None if the offset is
+        before the first block.
+        """
+        index = bisect_right(self.starts, offset) - 1
+        return self.block(index) if index >= 0 else None
+
+    def to_markdown(self) -> str:
+        """
+        Returns the Markdown rendering of the document (no copy is made).
+        """
+        return self.text
+
+    def page_spans(self) -> List[Tuple[int, int, int]]:
+        """
+        Returns the text span of each page.
+
+        Returns:
+            List[Tuple[int, int, int]]: The page number, start and end offsets of each run
+                of blocks on the same page, in document order.
+        """
+        spans: List[Tuple[int, int, int]] = []
+        for index in range(len(self)):
+            page = self.pages[index]
+            if spans and spans[-1][0] == page:
+                spans[-1] = (page, spans[-1][1], self.ends[index])
+            else:
+                spans.append((page, self.starts[index], self.ends[index]))
+        return spans
+
+    def section_spans(self, max_level: int = 6) -> List[Tuple[int, int, int]]:
+        """
+        Returns the text span of each section. A section starts at a heading of level up to
+        `max_level` and ends right before the next one. Text before the first heading is a
+        section of its own.
+
+        Args:
+            max_level (int): Deepest heading level that starts a section.
+
+        Returns:
+            List[Tuple[int, int, int]]: The index of the heading block (-1 for text before
+                the first heading), start and end offsets of each section.
+        """
+        spans: List[Tuple[int, int, int]] = []
+        for index in range(len(self)):
+            is_heading = self.kinds[index] == BlockType.HEADING
+            is_section = is_heading and self.levels[index] <= max_level
+            if is_section or not spans:
+                heading = index if is_section else -1
+                spans.append((heading, self.starts[index], self.ends[index]))
+            else:
+                spans[-1] = (spans[-1][0], spans[-1][1], self.ends[index])
+        return spans
+
+    def dumps(self) -> str:
+        """
+        Serializes the document to a string (the block arrays on the first line, then the
+        text), e.g. to store it in a `TextCache`.
+        """
+        header = {
+            name: getattr(self, name).tolist()
+            for name in ("kinds", "pages", "levels", "starts", "ends")
+        }
+        return json.dumps(header, separators=(",", ":")) + "\n" + self.text
+
+    @classmethod
+    def loads(cls, data: str) -> "Document":
+        """
+        Deserializes a document produced by `dumps`.
+        """
+        header, text = data.split("\n", 1)
+        arrays = json.loads(header)
+        return cls(
+            text,
+            array("B", arrays["kinds"]),
+            array("I", arrays["pages"]),
+            array("B", arrays["levels"]),
+            array("q", arrays["starts"]),
+            array("q", arrays["ends"]),
+        )
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "Document":
+        """
+        Builds a document from Markdown text in a single pass.
+
+        Headings, fenced code, tables, lists and images are recognized line by line; other
+        runs of non-blank lines are paragraphs. Form feeds, which separate the pages of
+        converted PDFs, start a new page.
+
+        Args:
+            text (str): Markdown text.
+
+        Returns:
+            Document: The document, whose text is `text` itself.
+        """
+        document = cls(text)
+        page = 1
+        block: Optional[List[int]] = None  # kind, level, start, end
+        in_code = False
+        position = 0
+        length = len(text)
+
+        def close() -> None:
+            nonlocal block
+            if block is not None:
+                document._append(block[0], block_page, block[1], block[2], block[3])
+                block = None
+
+        block_page = page
+        while position < length:
+            line_end = _LINE_END.search(text, position)
+            end = line_end.start() if line_end else length
+            line = text[position:end]
+            stripped = line.strip()
+
+            if in_code:
+                block[3] = end
+                if stripped.endswith("```"):
+                    in_code = False
+                    close()
+            elif not stripped:
+                close()
+            elif _is_setext_underline(block, stripped):
+                # Setext heading: the last line of the paragraph, underlined.
+                level = 1 if stripped[0] == "=" else 2
+                last_line = text.rfind("\n", block[2], block[3])
+                if last_line >= 0:
+                    block[3] = last_line
+                    close()
+                    block = [BlockType.PARAGRAPH, 0, last_line + 1, end]
+                block[0], block[1], block[3] = BlockType.HEADING, level, end
+                close()
+            else:
+                kind, level = _line_kind(line, stripped)
+                if _continues(block, kind, line):
+                    block[3] = end
+                else:
+                    close()
+                    start = position + (len(line) - len(line.lstrip()))
+                    block = [kind, level, start, end]
+                    block_page = page
+                    if kind == BlockType.CODE:
+                        in_code = len(stripped) < 6 or not stripped.endswith("```")
+                    if kind in (BlockType.HEADING, BlockType.IMAGE):
+                        close()
+
+            if end < length and text[end] == PAGE_BREAK:
+                close()
+                in_code = False
+                page += 1
+            position = end + 1
+        close()
+        return document
+
+    def _append(self, kind: int, page: int, level: int, start: int, end: int) -> None:
+        self.kinds.append(kind)
+        self.pages.append(page)
+        self.levels.append(level)
+        self.starts.append(start)
+        self.ends.append(end)
+
+
+class DocumentBuilder:
+    """
+    Builds a `Document` block by block, rendering it to Markdown as it goes.
+
+    Each block is appended to the text followed by `separator` (a blank line by default), so
+    the text of a built document is its Markdown rendering.
+    """
+
+    def __init__(self) -> None:
+        self._document = Document()
+        self._parts: List[str] = []
+        self._length = 0
+
+    def add(
+        self,
+        kind: BlockType,
+        text: str,
+        page: int = 1,
+        level: int = 0,
+        separator: str = "\n\n",
+    ) -> None:
+        """
+        Appends a block.
+
+        Args:
+            kind (BlockType): Block type.
+            text (str): Block text, without the trailing separator.
+            page (int): 1-based page number.
+            level (int): Heading level (1-6) for headings, 0 otherwise.
+            separator (str): Text appended after the block.
+        """
+        start = self._length
+        self._document._append(kind, page, level, start, start + len(text))
+        self._parts.append(text)
+        self._parts.append(separator)
+        self._length += len(text) + len(separator)
+
+    def add_text(self, text: str) -> None:
+        """
+        Appends text that is not part of any block (e.g. a placeholder).
+        """
+        self._parts.append(text)
+        self._length += len(text)
+
+    def build(self) -> Document:
+        """
+        Returns the built document.
+        """
+        self._document.text = "".join(self._parts)
+        return self._document
+
+
+def _line_kind(line: str, stripped: str) -> Tuple[BlockType, int]:
+    """
+    Classifies the first line of a block.
+    """
+    heading = _HEADING.match(stripped + " ")
+    if heading and line[:1] == "#":
+        return BlockType.HEADING, len(heading.group(1))
+    if stripped.startswith("```"):
+        return BlockType.CODE, 0
+    if stripped.startswith("|"):
+        return BlockType.TABLE, 0
+    if stripped.startswith("![") and stripped.endswith(")"):
+        return BlockType.IMAGE, 0
+    if _LIST_ITEM.match(line):
+        return BlockType.LIST, 0
+    return BlockType.PARAGRAPH, 0
+
+
+def _is_setext_underline(block: Optional[List[int]], stripped: str) -> bool:
+    """
+    Whether a line underlines the last line of a paragraph as a heading.
+    """
+    if block is None or block[0] != BlockType.PARAGRAPH:
+        return False
+    return bool(_SETEXT_UNDERLINE.match(stripped))
+
+
+def _continues(block: Optional[List[int]], kind: BlockType, line: str) -> bool:
+    """
+    Whether a line of a given kind continues the open block rather than starting one.
+    """
+    if block is None:
+        return False
+    if block[0] == kind:
+        return kind in (BlockType.PARAGRAPH, BlockType.TABLE, BlockType.LIST)
+    # Indented lines continue list items.
+    return block[0] == BlockType.LIST and line[:1].isspace()
@@ -0,0 +1,178 @@
+import os
+from typing import BinaryIO, Dict, Optional, Tuple
+
+# Bytes read from the start of a file to identify its format.
+SAMPLE_SIZE: int = 8192
+
+# Formats each reader can convert.
+READER_FORMATS: Dict[str, frozenset] = {
+    "custom": frozenset({"text"}),
+    "markitdown": frozenset(
+        {
+            "pdf",
+            "docx",
+            "pptx",
+            "xlsx",
+            "xls",
+            "msg",
+            "epub",
+            "zip",
+            "html",
+            "image",
+            "text",
+        }  # noqa: E501
+    ),
+    "docling": frozenset({"pdf", "docx", "pptx", "xlsx", "html", "image", "text"}),
+    "pdfplumber": frozenset({"pdf"}),
+    "textract": frozenset({"pdf", "image"}),
+}
+
+# Readers from the cheapest to the most expensive one, used when the configured reader
+# cannot convert a format.
+READER_COST_ORDER: Tuple[str, ...] = (
+    "custom",
+    "markitdown",
+    "pdfplumber",
+    "docling",
+    "textract",
+)
+
+# Formats that are always routed to a cheap reader, whatever the configured reader is.
+DEFAULT_ROUTES: Dict[str, str] = {"text": "custom", "html": "markitdown"}
+
+_ZIP_FORMATS: Dict[str, str] = {
+    ".docx": "docx",
+    ".pptx": "pptx",
+    ".xlsx": "xlsx",
+    ".epub": "epub",
+}
+_OLE_FORMATS: Dict[str, str] = {".xls": "xls", ".msg": "msg"}
+_IMAGE_SIGNATURES: Tuple[bytes, ...] = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",
+    b"GIF87a",
+    b"GIF89a",
+    b"II*\x00",
+    b"MM\x00*",
+)
+_EXECUTABLE_SIGNATURES: Tuple[bytes, ...] = (
+    b"MZ",
+    b"\x7fELF",
+    b"\xca\xfe\xba\xbe",
+    b"\xcf\xfa\xed\xfe",
+    b"\xce\xfa\xed\xfe",
+)
+_EXECUTABLE_EXTENSIONS = frozenset(
+    {".exe", ".dll", ".so", ".dylib", ".bin", ".msi", ".com", ".sys", ".o", ".class"}
+)
+_HTML_EXTENSIONS = frozenset({".html", ".htm", ".xhtml"})
+
+
+class UnsupportedFormatError(ValueError):
+    """
+    Raised when no reader can convert a file.
+    """
+
+
+def detect_format(sample: bytes, file_name: str) -> str:
+    """
+    Identifies the format of a document from its first bytes and its file name.
+
+    Magic bytes take precedence; the extension is only used to tell apart containers that
+    share a signature (e.g. DOCX and XLSX are both ZIP archives) and to reject executables.
+
+    Args:
+        sample (bytes): The first bytes of the file (see `SAMPLE_SIZE`).
+        file_name (str): The file name, used for its extension.
+
+    Returns:
+        str: One of "pdf", "docx", "pptx", "xlsx", "xls", "msg", "epub", "zip", "image",
+            "html", "text", "executable" or "binary".
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension in _EXECUTABLE_EXTENSIONS or sample.startswith(_EXECUTABLE_SIGNATURES):
+        return "executable"
+    if sample.startswith(b"%PDF"):
+        return "pdf"
+    if sample.startswith(b"PK\x03\x04"):
+        return _ZIP_FORMATS.get(extension, "zip")
+    if sample.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return _OLE_FORMATS.get(extension, "binary")
+    if sample.startswith(_IMAGE_SIGNATURES):
+        return "image"
+    if _is_text(sample):
+        head = sample.lstrip()[:15].lower()
+        if extension in _HTML_EXTENSIONS or head.startswith(
+            (b"<!doctype html", b"<html")
+        ):
+            return "html"
+        return "text"
+    return "binary"
+
+
+def sniff_stream(stream: BinaryIO, file_name: str) -> str:
+    """
+    Detects the format of a seekable binary stream and rewinds it.
+    """
+    sample = stream.read(SAMPLE_SIZE)
+    stream.seek(0)
+    return detect_format(sample, file_name)
+
+
+def sniff_file(file_path: str) -> str:
+    """
+    Detects the format of a file on disk.
+    """
+    with open(file_path, "rb") as f:
+        return detect_format(f.read(SAMPLE_SIZE), os.path.basename(file_path))
+
+
+def _is_text(sample: bytes) -> bool:
+    """
+    Tells whether a sample looks like text: UTF-8/UTF-16 with a BOM, valid UTF-8, or a
+    single-byte encoding with hardly any control characters.
+    """
+    if sample.startswith((b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")):
+        return True
+    if b"\x00" in sample:
+        return False
+    try:
+        sample.decode("utf-8")
+        return True
+    except UnicodeDecodeError as e:
+        # The sample may end in the middle of a multi-byte character.
+        if e.reason == "unexpected end of data":
+            return True
+    control = sum(1 for byte in sample if byte < 32 and byte not in b"\t\n\r\f\b")
+    return control <= len(sample) // 100
+
+
+def resolve_reader(
+    file_format: str, method: str, routes: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Chooses the reader for a format.
+
+    The format's route (`DEFAULT_ROUTES` updated with `routes`) wins; then the configured
+    `method` if it can convert the format; then the cheapest capable reader.
+
+    Args:
+        file_format (str): Format returned by `detect_format`.
+        method (str): The configured reader method.
+        routes (Optional[Dict[str, str]]): Per-format reader overrides.
+
+    Returns:
+        str: The reader method to use.
+
+    Raises:
+        UnsupportedFormatError: If no reader can convert the format.
+    """
+    route = {**DEFAULT_ROUTES, **(routes or {})}.get(file_format)
+    if route:
+        return route
+    if file_format in READER_FORMATS.get(method, ()):
+        return method
+    for candidate in READER_COST_ORDER:
+        if file_format in READER_FORMATS[candidate]:
+            return candidate
+    raise UnsupportedFormatError(f"File format '{file_format}' is not supported")
@@ -1,17 +1,40 @@
+import hashlib
+import json
 import logging
 import os
+import shutil
 import tempfile
+import time
 from datetime import datetime
-from typing import Dict, Optional
-
-from fastapi import UploadFile
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from src.domain.reader.readers.docling_reader import DoclingReader
-from src.domain.reader.readers.markitdown_reader import MarkItDownReader
-from src.domain.reader.readers.pdfplumber_reader import PDFPlumberReader
-from src.domain.reader.readers.textract_reader import TextractReader
+from src.domain.reader.base_reader import BaseReader
+from src.domain.reader.document import Document
+from src.domain.reader.format_detector import (
+    READER_FORMATS,
+    resolve_reader,
+    sniff_stream,
+)
+from src.domain.reader.reader_pool import reader_pool
+from src.infrastructure.helpers.cache import TextCache, get_shared_cache
+from src.infrastructure.helpers.sample_pdf import write_sample_pdf
+from src.infrastructure.helpers.spooled_text import SpooledText
+from src.infrastructure.model.caption_cache import CachedCaptionClient
 from src.infrastructure.model.llm_client import LLMClient
 
+if TYPE_CHECKING:
+    from fastapi import UploadFile
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(message)s",
@@ -23,6 +46,40 @@ class ReadManager:
     """
     ReadManager is responsible for reading input documents and converting them to Markdown text.
     It selects the appropriate reader based on configuration.
+
+    Each file is routed by its format, sniffed from its magic bytes and extension (see
+    `format_detector`): plain text goes to the passthrough CustomReader and HTML to MarkItDown,
+    other formats to the configured reader if it can convert them or else to the cheapest
+    capable one.
+    Routes can be overridden per format with `reader.formats`. Executables and other
+    unsupported files are rejected with `UnsupportedFormatError` before any reader is built.
+
+    Reader modules, and the libraries behind them, are only imported when a reader is first
+    built. Readers are taken from the process-wide `reader_pool`, so every ReadManager sharing the
+    same reader method, OCR method, model and reader options reuses a single reader instance.
+
+    If `reader.cache.enabled` is set, conversions are cached by a hash of the file content,
+    the reader method, the OCR method and model, and the reader options. The cache is shared
+    by every ReadManager with the same cache settings (see `get_shared_cache`), but never
+    with the caption cache.
+
+    If `ocr.cache.enabled` is set, the LLM client handed to the readers is wrapped in a
+    `CachedCaptionClient`, so each distinct image is only described once. With
+    `ocr.concurrency` greater than 1, MarkItDown captions the images of a document
+    concurrently through the async client of the same service.
+
+    `read_document` returns a structured `Document` (typed blocks with their page, heading
+    level and offsets) instead of flat Markdown.
+
+    `read_file_spooled` collects the output in a `SpooledText`, which spills to disk past
+    `reader.spill.max_memory_mb`, so very large conversions do not have to fit in memory.
+
+    `read_files` converts several files at once through each reader's `convert_batch`, so
+    Docling runs its batched `convert_all` pipeline instead of one conversion per file.
+
+    Uploads are converted straight from the upload stream when the reader supports it.
+    Otherwise they are copied to a staging directory (`file_io.staging_dir`, e.g. a tmpfs
+    such as /dev/shm) in blocks of `file_io.upload_buffer_size` bytes.
     """
 
     def __init__(
@@ -32,57 +89,281 @@ class ReadManager:
             input_path = input_path or "data/input"
             config = {"file_io": {"input_path": input_path}}
         self.config: Dict = config
-        self.input_path: str = self.config.get("file_io", {}).get(
-            "input_path", "data/input"
+        file_io_config = self.config.get("file_io", {})
+        self.input_path: str = file_io_config.get("input_path", "data/input")
+        self.staging_dir: Optional[str] = file_io_config.get("staging_dir")
+        self.upload_buffer_size: int = file_io_config.get(
+            "upload_buffer_size", 1024 * 1024
+        )
+        reader_config = self.config.get("reader", {})
+        self.reader_method: str = reader_config.get("method", "markitdown")
+        self.reader_methods: Dict = reader_config.get("methods", {})
+        self.reader_params: Dict = self.reader_methods.get(self.reader_method, {})
+        self.format_routes: Dict[str, str] = reader_config.get("formats", {})
+        spill_config = reader_config.get("spill", {})
+        self.spill_max_memory: int = int(
+            spill_config.get("max_memory_mb", 64) * 1024 * 1024
+        )
+        self.spill_dir: Optional[str] = spill_config.get("dir")
+        cache_config = dict(reader_config.get("cache", {}))
+        cache_enabled = cache_config.pop("enabled", False)
+        self.cache: Optional[TextCache] = (
+            get_shared_cache("reader", **cache_config) if cache_enabled else None
         )
-        self.reader_method: str = self.config.get("reader", {}).get(
-            "method", "markitdown"
+        ocr_config = self.config.get("ocr", {})
+        self.llm: LLMClient = LLMClient(ocr_config.get("method", "none"))
+        self.ocr_options: Dict = {k: v for k, v in ocr_config.items() if k != "method"}
+        self.caption_concurrency: int = ocr_config.get("concurrency", 1)
+        caption_cache_config = dict(ocr_config.get("cache", {}))
+        caption_cache_enabled = caption_cache_config.pop("enabled", False)
+        self.caption_cache: Optional[TextCache] = (
+            get_shared_cache("captions", **caption_cache_config)
+            if caption_cache_enabled
+            else None
         )
-        ocr_method = self.config.get("ocr", {}).get("method", "none")
-        self.llm: LLMClient = LLMClient(ocr_method)
 
         # Trace configuration
         now = datetime.now().strftime("%Y-%m-%d - %H:%M:%S")
         logging.info(f"{now} | ReadManager initialized | Config: {self.config}")
 
-    def read_file(self, file_path: str) -> str:
+    def read_file(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> str:
         """
         Reads a file from the specified path, converts it using the configured reader,
         and returns the resulting Markdown text.
+
+        With `pages` (1-based page numbers) or `max_pages`, only the selected pages are
+        returned. PDFPlumber, Textract and Docling skip the other pages while converting;
+        other readers convert the whole document and keep the selected pages afterwards
+        (see `BaseReader.convert_pages`).
         """
-        if not os.path.isabs(file_path):
-            file_path = os.path.join(self.input_path, file_path)
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = self._resolve_path(file_path)
         if os.path.getsize(file_path) == 0:
             raise ValueError("File is empty")
 
-        reader = self._get_reader()
-        try:
-            result = reader.convert(file_path)
-            now = datetime.now().strftime("%Y-%m-%d - %H:%M:%S")
-            logging.info(
-                f"{now} | read_file finished | File: {file_path} | Reader: {reader.__class__.__name__}"  # noqa: E501
+        pages = list(pages) if pages is not None else None
+        if pages and min(pages) < 1:
+            raise ValueError("Page numbers start at 1")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be greater than 0")
+        file_name = os.path.basename(file_path)
+        with open(file_path, "rb") as f:
+            method = self._route(f, file_name)
+            reader = self._get_reader(method)
+            cache_key = (
+                self._cache_key(f, file_name, method, pages, max_pages)
+                if self.cache
+                else None
             )
-            return result
+        if pages is None and max_pages is None:
+            return self._convert(
+                reader, file_path, cache_key, lambda: reader.convert(file_path)
+            )
+        return self._convert(
+            reader,
+            file_path,
+            cache_key,
+            lambda: reader.convert_pages(file_path, pages, max_pages),
+        )
+
+    def read_file_spooled(self, file_path: str) -> SpooledText:
+        """
+        Reads a file like `read_file`, but collects the output in a `SpooledText` that spills
+        to a temporary file (`reader.spill.dir`) once it grows past
+        `reader.spill.max_memory_mb`. Readers that convert incrementally (see
+        `BaseReader.iter_convert`) then never hold the whole output in memory.
+
+        Outputs that stay in memory are cached like `read_file` does; spilled ones are not.
+        The caller should close the returned buffer, which deletes its temporary file.
+        """
+        file_path = self._resolve_path(file_path)
+
+        file_name = os.path.basename(file_path)
+        with open(file_path, "rb") as f:
+            method = self._route(f, file_name)
+            reader = self._get_reader(method)
+            cache_key = self._cache_key(f, file_name, method) if self.cache else None
+        name = reader.__class__.__name__
+        spooled = SpooledText(self.spill_max_memory, self.spill_dir)
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logging.info(f"read_file cache hit | File: {file_path} | Reader: {name}")
+            spooled.write(cached)
+            return spooled
+        try:
+            for piece in reader.iter_convert(file_path):
+                spooled.write(piece)
         except Exception as e:
-            logging.error(
-                f"Error converting file {file_path} using {reader.__class__.__name__}: {e}"
+            spooled.close()
+            logging.error(f"Error converting file {file_path} using {name}: {e}")
+            raise RuntimeError("Failed to convert file")
+        logging.info(
+            f"read_file finished | File: {file_path} | Reader: {name} | Spilled: {spooled.rolled}"  # noqa: E501
+        )
+        if cache_key is not None and not spooled.rolled:
+            self.cache.put(cache_key, spooled.read())
+        return spooled
+
+    def iter_files_spooled(
+        self, file_paths: List[str]
+    ) -> Iterator[Tuple[str, SpooledText]]:
+        """
+        Reads several files, yielding the output of each one in a `SpooledText` as soon as
+        it is converted, so that large outputs spill to disk instead of piling up in memory.
+
+        Files of readers that convert batches natively (see `BaseReader.converts_batches`)
+        are converted together after the others, each output being yielded as soon as the
+        reader produces it; the rest are read one at a time with `read_file_spooled`. Files
+        that cannot be read or converted are logged and skipped. The caller should close
+        each buffer once it is consumed.
+
+        Args:
+            file_paths (List[str]): File paths, absolute or relative to the input path.
+
+        Yields:
+            Tuple[str, SpooledText]: Each given path with the Markdown text of the file.
+        """
+        batched: List[str] = []
+        for file_path in file_paths:
+            path = file_path
+            if not os.path.isabs(path):
+                path = os.path.join(self.input_path, path)
+            try:
+                with open(path, "rb") as f:
+                    method = self._route(f, os.path.basename(path))
+                if self._get_reader(method).converts_batches:
+                    batched.append(file_path)
+                    continue
+                spooled = self.read_file_spooled(file_path)
+            except Exception as e:
+                logging.error(f"Error reading file {path}: {e}")
+                continue
+            yield file_path, spooled
+        for file_path, text in self._iter_batches(batched):
+            spooled = SpooledText(self.spill_max_memory, self.spill_dir)
+            spooled.write(text)
+            yield file_path, spooled
+
+    def read_document(self, file_path: str) -> Document:
+        """
+        Reads a file like `read_file`, but returns a structured `Document` whose blocks carry
+        their type, page, heading level and offsets (see `BaseReader.convert_document`).
+        Documents are cached with their blocks.
+        """
+        file_path = self._resolve_path(file_path)
+
+        file_name = os.path.basename(file_path)
+        with open(file_path, "rb") as f:
+            method = self._route(f, file_name)
+            reader = self._get_reader(method)
+            cache_key = (
+                self._cache_key(f, file_name, method, structured=True)
+                if self.cache
+                else None
             )
+        name = reader.__class__.__name__
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logging.info(
+                    f"read_document cache hit | File: {file_path} | Reader: {name}"
+                )
+                return Document.loads(cached)
+        try:
+            document = reader.convert_document(file_path)
+        except Exception as e:
+            logging.error(f"Error converting file {file_path} using {name}: {e}")
             raise RuntimeError("Failed to convert file")
+        logging.info(f"read_document finished | File: {file_path} | Reader: {name}")
+        if cache_key is not None:
+            self.cache.put(cache_key, document.dumps())
+        return document
+
+    def read_files(self, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Reads several files, converting them in batches: files are routed and looked up in
+        the cache one by one, then the remaining ones are handed to each reader's
+        `convert_batch` grouped by reader method.
+
+        Files that cannot be read or converted are logged and left out of the result.
 
-    def read_file_object(self, file: UploadFile) -> str:
+        Args:
+            file_paths (List[str]): File paths, absolute or relative to the input path.
+
+        Returns:
+            Dict[str, str]: The Markdown text of each converted file, keyed by the given
+                path, in input order.
+        """
+        texts = dict(self._iter_batches(file_paths))
+        return {path: texts[path] for path in file_paths if path in texts}
+
+    def _iter_batches(self, file_paths: List[str]) -> Iterator[Tuple[str, str]]:
         """
-        Reads an uploaded file object, temporarily saves it to disk,
-        converts it using the configured reader, and returns the Markdown text.
+        Yields the text of each file as soon as it is available: cache hits while the files
+        are routed, then each `convert_batch` result as the reader produces it.
         """
-        tmp_path = ""
+        batches: Dict[str, List[Tuple[str, str, Optional[str]]]] = {}
+        for file_path in file_paths:
+            path = file_path
+            if not os.path.isabs(path):
+                path = os.path.join(self.input_path, path)
+            file_name = os.path.basename(path)
+            try:
+                with open(path, "rb") as f:
+                    method = self._route(f, file_name)
+                    cache_key = (
+                        self._cache_key(f, file_name, method) if self.cache else None
+                    )
+            except (OSError, ValueError) as e:
+                logging.error(f"Error reading file {path}: {e}")
+                continue
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                logging.info(f"read_files cache hit | File: {path}")
+                yield file_path, cached
+                continue
+            batches.setdefault(method, []).append((file_path, path, cache_key))
+
+        for method, batch in batches.items():
+            reader = self._get_reader(method)
+            name = reader.__class__.__name__
+            paths = [path for _, path, _ in batch]
+            for (file_path, path, cache_key), (_, result) in zip(
+                batch, reader.convert_batch(paths)
+            ):
+                if isinstance(result, Exception):
+                    logging.error(
+                        f"Error converting file {path} using {name}: {result}"
+                    )
+                    continue
+                logging.info(f"read_files finished | File: {path} | Reader: {name}")
+                if cache_key is not None and isinstance(result, str):
+                    self.cache.put(cache_key, result)
+                yield file_path, result
+
+    def read_file_object(self, file: "UploadFile") -> str:
+        """
+        Reads an uploaded file object, converts it using the configured reader, and returns
+        the Markdown text.
+
+        If the reader supports stream conversion, the upload is converted directly.
+        Otherwise it is streamed to a temporary file that keeps the original file name, so
+        readers that embed the document name in their output see the uploaded name.
+        """
+        method = self._route(file.file, file.filename)
+        reader = self._get_reader(method)
+        if reader.supports_stream:
+            return self._read_stream(file.file, file.filename, reader, method)
+
+        tmp_dir = tempfile.mkdtemp(dir=self.staging_dir)
+        tmp_path = os.path.join(tmp_dir, os.path.basename(file.filename))
         try:
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix="." + file.filename.split(".")[-1]
-            ) as tmp:
-                tmp.write(file.file.read())
-                tmp_path = tmp.name
+            with open(tmp_path, "wb") as tmp:
+                shutil.copyfileobj(file.file, tmp, self.upload_buffer_size)
             result = self.read_file(tmp_path)
             now = datetime.now().strftime("%Y-%m-%d - %H:%M:%S")
             logging.info(
@@ -90,23 +371,217 @@ class ReadManager:
             )
             return result
         finally:
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def warm_up(self, methods: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Builds the pooled readers and converts a tiny sample document with each of them, so
+        that imports and model loading happen now instead of during the first request.
+
+        The Textract reader is only built: a conversion would call the (paid) AWS API.
+        Warmed readers are pinned in the reader pool, so they are not evicted when idle.
+
+        Args:
+            methods (Optional[List[str]]): Reader methods to warm up. Defaults to the
+                configured one.
+
+        Returns:
+            Dict[str, float]: Seconds spent warming up each reader.
+        """
+        durations: Dict[str, float] = {}
+        with tempfile.TemporaryDirectory(dir=self.staging_dir) as tmp_dir:
+            text_path = os.path.join(tmp_dir, "warm_up.md")
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write("# Warm-up\n\nSample document.\n")
+            pdf_path = write_sample_pdf(os.path.join(tmp_dir, "warm_up.pdf"))
+
+            for method in methods or [self.reader_method]:
+                start = time.perf_counter()
+                reader = self._get_reader(method, pin=True)
+                if method != "textract":
+                    formats = READER_FORMATS.get(method, ())
+                    reader.convert(pdf_path if "pdf" in formats else text_path)
+                durations[method] = time.perf_counter() - start
+                logging.info(
+                    f"Reader warmed up | Method: {method} | Time: {durations[method]:.2f}s"
+                )
+        return durations
+
+    def _resolve_path(self, file_path: str) -> str:
+        """
+        Resolves a path relative to the input path and checks that the file exists.
+        """
+        if not os.path.isabs(file_path):
+            file_path = os.path.join(self.input_path, file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return file_path
+
+    def _route(self, stream: BinaryIO, file_name: str) -> str:
+        """
+        Sniffs the format of a seekable stream and returns the reader method for it.
+
+        Raises:
+            ValueError: If the stream is empty.
+            UnsupportedFormatError: If no reader can convert the format.
+        """
+        stream.seek(0, os.SEEK_END)
+        if stream.tell() == 0:
+            raise ValueError("File is empty")
+        stream.seek(0)
+        file_format = sniff_stream(stream, file_name)
+        method = resolve_reader(file_format, self.reader_method, self.format_routes)
+        if method != self.reader_method:
+            logging.info(
+                f"Routing {file_name} ({file_format}) to {method} instead of {self.reader_method}"  # noqa: E501
+            )
+        return method
 
-    def _get_reader(self):
+    def _read_stream(
+        self, stream: BinaryIO, file_name: str, reader: BaseReader, method: str
+    ) -> str:
         """
-        Instantiates and returns the appropriate reader based on the configuration.
+        Converts a seekable binary stream without staging it on disk.
         """
+        cache_key = self._cache_key(stream, file_name, method) if self.cache else None
+        return self._convert(
+            reader,
+            file_name,
+            cache_key,
+            lambda: reader.convert_stream(stream, file_name),
+        )
+
+    def _convert(
+        self,
+        reader: BaseReader,
+        source: str,
+        cache_key: Optional[str],
+        convert: Callable[[], str],
+    ) -> str:
+        """
+        Runs a conversion, serving it from (and storing it in) the cache when enabled.
+        """
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logging.info(
+                    f"read_file cache hit | File: {source} | Reader: {reader.__class__.__name__}"  # noqa: E501
+                )
+                return cached
+        try:
+            result = convert()
+            now = datetime.now().strftime("%Y-%m-%d - %H:%M:%S")
+            logging.info(
+                f"{now} | read_file finished | File: {source} | Reader: {reader.__class__.__name__}"  # noqa: E501
+            )
+            if cache_key is not None and isinstance(result, str):
+                self.cache.put(cache_key, result)
+            return result
+        except Exception as e:
+            logging.error(
+                f"Error converting file {source} using {reader.__class__.__name__}: {e}"
+            )
+            raise RuntimeError("Failed to convert file")
+
+    def _cache_key(
+        self,
+        stream: BinaryIO,
+        file_name: str,
+        method: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+        structured: bool = False,
+    ) -> str:
+        """
+        Builds the conversion cache key: a SHA-256 of the content plus every setting that
+        changes the reader output, including the page selection and whether a `Document`
+        (rather than text) is cached. The stream is rewound afterwards.
+        """
+        reader = self._get_reader(method)
+        digest = hashlib.sha256()
+        for block in iter(lambda: stream.read(self.upload_buffer_size), b""):
+            digest.update(block)
+        stream.seek(0)
+        settings = [
+            method,
+            self.llm.method,
+            self._get_model(),
+            self.reader_methods.get(method, {}),
+        ]
+        if reader.embeds_file_name:
+            settings.append(file_name)
+        if pages is not None or max_pages is not None:
+            selection = sorted(set(pages)) if pages is not None else None
+            settings.append({"pages": selection, "max_pages": max_pages})
+        if structured:
+            settings.append("document")
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _get_model(self) -> Optional[str]:
+        return self.llm.get_model() if self.llm.method != "none" else None
+
+    def _get_reader(
+        self, method: Optional[str] = None, pin: bool = False
+    ) -> BaseReader:
+        """
+        Returns the pooled reader for a reader method (the configured one by default),
+        building it on first use. `pin` exempts it from idle eviction.
+        """
+        method = method or self.reader_method
+        key = (
+            method,
+            self.llm.method,
+            self._get_model(),
+            json.dumps(
+                self.reader_methods.get(method, {}), sort_keys=True, default=str
+            ),
+            json.dumps(self.ocr_options, sort_keys=True, default=str),
+        )
+        return reader_pool.get(key, lambda: self._build_reader(method), pin=pin)
+
+    def _build_reader(self, method: Optional[str] = None) -> BaseReader:
+        """
+        Instantiates and returns the reader for a reader method (the configured one by
+        default).
+        """
+        method = method or self.reader_method
         client = self.llm.get_client() if self.llm.method != "none" else None
-        model = self.llm.get_model() if self.llm.method != "none" else None
-
-        if self.reader_method == "markitdown":
-            return MarkItDownReader(client, model)
-        elif self.reader_method == "docling":
-            return DoclingReader()  # TODO: add support to client and model
-        elif self.reader_method == "pdfplumber":
-            return PDFPlumberReader()  # TODO: add support to client and model
-        elif self.reader_method == "textract":
-            return TextractReader(client, model)
+        if client is not None and self.caption_cache is not None:
+            client = CachedCaptionClient(client, self.caption_cache)
+        model = self._get_model()
+        params = self.reader_methods.get(method, {})
+
+        if method == "markitdown":
+            from src.domain.reader.readers.markitdown_reader import MarkItDownReader
+
+            async_client = (
+                self.llm.get_async_client() if self.caption_concurrency > 1 else None
+            )
+            return MarkItDownReader(
+                client,
+                model,
+                async_llm_client=async_client,
+                caption_concurrency=self.caption_concurrency,
+                caption_cache=self.caption_cache,
+                **params,
+            )
+        elif method == "docling":
+            from src.domain.reader.readers.docling_reader import DoclingReader
+
+            return DoclingReader(**params)  # TODO: add support to client and model
+        elif method == "pdfplumber":
+            from src.domain.reader.readers.pdfplumber_reader import PDFPlumberReader
+
+            return PDFPlumberReader(**params)  # TODO: add support to client and model
+        elif method == "textract":
+            from src.domain.reader.readers.textract_reader import TextractReader
+
+            # Textract is the OCR engine itself: it builds its own client (see backend).
+            return TextractReader(**params)
+        elif method == "custom":
+            from src.domain.reader.readers.custom_reader import CustomReader
+
+            return CustomReader(**params)
         else:
-            raise ValueError(f"Unsupported reader method: {self.reader_method}")
+            raise ValueError(f"Unsupported reader method: {method}")
@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from src.domain.reader.base_reader import BaseReader
+
+
+class ReaderPool:
+    """
+    Process-wide registry of reader instances.
+
+    Building a reader can be expensive (e.g., Docling loads its layout and table models when a
+    `DocumentConverter` is created), so the pool builds each reader once per key and hands the
+    same instance to every caller. Each reader is built under a lock of its own key, so callers
+    of other keys are not blocked while it is built. Readers that have not been requested for
+    `idle_ttl` seconds are evicted on the next access to the pool, and closed (see
+    `BaseReader.close`) outside the pool lock. Pinned readers (e.g. the ones warmed up at
+    startup) are never evicted.
+
+    Attributes:
+        idle_ttl (Optional[float]): Seconds a reader may stay unused before being evicted.
+            If None, readers are never evicted.
+    """
+
+    def __init__(self, idle_ttl: Optional[float] = 900.0) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            idle_ttl (Optional[float]): Seconds a reader may stay unused before being evicted.
+                Defaults to 15 minutes. Use None to disable eviction.
+        """
+        self.idle_ttl = idle_ttl
+        self._readers: Dict[Hashable, Tuple[BaseReader, float]] = {}
+        self._lock = threading.Lock()
+        self._building: Dict[Hashable, threading.Lock] = {}
+        self._pinned: Set[Hashable] = set()
+
+    def get(
+        self, key: Hashable, factory: Callable[[], BaseReader], pin: bool = False
+    ) -> BaseReader:
+        """
+        Return the reader registered under `key`, building it with `factory` if needed.
+
+        Args:
+            key (Hashable): Identifier of the reader configuration, e.g.
+                `(reader_method, ocr_method, model, options)`.
+            factory (Callable[[], BaseReader]): Callable that builds the reader on a miss.
+            pin (bool): Whether to exempt the reader from idle eviction from now on.
+
+        Returns:
+            BaseReader: The pooled reader instance.
+        """
+        with self._lock:
+            if pin:
+                self._pinned.add(key)
+            now = time.monotonic()
+            evicted = self._evict_idle(now)
+            entry = self._readers.get(key)
+            if entry is None:
+                build_lock = self._building.setdefault(key, threading.Lock())
+            else:
+                self._readers[key] = (entry[0], now)
+        _close(evicted)
+        if entry is not None:
+            return entry[0]
+
+        with build_lock:
+            with self._lock:
+                entry = self._readers.get(key)
+                if entry is not None:
+                    self._readers[key] = (entry[0], time.monotonic())
+                    return entry[0]
+            try:
+                reader = factory()
+            except Exception:
+                with self._lock:
+                    self._building.pop(key, None)
+                raise
+            with self._lock:
+                self._readers[key] = (reader, time.monotonic())
+                self._building.pop(key, None)
+        logging.info(f"ReaderPool | Built {reader.__class__.__name__} | Key: {key}")
+        return reader
+
+    def evict_idle(self) -> int:
+        """
+        Evict every unpinned reader that has been idle for longer than `idle_ttl`.
+
+        Returns:
+            int: Number of evicted readers.
+        """
+        with self._lock:
+            evicted = self._evict_idle(time.monotonic())
+        _close(evicted)
+        return len(evicted)
+
+    def clear(self) -> None:
+        """
+        Remove and close every reader in the pool.
+        """
+        with self._lock:
+            readers = [reader for reader, _ in self._readers.values()]
+            self._readers.clear()
+            self._pinned.clear()
+        _close(readers)
+
+    def __len__(self) -> int:
+        return len(self._readers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._readers
+
+    def _evict_idle(self, now: float) -> List[BaseReader]:
+        """
+        Remove the expired readers (the pool lock must be held) and return them, to be
+        closed once the lock is released.
+        """
+        if self.idle_ttl is None:
+            return []
+        expired = [
+            key
+            for key, (_, last_used) in self._readers.items()
+            if now - last_used > self.idle_ttl and key not in self._pinned
+        ]
+        evicted = []
+        for key in expired:
+            evicted.append(self._readers.pop(key)[0])
+            logging.info(f"ReaderPool | Evicted idle reader | Key: {key}")
+        return evicted
+
+
+def _close(readers: List[BaseReader]) -> None:
+    for reader in readers:
+        try:
+            reader.close()
+        except Exception as e:
+            logging.warning(
+                f"ReaderPool | Failed to close {reader.__class__.__name__}: {e}"
+            )
+
+
+# Shared by every ReadManager in the process (CLI runs and API requests alike).
+reader_pool = ReaderPool()
@@ -0,0 +1,236 @@
+import codecs
+import mmap
+import re
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from src.domain.reader.base_reader import BaseReader
+
+_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+(?=\r?\n|$)")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+class CustomReader(BaseReader):
+    """
+    Passthrough reader for plain-text formats (.txt, .md, .csv, .json...).
+
+    The file is memory-mapped and decoded straight from the mapping, so the only copy made
+    is the resulting string; `iter_text` decodes it incrementally in `block_size` blocks for
+    callers that do not need the whole text at once. The encoding is taken from the byte
+    order mark if there is one; otherwise the first `sample_size` bytes are checked for
+    UTF-8, falling back to `fallback_encoding`. If a detected encoding turns out wrong past
+    the sample, the text is decoded with it up to the first invalid byte and with
+    `fallback_encoding` from there on, both by `convert` and by `iter_text`.
+
+    Unlike MarkItDown, the text is returned as is: CSV files are not turned into Markdown
+    tables and trailing whitespace is kept unless `normalize_whitespace` is set.
+
+    Attributes:
+        encoding (Optional[str]): Forced encoding. If None, it is detected.
+        fallback_encoding (str): Encoding used when the sample is not valid UTF-8.
+        sample_size (int): Number of bytes inspected to detect the encoding.
+        block_size (int): Number of bytes decoded per step by `iter_text`.
+        normalize_whitespace (bool): Strip trailing whitespace from lines and collapse runs
+            of blank lines, as MarkItDown does.
+    """
+
+    supports_stream = True
+
+    def __init__(
+        self,
+        encoding: Optional[str] = None,
+        fallback_encoding: str = "cp1252",
+        sample_size: int = 64 * 1024,
+        block_size: int = 1024 * 1024,
+        normalize_whitespace: bool = False,
+    ) -> None:
+        """
+        Initialize the CustomReader.
+
+        Args:
+            encoding (Optional[str]): Forced encoding. If None, it is detected.
+            fallback_encoding (str): Encoding used when the sample is not valid UTF-8.
+            sample_size (int): Number of bytes inspected to detect the encoding.
+            block_size (int): Number of bytes decoded per step by `iter_text`.
+            normalize_whitespace (bool): Strip trailing whitespace and collapse blank lines.
+
+        Raises:
+            ValueError: If `sample_size` or `block_size` is lower than 1.
+        """
+        if sample_size < 1 or block_size < 1:
+            raise ValueError("sample_size and block_size must be greater than 0")
+        self.encoding = encoding
+        self.fallback_encoding = fallback_encoding
+        self.sample_size = sample_size
+        self.block_size = block_size
+        self.normalize_whitespace = normalize_whitespace
+
+    def convert(self, file_path: str) -> str:
+        """
+        Reads a text file.
+
+        Args:
+            file_path (str): The path to the text file.
+
+        Returns:
+            str: The decoded file content.
+        """
+        with open(file_path, "rb") as f, _mapped(f) as data:
+            return self._decode(data)
+
+    def convert_stream(self, stream: BinaryIO, file_name: str) -> str:
+        """
+        Reads a text document from a binary stream.
+
+        Args:
+            stream (BinaryIO): Seekable binary stream with the document content.
+            file_name (str): Original name of the document (unused).
+
+        Returns:
+            str: The decoded content.
+        """
+        return self._decode(stream.read())
+
+    def iter_convert(self, file_path: str) -> Iterator[str]:
+        """
+        Yields the decoded file block by block (see `iter_text`). Whitespace is only
+        normalized by `convert`, which sees the whole text.
+        """
+        if self.normalize_whitespace:
+            return iter([self.convert(file_path)])
+        return self.iter_text(file_path)
+
+    def iter_text(self, file_path: str) -> Iterator[str]:
+        """
+        Yields the decoded content of a text file block by block.
+
+        Args:
+            file_path (str): The path to the text file.
+
+        Yields:
+            str: Consecutive pieces of the decoded text.
+        """
+        with open(file_path, "rb") as f, _mapped(f) as data:
+            encoding = self.detect_encoding(data)
+            view = memoryview(data)
+            try:
+                yield from self._iter_decoded(view, encoding)
+            finally:
+                view.release()
+
+    def detect_encoding(self, data) -> str:
+        """
+        Detects the encoding of a buffer from its byte order mark or its first bytes.
+
+        Args:
+            data: A bytes-like object (bytes, mmap, memoryview...).
+
+        Returns:
+            str: A codec name.
+        """
+        if self.encoding:
+            return self.encoding
+        head = bytes(data[:4])
+        for bom, encoding in _BOMS:
+            if head.startswith(bom):
+                return encoding
+        sample = bytes(data[: self.sample_size])
+        try:
+            sample.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # A sample cut in the middle of a multi-byte character is still UTF-8.
+            cut = e.reason == "unexpected end of data" and len(sample) < len(data)
+            if not cut:
+                return self.fallback_encoding
+        return "utf-8"
+
+    def _iter_decoded(self, view: memoryview, encoding: str) -> Iterator[str]:
+        """
+        Decodes a buffer block by block, falling back like `_decode` at the first byte that
+        is not valid in the detected encoding.
+        """
+        encoding, start = _skip_utf8_bom(encoding)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        while True:
+            block = view[start : start + self.block_size]
+            final = start + len(block) >= len(view)
+            try:
+                text = decoder.decode(block, final=final)
+            except UnicodeDecodeError as e:
+                if self.encoding:
+                    raise
+                # The decoder keeps the bytes of an unfinished character from the previous
+                # block, which come first in `e.object`.
+                error = start - (len(e.object) - len(block)) + e.start
+                text = decoder.decode(block[: max(0, error - start)])
+                if text:
+                    yield text
+                fallback = codecs.getincrementaldecoder(self.fallback_encoding)(
+                    "replace"
+                )
+                for position in range(error, len(view), self.block_size):
+                    text = fallback.decode(view[position : position + self.block_size])
+                    if text:
+                        yield text
+                text = fallback.decode(b"", final=True)
+                if text:
+                    yield text
+                return
+            if text:
+                yield text
+            if final:
+                return
+            start += len(block)
+
+    def _decode(self, data) -> str:
+        """
+        Decodes a whole buffer. If the detected encoding turns out wrong past the sample,
+        the bytes from the first invalid one on are decoded with the fallback encoding.
+        """
+        encoding = self.detect_encoding(data)
+        try:
+            text = str(data, encoding)
+        except UnicodeDecodeError as e:
+            if self.encoding:
+                raise
+            encoding, start = _skip_utf8_bom(encoding)
+            error = start + e.start
+            text = str(data[start:error], encoding) + str(
+                data[error:], self.fallback_encoding, errors="replace"
+            )
+        if self.normalize_whitespace:
+            text = _BLANK_LINES.sub("\n\n", _TRAILING_WHITESPACE.sub("", text))
+        return text
+
+
+def _skip_utf8_bom(encoding: str) -> Tuple[str, int]:
+    """
+    Returns the encoding and offset to decode from after a UTF-8 byte order mark, whose
+    length the "utf-8-sig" codec leaves out of error positions.
+    """
+    if encoding == "utf-8-sig":
+        return "utf-8", len(codecs.BOM_UTF8)
+    return encoding, 0
+
+
+@contextmanager
+def _mapped(file: BinaryIO) -> Iterator:
+    """
+    Memory-maps a file read-only for the duration of the context; empty files map to b"".
+    """
+    try:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # Empty files cannot be mapped.
+        yield b""
+        return
+    try:
+        yield data
+    finally:
+        data.close()
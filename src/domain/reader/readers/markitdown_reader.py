@@ -1,6 +1,16 @@
+import io
+import os
+from typing import BinaryIO, Callable, Optional
+
 from markitdown import MarkItDown
 
 from src.domain.reader.base_reader import BaseReader
+from src.infrastructure.helpers.cache import TextCache
+from src.infrastructure.model.async_captioner import (
+    AsyncCaptioner,
+    RecordingCaptionClient,
+    splice_captions,
+)
 
 
 class MarkItDownReader(BaseReader):
@@ -11,14 +21,30 @@ class MarkItDownReader(BaseReader):
     This class initializes a MarkItDown instance with optional LLM client and model parameters,
     and exposes a method to convert files to Markdown.
 
+    MarkItDown captions images one after another. When an async client is given and
+    `caption_concurrency` is greater than 1, the conversion runs with a recording client that
+    collects every image request of the document and leaves a placeholder; the images are
+    then captioned concurrently by an `AsyncCaptioner` and the captions are spliced back in
+    document order.
+
     Attributes:
         llm_client: Optional client for a large language model (LLM) used in conversion.
         llm_model: Optional identifier or instance of the LLM model.
         md (MarkItDown): Instance of the MarkItDown converter initialized with the provided
             LLM parameters.
+        captioner (Optional[AsyncCaptioner]): Concurrent captioning stage, if enabled.
     """
 
-    def __init__(self, llm_client=None, llm_model=None) -> MarkItDown:
+    supports_stream = True
+
+    def __init__(
+        self,
+        llm_client=None,
+        llm_model=None,
+        async_llm_client=None,
+        caption_concurrency: int = 1,
+        caption_cache: Optional[TextCache] = None,
+    ) -> MarkItDown:
         """
         Initialize the MarkItDownReader with optional LLM client and model.
 
@@ -27,10 +53,21 @@ class MarkItDownReader(BaseReader):
                 language model.
             llm_model: Optional; the language model or model identifier to be used
                 for conversion.
+            async_llm_client: Optional; an async client for the same service, used to
+                caption images concurrently. The reader's captioner takes ownership of it.
+            caption_concurrency: Maximum number of concurrent caption requests. 1 keeps
+                MarkItDown's sequential captioning.
+            caption_cache: Optional; store of image descriptions shared with the
+                concurrent captioning stage.
         """
         self.llm_client = llm_client
         self.llm_model = llm_model
         self.md = MarkItDown(llm_client=llm_client, llm_model=llm_model)
+        self.captioner: Optional[AsyncCaptioner] = None
+        if async_llm_client is not None and llm_model and caption_concurrency > 1:
+            self.captioner = AsyncCaptioner(
+                async_llm_client, caption_concurrency, caption_cache
+            )
 
     def convert(self, file_path: str) -> str:
         """
@@ -42,4 +79,72 @@ class MarkItDownReader(BaseReader):
         Returns:
             str: The Markdown text content resulting from the conversion.
         """
-        return self.md.convert(file_path).text_content
+        return self._convert(lambda **kwargs: self.md.convert(file_path, **kwargs))
+
+    def convert_stream(self, stream: BinaryIO, file_name: str) -> str:
+        """
+        Convert the content of a binary stream to Markdown text, without a temporary file.
+
+        Args:
+            stream (BinaryIO): Seekable binary stream with the document content.
+            file_name (str): Original name of the document, used to infer its format.
+
+        Returns:
+            str: The Markdown text content resulting from the conversion.
+        """
+        if not isinstance(stream, io.BufferedIOBase):
+            # MarkItDown (through magika) only accepts buffered binary streams, which
+            # excludes e.g. the SpooledTemporaryFile behind FastAPI's UploadFile.
+            stream = _BufferedStream(stream)
+        extension = os.path.splitext(file_name)[1]
+        return self._convert(
+            lambda **kwargs: self.md.convert_stream(
+                stream, file_extension=extension, **kwargs
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Stop the concurrent captioning stage, if enabled.
+        """
+        if self.captioner is not None:
+            self.captioner.close()
+
+    def _convert(self, convert: Callable[..., object]) -> str:
+        """
+        Runs a MarkItDown conversion, deferring image captions to the captioner if enabled.
+        """
+        if self.captioner is None:
+            return convert().text_content
+        recorder = RecordingCaptionClient(self.captioner.cache)
+        markdown = convert(llm_client=recorder).text_content
+        if not recorder.requests:
+            return markdown
+        return splice_captions(markdown, self.captioner.caption(recorder.requests))
+
+
+class _BufferedStream(io.BufferedIOBase):
+    """
+    Presents any seekable binary file-like object as a buffered binary stream.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._raw.read(size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self._raw.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
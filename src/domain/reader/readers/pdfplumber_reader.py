@@ -1,8 +1,15 @@
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pdfplumber
 
-from src.domain.reader.base_reader import BaseReader
+from src.domain.reader.base_reader import BaseReader, select_page_numbers
+from src.domain.reader.document import BlockType, Document, DocumentBuilder
+
+# The Markdown blocks of a page: block type and text.
+PageBlocks = List[Tuple[BlockType, str]]
 
 
 class PDFPlumberReader(BaseReader):
@@ -10,8 +17,58 @@ class PDFPlumberReader(BaseReader):
     Reader implementation using pdfplumber for PDF files.
     It extracts text lines and tables, then returns a Markdown
     representation of the PDF content.
+
+    Pages are processed one at a time: `iter_pages` and `iter_markdown` yield the Markdown of
+    each page as soon as it is rendered and release the page's parsed objects before moving
+    on, so callers can consume long documents incrementally.
+
+    Documents with at least `parallel_min_pages` pages are split into page ranges that are
+    rendered by `workers` processes; each worker opens the PDF on its own. Results are yielded
+    in page order, so the output is identical to the sequential path.
+
+    Table detection (`page.find_tables`) is the most expensive step per page. With the
+    `fast` profile it only runs on pages that contain ruling lines, rectangles or curves, from
+    which the default lines-based table strategy builds the edges of any table. The `accurate`
+    profile runs it on every page.
+
+    Attributes:
+        profile (str): Either "fast" or "accurate".
+        workers (int): Number of processes used to render pages. 1 disables parallelism.
+        parallel_min_pages (int): Minimum number of pages to use the parallel path.
     """
 
+    embeds_file_name = True
+    profiles = ("fast", "accurate")
+
+    def __init__(
+        self,
+        profile: str = "accurate",
+        workers: int = 1,
+        parallel_min_pages: int = 50,
+    ) -> None:
+        """
+        Initialize the PDFPlumberReader.
+
+        Args:
+            profile (str): "fast" skips table detection on pages without ruling lines,
+                rectangles or curves; "accurate" runs it on every page.
+            workers (int): Number of processes used to render pages. Must be greater than 0.
+            parallel_min_pages (int): Minimum number of pages to render them in parallel.
+
+        Raises:
+            ValueError: If the profile is unknown, or if `workers` or `parallel_min_pages`
+                is lower than 1.
+        """
+        if profile not in self.profiles:
+            raise ValueError(
+                f"Unsupported pdfplumber profile: {profile}. Use one of {self.profiles}"
+            )
+        if workers < 1 or parallel_min_pages < 1:
+            raise ValueError("workers and parallel_min_pages must be greater than 0")
+        self.profile = profile
+        self.workers = workers
+        self.parallel_min_pages = parallel_min_pages
+
     def convert(self, file_path: str) -> str:
         """
         Converts the provided PDF file to Markdown text by extracting
@@ -23,85 +80,274 @@ class PDFPlumberReader(BaseReader):
         Returns:
             str: A Markdown string representing the PDF content.
         """
-        markdown_content = ""
+        return "".join(self.iter_markdown(file_path))
+
+    def iter_convert(self, file_path: str) -> Iterator[str]:
+        """
+        Yields the Markdown of the document page by page (see `iter_markdown`).
+        """
+        return self.iter_markdown(file_path)
+
+    def convert_document(self, file_path: str) -> Document:
+        """
+        Converts the provided PDF file to a `Document` whose blocks carry their page: the
+        document and page headings, one paragraph per text line and one block per table.
+
+        Args:
+            file_path (str): The full path to the PDF file.
+
+        Returns:
+            Document: The document, whose text is the output of `convert`.
+        """
+        builder = DocumentBuilder()
         document_name = os.path.basename(file_path)
-        markdown_content += f"# Document: {document_name}\n\n"
+        builder.add(BlockType.HEADING, f"# Document: {document_name}", level=1)
+        for page_number, blocks in self.iter_page_blocks(file_path):
+            builder.add(
+                BlockType.HEADING, f"## Page {page_number}", page=page_number, level=2
+            )
+            for kind, text in blocks:
+                builder.add(kind, text, page=page_number)
+        return builder.build()
+
+    def convert_pages(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> str:
+        """
+        Converts only the selected pages of a PDF; the other pages are never parsed.
+
+        Args:
+            file_path (str): The full path to the PDF file.
+            pages (Optional[Iterable[int]]): 1-based page numbers to convert. None
+                converts all of them.
+            max_pages (Optional[int]): Convert at most this many of the selected pages.
+
+        Returns:
+            str: A Markdown string with the selected pages.
+        """
+        return "".join(self.iter_markdown(file_path, pages, max_pages))
+
+    def iter_markdown(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Yields the Markdown of the document piece by piece: first the document header, then
+        the content of each page.
+
+        Args:
+            file_path (str): The full path to the PDF file.
+            pages (Optional[Iterable[int]]): 1-based page numbers to render. None renders
+                all of them.
+            max_pages (Optional[int]): Render at most this many of the selected pages.
+
+        Yields:
+            str: Consecutive pieces of the Markdown document.
+        """
+        document_name = os.path.basename(file_path)
+        yield f"# Document: {document_name}\n\n"
+        for _, page_markdown in self.iter_pages(file_path, pages, max_pages):
+            yield page_markdown
+
+    def iter_pages(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yields the Markdown of each page, in page order.
+
+        Args:
+            file_path (str): The full path to the PDF file.
+            pages (Optional[Iterable[int]]): 1-based page numbers to render. None renders
+                all of them.
+            max_pages (Optional[int]): Render at most this many of the selected pages.
+
+        Yields:
+            Tuple[int, str]: The page number and the Markdown of that page.
+        """
+        for page_number, blocks in self.iter_page_blocks(file_path, pages, max_pages):
+            yield page_number, _render_page(page_number, blocks)
+
+    def iter_page_blocks(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Tuple[int, PageBlocks]]:
+        """
+        Yields the Markdown blocks (text lines and tables) of each page, in page order.
 
+        Each page is closed right after being rendered, which drops the characters, lines
+        and other objects pdfplumber cached while parsing it. Consumers may stop early:
+        pages are only parsed as they are yielded.
+
+        Args:
+            file_path (str): The full path to the PDF file.
+            pages (Optional[Iterable[int]]): 1-based page numbers to render. None renders
+                all of them.
+            max_pages (Optional[int]): Render at most this many of the selected pages.
+
+        Yields:
+            Tuple[int, PageBlocks]: The page number and the blocks of that page.
+        """
+        document_name = os.path.basename(file_path)
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                markdown_content += f"## Page {page.page_number}\n\n"
-                all_objects = []
+            page_numbers = select_page_numbers(len(pdf.pages), pages, max_pages)
+            if self.workers == 1 or len(page_numbers) < self.parallel_min_pages:
+                for page_number in page_numbers:
+                    page = pdf.pages[page_number - 1]
+                    try:
+                        yield page.page_number, self._page_blocks(page, document_name)
+                    finally:
+                        page.close()
+                return
+        yield from self._iter_pages_parallel(file_path, page_numbers)
 
-                # Extract text lines from the page.
-                text_lines = page.extract_text_lines(
-                    layout=True, strip=True, return_chars=False
+    def _iter_pages_parallel(
+        self, file_path: str, page_numbers: List[int]
+    ) -> Iterator[Tuple[int, PageBlocks]]:
+        """
+        Renders page ranges in worker processes and yields the pages in order.
+        """
+        # Several ranges per worker keep the processes busy when pages differ in cost.
+        range_size = max(1, math.ceil(len(page_numbers) / (self.workers * 4)))
+        page_ranges = [
+            page_numbers[start : start + range_size]
+            for start in range(0, len(page_numbers), range_size)
+        ]
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [
+                executor.submit(
+                    _render_page_range, file_path, page_range, self._worker_options()
                 )
-                for line in text_lines:
-                    line["object_type"] = "text_line"
-                    all_objects.append(line)
-
-                # Include graphic objects if needed.
-                for line in page.lines:
-                    line["object_type"] = "line"
-                    all_objects.append(line)
-                for rect in page.rects:
-                    rect["object_type"] = "rect"
-                    all_objects.append(rect)
-                for curve in page.curves:
-                    curve["object_type"] = "curve"
-                    all_objects.append(curve)
-
-                # Extract tables from the page.
-                tables = page.find_tables()
-                for idx, table in enumerate(tables):
-                    try:
-                        table_data = table.extract()
-                    except Exception as e:
-                        print(
-                            f"Error extracting table on page {page.page_number} of {document_name}: {e}"  # noqa: E501
-                        )
-                        table_data = None
-                    table_obj = {
-                        "object_type": "table",
-                        "bbox": table.bbox,
-                        "table_data": table_data,
-                        "table_index": idx,
-                    }
-                    all_objects.append(table_obj)
-
-                def get_vertical_position(obj):
-                    """
-                    Returns the vertical position for sorting objects.
-                    """
-                    if obj.get("object_type") == "table":
-                        return obj.get("bbox", [0, 0, 0, 0])[1]
-                    elif obj.get("object_type") == "text_line":
-                        return obj.get("top", 0)
-                    else:
-                        return obj.get("doctop", obj.get("y0", 0))
-
-                sorted_objects = sorted(all_objects, key=get_vertical_position)
-
-                # Build the markdown content for this page.
-                for obj in sorted_objects:
-                    obj_type = obj.get("object_type")
-                    if obj_type == "text_line":
-                        text = obj.get("text", "").strip()
-                        if text:
-                            markdown_content += f"{text}\n\n"
-                    elif obj_type == "table":
-                        table_data = obj.get("table_data")
-                        if table_data and len(table_data) > 0:
-                            header_row = [str(cell).strip() for cell in table_data[0]]
-                            markdown_content += "| " + " | ".join(header_row) + " |\n"
-                            markdown_content += (
-                                "| " + " | ".join(["---"] * len(header_row)) + " |\n"
-                            )
-                            for row in table_data[1:]:
-                                row_cells = [str(cell).strip() for cell in row]
-                                markdown_content += (
-                                    "| " + " | ".join(row_cells) + " |\n"
-                                )
-                            markdown_content += "\n"
-
-        return markdown_content
+                for page_range in page_ranges
+            ]
+            for future in futures:
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _worker_options(self) -> Dict:
+        """
+        Options used to build the reader inside each worker process.
+        """
+        return {"profile": self.profile}
+
+    def _needs_table_detection(self, page) -> bool:
+        """
+        Decides from cheap page statistics whether `find_tables` can find anything.
+        """
+        if self.profile == "accurate":
+            return True
+        objects = page.objects
+        return bool(objects.get("line") or objects.get("rect") or objects.get("curve"))
+
+    def _page_blocks(self, page, document_name: str) -> PageBlocks:
+        """
+        Extracts the text lines and tables of a single pdfplumber page, in reading order,
+        as Markdown blocks.
+        """
+        all_objects = []
+
+        # Extract text lines from the page.
+        text_lines = page.extract_text_lines(
+            layout=True, strip=True, return_chars=False
+        )
+        for line in text_lines:
+            line["object_type"] = "text_line"
+            all_objects.append(line)
+
+        # Extract tables from the page. Ruling lines, rectangles and curves are only used by
+        # the table finder, which reads them from the page itself, so they are not collected.
+        tables = page.find_tables() if self._needs_table_detection(page) else []
+        for idx, table in enumerate(tables):
+            try:
+                table_data = table.extract()
+            except Exception as e:
+                print(
+                    f"Error extracting table on page {page.page_number} of {document_name}: {e}"  # noqa: E501
+                )
+                table_data = None
+            table_obj = {
+                "object_type": "table",
+                "bbox": table.bbox,
+                "table_data": table_data,
+                "table_index": idx,
+            }
+            all_objects.append(table_obj)
+
+        def get_vertical_position(obj):
+            """
+            Returns the vertical position for sorting objects.
+            """
+            if obj.get("object_type") == "table":
+                return obj.get("bbox", [0, 0, 0, 0])[1]
+            return obj.get("top", 0)
+
+        sorted_objects = sorted(all_objects, key=get_vertical_position)
+
+        # Build the markdown blocks of this page.
+        blocks: PageBlocks = []
+        for obj in sorted_objects:
+            obj_type = obj.get("object_type")
+            if obj_type == "text_line":
+                text = obj.get("text", "").strip()
+                if text:
+                    blocks.append((BlockType.PARAGRAPH, text))
+            elif obj_type == "table":
+                table_data = obj.get("table_data")
+                if table_data and len(table_data) > 0:
+                    header_row = [str(cell).strip() for cell in table_data[0]]
+                    rows = ["| " + " | ".join(header_row) + " |"]
+                    rows.append("| " + " | ".join(["---"] * len(header_row)) + " |")
+                    for row in table_data[1:]:
+                        row_cells = [str(cell).strip() for cell in row]
+                        rows.append("| " + " | ".join(row_cells) + " |")
+                    blocks.append((BlockType.TABLE, "\n".join(rows)))
+        return blocks
+
+
+def _render_page(page_number: int, blocks: PageBlocks) -> str:
+    """
+    Renders the blocks of a page as Markdown, under a "## Page N" heading.
+    """
+    parts = [f"## Page {page_number}\n\n"]
+    for _, text in blocks:
+        parts.append(f"{text}\n\n")
+    return "".join(parts)
+
+
+def _render_page_range(
+    file_path: str, page_numbers: List[int], reader_options: Dict
+) -> List[Tuple[int, PageBlocks]]:
+    """
+    Worker entry point: extracts the blocks of the given (1-based) pages of a PDF.
+
+    Args:
+        file_path (str): The full path to the PDF file.
+        page_numbers (List[int]): Page numbers to render.
+        reader_options (Dict): Keyword arguments for the worker's PDFPlumberReader.
+
+    Returns:
+        List[Tuple[int, PageBlocks]]: The page number and blocks of each rendered page.
+    """
+    reader = PDFPlumberReader(**reader_options)
+    document_name = os.path.basename(file_path)
+    rendered = []
+    with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+        for page in pdf.pages:
+            try:
+                rendered.append(
+                    (page.page_number, reader._page_blocks(page, document_name))
+                )
+            finally:
+                page.close()
+    return rendered
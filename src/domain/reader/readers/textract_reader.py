@@ -1,8 +1,11 @@
+import io
 import logging
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from src.domain.reader.base_reader import BaseReader
+from src.domain.reader.base_reader import BaseReader, select_page_numbers
+from src.domain.reader.document import BlockType, Document, DocumentBuilder
 
 
 class TextractReader(BaseReader):
@@ -12,14 +15,65 @@ class TextractReader(BaseReader):
     This reader reads the file as bytes, sends it to Textract via the detect_document_text API,
     and then groups the detected text lines by page into a Markdown formatted string.
 
+    The synchronous DetectDocumentText API only analyzes one page per call. When
+    `split_pages` is set, PDFs are split into single-page documents that are submitted
+    concurrently (at most `concurrency` calls in flight) and the LINE blocks are reassembled
+    in page order. With a page selection (`convert_pages`) only the selected pages of a
+    PDF are submitted, page by page.
+
     Attributes:
-        client: A boto3 Textract client instance.
+        client: A boto3 Textract client instance (or any object with the same
+            `detect_document_text` method, such as `LocalTextractClient`).
         model (Optional[str]): Not used here, but retained for interface compatibility.
+        split_pages (bool): Whether multi-page PDFs are submitted page by page.
+        concurrency (int): Maximum number of concurrent Textract calls.
     """
 
-    def __init__(self, client, model: Optional[str] = None):
-        self.client = client
+    embeds_file_name = True
+
+    def __init__(
+        self,
+        client=None,
+        model: Optional[str] = None,
+        *,
+        backend: str = "aws",
+        split_pages: bool = True,
+        concurrency: int = 4,
+    ):
+        """
+        Initialize the TextractReader.
+
+        Args:
+            client: Textract client. If None, one is built according to `backend`.
+            model (Optional[str]): Not used, retained for interface compatibility.
+            backend (str): "aws" for AWS Textract or "local" for the offline
+                `LocalTextractClient`. Only used when `client` is None.
+            split_pages (bool): Submit multi-page PDFs page by page.
+            concurrency (int): Maximum number of concurrent Textract calls.
+
+        Raises:
+            ValueError: If `concurrency` is lower than 1 or the backend is unknown.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0")
+        self.client = client if client is not None else self._build_client(backend)
         self.model = model
+        self.split_pages = split_pages
+        self.concurrency = concurrency
+
+    @staticmethod
+    def _build_client(backend: str):
+        if backend == "aws":
+            from src.infrastructure.model.models.textract_client import TextractClient
+
+            return TextractClient.shared().get_client()
+        elif backend == "local":
+            from src.infrastructure.model.models.local_textract_client import (
+                LocalTextractClient,
+            )
+
+            return LocalTextractClient().get_client()
+        raise ValueError(f"Unsupported Textract backend: {backend}")
 
     def convert(self, file_path: str) -> str:
         """
@@ -32,33 +86,146 @@ class TextractReader(BaseReader):
         Returns:
             str: A Markdown formatted string with the extracted text, grouped by page.
         """
+        return self.convert_pages(file_path)
+
+    def convert_pages(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> str:
+        """
+        Converts only the selected pages of a document: the other pages of a PDF are not
+        sent to Textract. Other documents are a single page.
+
+        Args:
+            file_path (str): The path to the document file.
+            pages (Optional[Iterable[int]]): 1-based page numbers to convert. None
+                converts all of them.
+            max_pages (Optional[int]): Convert at most this many of the selected pages.
+
+        Returns:
+            str: A Markdown formatted string with the extracted text, grouped by page.
+        """
+        detected = self._detect_pages(file_path, pages, max_pages)
+        return self._build_document(file_path, detected).text
+
+    def convert_document(self, file_path: str) -> Document:
+        """
+        Converts an input document to a `Document` with one paragraph per detected line,
+        under a heading per page.
+
+        Args:
+            file_path (str): The path to the document file.
+
+        Returns:
+            Document: The document, whose text is the output of `convert`.
+        """
+        return self._build_document(file_path, self._detect_pages(file_path))
+
+    def _detect_pages(
+        self,
+        file_path: str,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Dict[int, List[str]]:
+        """
+        Sends the selected pages of a document to Textract and returns the detected lines
+        of each page.
+        """
         # Read the document bytes
         with open(file_path, "rb") as f:
             file_bytes = f.read()
 
+        select = pages is not None or max_pages is not None
+        if file_bytes.startswith(b"%PDF") and (self.split_pages or select):
+            page_documents = self._split_pdf(file_bytes, pages, max_pages)
+        else:
+            page_documents = [(1, file_bytes)]
+            if select and not select_page_numbers(1, pages, max_pages):
+                page_documents = []
+
+        if len(page_documents) == 1 and page_documents[0][0] == 1:
+            detected = self._detect_lines(page_documents[0][1])
+        else:
+            detected = {}
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                results = executor.map(
+                    self._detect_lines, [document for _, document in page_documents]
+                )
+                for (page_num, _), page_lines in zip(page_documents, results):
+                    if page_lines:
+                        detected[page_num] = [
+                            line for lines in page_lines.values() for line in lines
+                        ]
+
+        return detected
+
+    @staticmethod
+    def _build_document(file_path: str, detected: Dict[int, List[str]]) -> Document:
+        """
+        Builds the Markdown document from the detected lines of each page.
+        """
+        builder = DocumentBuilder()
+        document_name = os.path.basename(file_path)
+        builder.add(BlockType.HEADING, f"# Document: {document_name}", level=1)
+        if not detected:
+            builder.add_text("No text detected.")
+        else:
+            for page in sorted(detected.keys()):
+                builder.add(BlockType.HEADING, f"## Page {page}", page=page, level=2)
+                for line in detected[page]:
+                    builder.add(BlockType.PARAGRAPH, line, page=page)
+        return builder.build()
+
+    def _detect_lines(self, document_bytes: bytes) -> Dict[int, List[str]]:
+        """
+        Calls DetectDocumentText and groups the detected LINE blocks by page.
+        """
         try:
             # Call Textract's detect_document_text API
-            response = self.client.detect_document_text(Document={"Bytes": file_bytes})
+            response = self.client.detect_document_text(
+                Document={"Bytes": document_bytes}
+            )
         except Exception as e:
             logging.error(f"Textract detect_document_text failed: {e}")
             raise RuntimeError("Textract detect_document_text failed") from e
 
         # Group detected lines by page. Default page number is 1.
-        pages = {}
+        pages: Dict[int, List[str]] = {}
         for block in response.get("Blocks", []):
             if block.get("BlockType") == "LINE":
                 page_num = block.get("Page", 1)
                 pages.setdefault(page_num, []).append(block.get("Text", ""))
+        return pages
 
-        # Build Markdown content
-        document_name = os.path.basename(file_path)
-        markdown_content = f"# Document: {document_name}\n\n"
-        if not pages:
-            markdown_content += "No text detected."
-        else:
-            for page in sorted(pages.keys()):
-                markdown_content += f"## Page {page}\n\n"
-                for line in pages[page]:
-                    markdown_content += line + "\n\n"
+    @staticmethod
+    def _split_pdf(
+        file_bytes: bytes,
+        pages: Optional[Iterable[int]] = None,
+        max_pages: Optional[int] = None,
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Splits a PDF into single-page PDF documents, keeping only the selected pages.
+
+        Returns:
+            List[Tuple[int, bytes]]: The 1-based page number and document of each page.
+        """
+        import pypdfium2 as pdfium
 
-        return markdown_content
+        source = pdfium.PdfDocument(file_bytes)
+        try:
+            page_numbers = select_page_numbers(len(source), pages, max_pages)
+            if len(source) <= 1:
+                return [(1, file_bytes)] if page_numbers else []
+            page_documents = []
+            for page_number in page_numbers:
+                single_page = pdfium.PdfDocument.new()
+                single_page.import_pages(source, [page_number - 1])
+                buffer = io.BytesIO()
+                single_page.save(buffer)
+                single_page.close()
+                page_documents.append((page_number, buffer.getvalue()))
+            return page_documents
+        finally:
+            source.close()
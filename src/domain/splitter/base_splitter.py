@@ -1,8 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List, Union
+
+from src.domain.splitter.chunk_spans import ChunkSpans
+
+# A whole text, or consecutive pieces of one (e.g. the pages yielded by a reader).
+TextSource = Union[str, Iterable[str]]
 
 
 class BaseSplitter(ABC):
+    """
+    Abstract class which implements Splitters.
+
+    Attributes:
+        normalizes_whitespace (bool): Whether `split` normalizes the whitespace of its
+            chunks, so that they differ from the text of the `split_spans` chunks.
+    """
+
+    normalizes_whitespace: bool = False
+
     @abstractmethod
     def split(self, text: str) -> List[str]:
         """
@@ -15,3 +30,47 @@ class BaseSplitter(ABC):
             List[str]: A list of text chunks.
         """
         pass
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Split a text, or consecutive pieces of one, yielding the chunks as they are complete.
+
+        The chunks are the same as those of `split` on the whole text. By default the pieces
+        are joined and split at once; splitters that can carry their state across piece
+        boundaries override this to keep only the pending chunk in memory.
+
+        Args:
+            text (TextSource): The text to split, or an iterable of consecutive pieces.
+
+        Yields:
+            str: The text chunks.
+        """
+        if not isinstance(text, str):
+            text = "".join(text)
+        yield from self.split(text)
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Split the provided text into chunks given as offsets into it, so that no chunk text
+        is copied until it is accessed.
+
+        By default the chunks of `split` are located in the text, which requires them to be
+        substrings of it. Splitters whose chunks are not (e.g. because they normalize the
+        whitespace between words) override this.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        return ChunkSpans.locate(text, self.split(text))
+
+
+def iter_pieces(text: TextSource) -> Iterator[str]:
+    """
+    Iterates over the pieces of a text source: a string is a single piece.
+    """
+    if isinstance(text, str):
+        return iter((text,))
+    return iter(text)
@@ -0,0 +1,135 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class ChunkSpans:
+    """
+    Chunks of a text stored as offsets into it.
+
+    Instead of one string per chunk, the chunks are two parallel arrays with the start and
+    end offset of each chunk in a shared source text, 16 bytes per chunk whatever its length.
+    Overlapping chunks do not copy the overlapped text, and chunk strings are only built
+    when a chunk is accessed (`spans[i]`, iteration or `to_list`).
+
+    Attributes:
+        text (str): The source text.
+        starts (array): Start offset of each chunk in `text`.
+        ends (array): End offset of each chunk in `text`.
+    """
+
+    __slots__ = ("text", "starts", "ends")
+
+    def __init__(
+        self,
+        text: str = "",
+        starts: Optional[array] = None,
+        ends: Optional[array] = None,
+    ) -> None:
+        self.text = text
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "ChunkSpans"]:
+        if isinstance(index, slice):
+            return ChunkSpans(self.text, self.starts[index], self.ends[index])
+        return self.text[self.starts[index] : self.ends[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self.text
+        return (text[start:end] for start, end in zip(self.starts, self.ends))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChunkSpans):
+            return NotImplemented
+        mine = (self.text, self.starts, self.ends)
+        return mine == (other.text, other.starts, other.ends)
+
+    def append(self, start: int, end: int) -> None:
+        """
+        Appends the chunk `text[start:end]`.
+        """
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def spans(self) -> List[Tuple[int, int]]:
+        """
+        Returns the start and end offsets of each chunk.
+        """
+        return list(zip(self.starts, self.ends))
+
+    def to_list(self) -> List[str]:
+        """
+        Materializes every chunk as a string.
+        """
+        return list(self)
+
+    @classmethod
+    def locate(cls, text: str, chunks: Iterable[str]) -> "ChunkSpans":
+        """
+        Builds the spans of chunks that are substrings of `text`, in order. Each chunk is
+        searched from right after the start of the previous one, so overlapping chunks are
+        found too.
+
+        Args:
+            text (str): The source text.
+            chunks (Iterable[str]): Consecutive substrings of `text`.
+
+        Returns:
+            ChunkSpans: The spans of the chunks.
+
+        Raises:
+            ValueError: If a chunk is not found in `text`.
+        """
+        spans = cls(text)
+        position = 0
+        for chunk in chunks:
+            start = text.find(chunk, position)
+            if start < 0:
+                raise ValueError("Chunk not found in the source text")
+            spans.append(start, start + len(chunk))
+            position = start + 1
+        return spans
+
+
+def strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Returns the span of `text[start:end]` without its leading and trailing whitespace
+    (an empty span if it is all whitespace), without copying it.
+    """
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def group_spans(text: str, units: Iterable[Tuple[int, int]], size: int) -> ChunkSpans:
+    """
+    Groups consecutive spans of units (words, sentences...) of a text into chunks of `size`
+    units, each chunk going from the start of its first unit to the end of its last one.
+
+    Args:
+        text (str): The source text.
+        units (Iterable[Tuple[int, int]]): The start and end offsets of each unit, in order.
+        size (int): Number of units per chunk.
+
+    Returns:
+        ChunkSpans: The spans of the chunks.
+    """
+    spans = ChunkSpans(text)
+    count = 0
+    start = end = 0
+    for unit_start, unit_end in units:
+        if count == 0:
+            start = unit_start
+        end = unit_end
+        count += 1
+        if count == size:
+            spans.append(start, end)
+            count = 0
+    if count:
+        spans.append(start, end)
+    return spans
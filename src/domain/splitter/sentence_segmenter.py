@@ -0,0 +1,174 @@
+import re
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from src.domain.splitter.chunk_spans import strip_span
+
+# Characters that may come right before an abbreviation or initial, e.g. "(e.g. ...".
+_OPENING = "\\s([{\"'¿¡«“‘"
+# An initial: a single letter followed by a period ("J. R. Doe").
+_INITIAL = r"[^\W\d_]\."
+
+# Abbreviations that are usually followed by more of the same sentence, per language.
+# Lowercase and without their final period. Words that often end sentences ("etc", "no")
+# are left out.
+ABBREVIATIONS: Dict[str, FrozenSet[str]] = {
+    "en": frozenset(
+        (
+            "mr mrs ms dr prof sr jr st vs e.g i.e cf approx dept fig vol ca al inc ltd "
+            "corp jan feb apr aug sep sept oct nov dec u.s u.k a.m p.m"
+        ).split()
+    ),
+    "es": frozenset(
+        (
+            "sr sra srta dr dra prof lic ing arq dña ud uds vd vds p.ej art cap pág págs "
+            "núm fig aprox avda av ej vol ene feb abr ago sept oct nov dic ee.uu s.a"
+        ).split()
+    ),
+    "fr": frozenset(
+        (
+            "mm mme mmes mlle dr pr cf p.ex av apr env art chap fig vol janv févr avr "
+            "juil sept oct nov déc"
+        ).split()
+    ),
+    "de": frozenset(
+        (
+            "hr fr dr prof bzw ca evtl ggf inkl u.a vgl z.b d.h s.o s.u nr str abs bd "
+            "jan feb apr aug sept okt nov dez"
+        ).split()
+    ),
+}
+
+
+class SentenceSegmenter:
+    """
+    Finds the sentences of a text in a single pass over it.
+
+    A sentence ends at a period, exclamation mark or question mark followed by whitespace,
+    unless the period closes an abbreviation of the language ("e.g.", "Dr."...) or an initial
+    within a run of initials ("J. R. Doe"). A lone single letter does end a sentence ("Plan A.
+    It failed."), as it cannot be told apart from an initial before a surname ("J. Smith").
+    Decimal numbers never end a sentence, as their period is not followed by whitespace.
+
+    Both exceptions are compiled into the boundary pattern as fixed-width lookarounds, one per
+    abbreviation length, so every match of the pattern is a sentence boundary and the text is
+    scanned by the regex engine alone. Sentences are returned as offsets, without surrounding
+    whitespace, and groups of sentences are found by counting boundaries, so no list of
+    sentences is built.
+
+    Attributes:
+        language (str): Language of the abbreviations, one of `ABBREVIATIONS`.
+        abbreviations (FrozenSet[str]): Abbreviations (lowercase, without their final period)
+            that do not end a sentence.
+        pattern (re.Pattern): Matches the last mark of a sentence and the whitespace after it.
+    """
+
+    def __init__(
+        self, language: str = "en", abbreviations: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Initialize the segmenter.
+
+        Args:
+            language (str): Language of the built-in abbreviations.
+            abbreviations (Optional[Iterable[str]]): Additional abbreviations, with or
+                without their final period.
+
+        Raises:
+            ValueError: If the language is not supported.
+        """
+        if language not in ABBREVIATIONS:
+            raise ValueError(
+                f"Unsupported language: {language}. Use one of {tuple(ABBREVIATIONS)}"
+            )
+        extra = (a.lower().rstrip(".") for a in abbreviations or ())
+        self.language = language
+        self.abbreviations = ABBREVIATIONS[language].union(extra)
+        self.pattern = _boundary_pattern(self.abbreviations)
+
+    def spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the start and end offsets of each sentence of the text, in order.
+
+        Args:
+            text (str): The text to segment.
+
+        Yields:
+            Tuple[int, int]: The span of each non-empty sentence, without surrounding
+                whitespace.
+        """
+        return self.group_spans(text, 1)
+
+    def group_spans(self, text: str, size: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the start and end offsets of each group of `size` consecutive sentences,
+        counting the boundaries between them.
+
+        Args:
+            text (str): The text to segment.
+            size (int): Number of sentences per group.
+
+        Yields:
+            Tuple[int, int]: The span of each group, from the start of its first sentence to
+                the end of its last one.
+        """
+        start, end = strip_span(text, 0, len(text))
+        count = 0
+        for boundary in self.pattern.finditer(text, start, end):
+            count += 1
+            if count == size:
+                yield start, boundary.start() + 1
+                start = boundary.end()
+                count = 0
+        if start < end:
+            yield start, end
+
+    def groups(self, text: str, size: int) -> Iterator[str]:
+        """
+        Yields the sentences of the text joined with a space, `size` sentences at a time.
+        Only the sentences of the group being built are kept.
+
+        Args:
+            text (str): The text to segment.
+            size (int): Number of sentences per group.
+
+        Yields:
+            str: Each group of sentences.
+        """
+        start, end = strip_span(text, 0, len(text))
+        group: List[str] = []
+        for boundary in self.pattern.finditer(text, start, end):
+            group.append(text[start : boundary.start() + 1])
+            start = boundary.end()
+            if len(group) == size:
+                yield " ".join(group)
+                group = []
+        if start < end:
+            group.append(text[start:end])
+        if group:
+            yield " ".join(group)
+
+
+@lru_cache(maxsize=None)
+def _boundary_pattern(abbreviations: FrozenSet[str]) -> "re.Pattern":
+    """
+    Compiles the pattern of a sentence boundary: a sentence-ending mark followed by
+    whitespace, unless the mark is the period of one of the abbreviations, or of an initial
+    followed or preceded by another one.
+    """
+    exceptions: List[str] = []
+    by_length = groupby(sorted(abbreviations, key=lambda a: (len(a), a)), key=len)
+    for _, group in by_length:
+        exceptions.append("(?i:" + "|".join(map(re.escape, group)) + ")\\.")
+    # "J." in "J. R. Doe": an initial followed by another one.
+    lookarounds = "".join(
+        f"(?!(?<={start}{_INITIAL})\\s+{_INITIAL})" for start in (f"[{_OPENING}]", "^")
+    )
+    # "R." in "J. R. Doe": an initial preceded by another one.
+    exceptions.append(f"{_INITIAL}\\s{_INITIAL}")
+    lookarounds += "".join(
+        f"(?<![{_OPENING}]{exception})(?<!^{exception})" for exception in exceptions
+    )
+    # Starting with the marks lets the regex engine skip quickly to the candidates.
+    return re.compile(f"[.!?]{lookarounds}\\s+")
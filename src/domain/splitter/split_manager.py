@@ -1,11 +1,14 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.reader.document import Document
+from src.domain.splitter.base_splitter import BaseSplitter, TextSource
+from src.domain.splitter.chunk_spans import ChunkSpans
 from src.domain.splitter.splitters.fixed_splitter import FixedSplitter
 from src.domain.splitter.splitters.paragraph_splitter import ParagraphSplitter
 from src.domain.splitter.splitters.recursive_splitter import RecursiveSplitter
 from src.domain.splitter.splitters.sentence_splitter import SentenceSplitter
+from src.domain.splitter.splitters.token_splitter import TokenSplitter
 from src.domain.splitter.splitters.word_splitter import WordSplitter
 
 # from src.domain.splitter.splitters.semantic_splitter import SemanticSplitter
@@ -31,6 +34,13 @@ class SplitManager:
         split_text(text: str) -> List[str]:
             Splits the given text into a list of chunks according to the configured splitting
             strategy.
+        split_iter(text: TextSource) -> Iterator[str]:
+            Splits a text, or consecutive pieces of it, yielding the chunks as they are
+            complete.
+        split_spans(text: str) -> ChunkSpans:
+            Splits the given text into chunks given as offsets into it.
+        split_counted(text: str) -> Tuple[ChunkSpans, Optional[List[int]]]:
+            Like `split_spans`, also returning the token counts of token chunks.
     """
 
     def __init__(
@@ -77,6 +87,7 @@ class SplitManager:
             "paragraph": ParagraphSplitter,
             "fixed": FixedSplitter,
             "recursive": RecursiveSplitter,
+            "token": TokenSplitter,
             # "semantic": SemanticSplitter,
             # "paged": PagedSplitter,
             # "row-column": RowColumnSplitter,
@@ -106,7 +117,8 @@ class SplitManager:
         Returns:
             List[str]: A list of text chunks generated by the splitter.
         """
-        if not text.strip():
+        # `isspace` checks the text without copying it, unlike `strip`.
+        if not text or text.isspace():
             logging.warning("Empty text provided for splitting.")
             return []
         try:
@@ -114,3 +126,114 @@ class SplitManager:
         except Exception as e:
             logging.error(f"Error during text splitting: {e}")
             return []
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Splits the provided text into chunks given as start and end offsets into it, so the
+        chunk texts are not copied until they are accessed. Overlapping chunks share the
+        overlapped text.
+
+        The fixed and recursive chunks are the same as those of `split_text`. Word, sentence
+        and paragraph chunks keep the whitespace of the text between their words, sentences
+        or paragraphs. Empty text and splitting errors are handled like in `split_text`, and
+        give no chunks.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        if not text or text.isspace():
+            logging.warning("Empty text provided for splitting.")
+            return ChunkSpans(text)
+        try:
+            return self.splitter.split_spans(text)
+        except Exception as e:
+            logging.error(f"Error during text splitting: {e}")
+            return ChunkSpans(text)
+
+    def split_counted(self, text: str) -> Tuple[ChunkSpans, Optional[List[int]]]:
+        """
+        Splits the provided text like `split_spans` and, if the splitter counts tokens (the
+        `token` method), returns the number of tokens of each chunk, as counted while
+        splitting.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            Tuple[ChunkSpans, Optional[List[int]]]: The spans of the chunks in `text`, and
+                their token counts or None.
+        """
+        if not isinstance(self.splitter, TokenSplitter):
+            return self.split_spans(text), None
+        if not text or text.isspace():
+            logging.warning("Empty text provided for splitting.")
+            return ChunkSpans(text), []
+        try:
+            return self.splitter.split_counted(text)
+        except Exception as e:
+            logging.error(f"Error during text splitting: {e}")
+            return ChunkSpans(text), []
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Splits a text, or consecutive pieces of it such as the pages yielded by a reader's
+        `iter_convert`, yielding the chunks as soon as they are complete.
+
+        The chunks are the same as those of `split_text` on the whole text, but the word,
+        sentence, paragraph and fixed splitters only keep the pending chunk in memory. If
+        nothing is produced, a warning is logged. In case of an error during splitting, an
+        error is logged and no more chunks are yielded.
+
+        Args:
+            text (TextSource): The text to split, or an iterable of consecutive pieces.
+
+        Yields:
+            str: The text chunks generated by the splitter.
+        """
+        produced = False
+        try:
+            for chunk in self.splitter.split_iter(text):
+                produced = True
+                yield chunk
+        except Exception as e:
+            logging.error(f"Error during text splitting: {e}")
+            return
+        if not produced:
+            logging.warning("Empty text provided for splitting.")
+
+    def split_document(
+        self, document: Document, by: Optional[str] = None, max_level: int = 6
+    ) -> List[str]:
+        """
+        Splits a structured document with the configured splitter.
+
+        With `by="page"` or `by="section"`, each page or section is split on its own, so no
+        chunk spans two of them. Their boundaries are read from the document blocks, not
+        recovered from the text.
+
+        Args:
+            document (Document): The document to split.
+            by (Optional[str]): None, "page" or "section".
+            max_level (int): Deepest heading level that starts a section.
+
+        Returns:
+            List[str]: A list of text chunks generated by the splitter.
+
+        Raises:
+            ValueError: If `by` is not supported.
+        """
+        if by is None:
+            return self.split_text(document.text)
+        if by == "page":
+            spans = document.page_spans()
+        elif by == "section":
+            spans = document.section_spans(max_level)
+        else:
+            raise ValueError(f"Invalid split boundary: {by}")
+        chunks: List[str] = []
+        for _, start, end in spans:
+            chunks.extend(self.split_text(document.text[start:end]))
+        return chunks
@@ -1,6 +1,9 @@
-from typing import List
+import mmap
+from contextlib import suppress
+from typing import Iterator, List, Union
 
-from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.base_splitter import BaseSplitter, TextSource, iter_pieces
+from src.domain.splitter.chunk_spans import ChunkSpans
 
 
 class FixedSplitter(BaseSplitter):
@@ -10,6 +13,10 @@ class FixedSplitter(BaseSplitter):
     This class divides the provided text into contiguous substrings, each with a length equal to
     the specified 'chunk_size'. If the total text length is not an exact multiple of 'chunk_size',
     the final chunk will contain the remaining characters, which may be shorter than 'chunk_size'.
+
+    `split_bytes` and `split_file` work on UTF-8 encoded bytes instead, without decoding them:
+    chunks are at most 'size' bytes, cut back to the nearest character boundary, and are
+    yielded as zero-copy memoryviews.
     """
 
     def __init__(self, size: int = 500) -> None:
@@ -43,3 +50,123 @@ class FixedSplitter(BaseSplitter):
             text[i : i + effective_size] for i in range(0, len(text), effective_size)
         ]
         return chunks
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Splits the text, or consecutive pieces of it, into fixed-size chunks, yielding each
+        chunk as soon as it has `size` characters. At most one chunk is kept pending.
+
+        Args:
+            text (TextSource): The text to split, or an iterable of consecutive pieces.
+
+        Yields:
+            str: The text chunks.
+        """
+        carry = ""
+        for piece in iter_pieces(text):
+            if len(carry) + len(piece) < self.size:
+                carry += piece
+                continue
+            buffer = carry + piece
+            full = len(buffer) - len(buffer) % self.size
+            for i in range(0, full, self.size):
+                yield buffer[i : i + self.size]
+            carry = buffer[full:]
+        if carry:
+            yield carry
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Splits the provided text into fixed-size chunks given as offsets into it. The spans
+        are computed from the text length alone.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        spans = ChunkSpans(text)
+        length = len(text)
+        for start in range(0, length, self.size):
+            spans.append(start, min(start + self.size, length))
+        return spans
+
+    def split_bytes(
+        self, data: Union[bytes, bytearray, memoryview, mmap.mmap], overlap: int = 0
+    ) -> Iterator[memoryview]:
+        """
+        Splits UTF-8 encoded bytes into chunks of at most `size` bytes without decoding
+        them. Each cut is moved back to the nearest character boundary, so every chunk is
+        valid UTF-8 on its own (a chunk only exceeds `size` if a single character does).
+
+        Args:
+            data (Union[bytes, bytearray, memoryview, mmap.mmap]): UTF-8 encoded text.
+            overlap (int): Number of bytes repeated at the start of each chunk from the end
+                of the previous one, also moved back to a character boundary.
+
+        Yields:
+            memoryview: Zero-copy views of the chunks.
+
+        Raises:
+            ValueError: If `overlap` is negative or not lower than `size`.
+        """
+        if overlap < 0 or overlap >= self.size:
+            raise ValueError("Overlap must be >= 0 and lower than the chunk size")
+        view = memoryview(data).cast("B")
+        length = len(view)
+        start = 0
+        while start < length:
+            end = min(start + self.size, length)
+            end = _char_start(view, end)
+            if end <= start:
+                # A character longer than the chunk size: keep it whole.
+                end = _char_end(view, start + 1)
+            yield view[start:end]
+            if end == length:
+                break
+            start = max(_char_start(view, end - overlap), start + 1)
+            start = _char_end(view, start)
+
+    def split_file(self, file_path: str, overlap: int = 0) -> Iterator[memoryview]:
+        """
+        Splits a UTF-8 text file like `split_bytes`, over a read-only memory map of it, so the
+        file is neither decoded nor read into memory as a whole.
+
+        The yielded views point into the map, which stays open while they are referenced.
+
+        Args:
+            file_path (str): Path to the UTF-8 text file.
+            overlap (int): Number of bytes repeated at the start of each chunk.
+
+        Yields:
+            memoryview: Zero-copy views of the chunks.
+        """
+        with open(file_path, "rb") as f:
+            if not f.seek(0, 2):  # Empty files cannot be mapped.
+                return
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield from self.split_bytes(data, overlap)
+        finally:
+            # Views still held by the caller keep the map alive; it is closed once released.
+            with suppress(BufferError):
+                data.close()
+
+
+def _char_start(view: memoryview, position: int) -> int:
+    """
+    Moves a byte position back to the start of the UTF-8 character it falls in.
+    """
+    while 0 < position < len(view) and view[position] & 0xC0 == 0x80:
+        position -= 1
+    return position
+
+
+def _char_end(view: memoryview, position: int) -> int:
+    """
+    Moves a byte position forward to the start of the next UTF-8 character.
+    """
+    while position < len(view) and view[position] & 0xC0 == 0x80:
+        position += 1
+    return position
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Iterator, List, Tuple
 
-from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.base_splitter import BaseSplitter, TextSource, iter_pieces
+from src.domain.splitter.chunk_spans import ChunkSpans, group_spans, strip_span
 
 
 class ParagraphSplitter(BaseSplitter):
@@ -12,6 +13,8 @@ class ParagraphSplitter(BaseSplitter):
     allowing for clean paragraph extraction.
     """
 
+    normalizes_whitespace = True
+
     def __init__(self, num_paragraphs: int = None) -> None:
         """
         Initialize the ParagraphSplitter.
@@ -38,7 +41,7 @@ class ParagraphSplitter(BaseSplitter):
                 group of paragraphs).
         """
         # Split text by newlines and filter out empty strings.
-        paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
+        paragraphs = [p for p in map(str.strip, text.split("\n")) if p]
 
         # If num_paragraphs is not specified, return each paragraph separately.
         if self.num_paragraphs is None:
@@ -51,3 +54,69 @@ class ParagraphSplitter(BaseSplitter):
             chunks.append(chunk)
 
         return chunks
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Splits the text, or consecutive pieces of it, into paragraphs, yielding each chunk
+        as soon as its last paragraph ends. A line cut by a piece boundary is completed with
+        the next piece.
+
+        Args:
+            text (TextSource): The text to split, or an iterable of consecutive pieces.
+
+        Yields:
+            str: The text chunks.
+        """
+        group_size = self.num_paragraphs or 1
+        paragraphs: List[str] = []
+        carry = ""
+        for piece in iter_pieces(text):
+            if not piece:
+                continue
+            buffer = carry + piece
+            last_newline = buffer.rfind("\n")
+            if last_newline < 0:
+                carry = buffer
+                continue
+            # The text after the last newline may continue in the next piece.
+            carry = buffer[last_newline + 1 :]
+            lines = buffer[:last_newline].split("\n")
+            paragraphs.extend(p for p in map(str.strip, lines) if p)
+            while len(paragraphs) >= group_size:
+                yield "\n\n".join(paragraphs[:group_size])
+                del paragraphs[:group_size]
+        carry = carry.strip()
+        if carry:
+            paragraphs.append(carry)
+        for i in range(0, len(paragraphs), group_size):
+            yield "\n\n".join(paragraphs[i : i + group_size])
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Splits the provided text into paragraphs given as offsets into it. A group of
+        paragraphs goes from its first paragraph to its last one, so it keeps the blank
+        lines of the text between them, which `split` normalizes to one blank line.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        return group_spans(text, _paragraph_spans(text), self.num_paragraphs or 1)
+
+
+def _paragraph_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the span of each non-empty line of the text, without surrounding whitespace.
+    """
+    position = 0
+    length = len(text)
+    while position <= length:
+        line_end = text.find("\n", position)
+        if line_end < 0:
+            line_end = length
+        start, end = strip_span(text, position, line_end)
+        if start < end:
+            yield start, end
+        position = line_end + 1
@@ -1,8 +1,11 @@
-from typing import List
-
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from collections import deque
+from typing import Deque, Iterator, List, Tuple
 
 from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.chunk_spans import ChunkSpans, strip_span
+
+# Separators tried in order: paragraphs, lines, words and, as a last resort, characters.
+SEPARATORS = ("\n\n", "\n", " ", "")
 
 
 class RecursiveSplitter(BaseSplitter):
@@ -10,8 +13,16 @@ class RecursiveSplitter(BaseSplitter):
     Recursively split the input text into smaller chunks not exceeding a specified maximum length.
 
     This class applies a recursive strategy to break down the text into manageable pieces. It first
-    split the text by a fixed number of characters and then further divides any resulting chunk that
-    exceeds 'max_length' until all chunks satisfy the length constraint.
+    splits the text by the coarsest separator found in it (paragraphs, then lines, then words,
+    then characters), merges consecutive pieces into chunks of up to 'size' characters, and splits
+    again with the next separator any piece that is too long on its own.
+
+    The chunks are the same as those of langchain's `RecursiveCharacterTextSplitter` with its
+    default settings (separators kept at the start of the following piece, chunks stripped of
+    surrounding whitespace), but they are computed on offsets: a piece is a span of the text,
+    a chunk is the span from its first piece to its last one, and overlap only moves the start
+    of the next chunk back. Each separator level is a single `str.find` scan of its span, and no
+    intermediate string is built.
     """
 
     def __init__(self, size: int = 500, overlap: int = 25) -> None:
@@ -21,27 +32,26 @@ class RecursiveSplitter(BaseSplitter):
         Args:
             size (int): The desired number of characters per chunk. Must be greater than 0.
             overlap (int): The number of overlapping characters between chunks. Must be greater
-                than 0.
+                than 0 and not greater than `size`.
 
         Raises:
-            ValueError: If either size or overlap is less than or equal to 0.
+            ValueError: If either size or overlap is less than or equal to 0, or if overlap is
+                greater than size.
         """
         if size <= 0 or overlap <= 0:
             raise ValueError(
                 "Chunk size and overlap parameters should be greater than 0"
             )
+        if overlap > size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({overlap}) than chunk size ({size})"
+            )
         self.size: int = size
         self.overlap: int = overlap
-        self.splitter: RecursiveCharacterTextSplitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.size, chunk_overlap=self.overlap
-        )
 
     def split(self, text: str) -> List[str]:
         """
         Splits the provided text into chunks using the recursive splitting strategy.
-        The output from the underlying splitter is converted into a list of strings.
-        If an element has a 'page_content' attribute, that attribute is used; otherwise,
-        the element is assumed to be a string.
 
         Args:
             text (str): The input text to split.
@@ -50,11 +60,123 @@ class RecursiveSplitter(BaseSplitter):
             List[str]: A list of text chunks (strings) resulting from the splitting operation.
                        Returns an empty list if the input text is empty.
         """
-        if not text:
-            return []
+        return self.split_spans(text).to_list()
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Splits the provided text into chunks given as offsets into it.
+
+        Args:
+            text (str): The input text to split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        spans = ChunkSpans(text)
+        if text:
+            self._split_span(text, 0, len(text), SEPARATORS, spans)
+        return spans
+
+    def _split_span(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        separators: Tuple[str, ...],
+        spans: ChunkSpans,
+    ) -> None:
+        """
+        Splits `text[start:end]` with the first of `separators` found in it, merging the pieces
+        shorter than the chunk size and splitting the others with the remaining separators.
+        """
+        separator = ""
+        remaining: Tuple[str, ...] = ()
+        for index, candidate in enumerate(separators):
+            if not candidate:
+                break
+            if text.find(candidate, start, end) >= 0:
+                separator = candidate
+                remaining = separators[index + 1 :]
+                break
+
+        merger = _ChunkMerger(text, self.size, self.overlap, spans)
+        for piece_start, piece_end in _pieces(text, start, end, separator):
+            if piece_end - piece_start < self.size:
+                merger.add(piece_start, piece_end)
+                continue
+            merger.flush()
+            if remaining:
+                self._split_span(text, piece_start, piece_end, remaining, spans)
+            else:
+                spans.append(piece_start, piece_end)
+        merger.flush()
 
-        documents = self.splitter.split_text(text)
-        chunks = [
-            doc if isinstance(doc, str) else doc.page_content for doc in documents
-        ]
-        return chunks
+
+class _ChunkMerger:
+    """
+    Merges consecutive pieces of a text into chunks of up to `size` characters.
+
+    The pieces of the chunk being built are contiguous, so the chunk is the span from the start
+    of its first piece to the end of its last one, and only the piece starts are kept. When a
+    chunk is full it is emitted, and pieces are dropped from its start until at most `overlap`
+    characters remain and the next piece fits.
+    """
+
+    def __init__(self, text: str, size: int, overlap: int, spans: ChunkSpans) -> None:
+        self.text = text
+        self.size = size
+        self.overlap = overlap
+        self.spans = spans
+        self.starts: Deque[int] = deque()
+        self.end = 0
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Adds the piece `text[start:end]`, emitting the current chunk first if it does not fit.
+        """
+        starts = self.starts
+        length = end - start
+        total = self.end - starts[0] if starts else 0
+        if total + length > self.size and starts:
+            self._emit(starts[0], self.end)
+            while total > self.overlap or (total + length > self.size and total > 0):
+                starts.popleft()
+                total = self.end - starts[0] if starts else 0
+        starts.append(start)
+        self.end = end
+
+    def flush(self) -> None:
+        """
+        Emits the current chunk, if any, and starts a new one.
+        """
+        if self.starts:
+            self._emit(self.starts[0], self.end)
+            self.starts.clear()
+
+    def _emit(self, start: int, end: int) -> None:
+        start, end = strip_span(self.text, start, end)
+        if start < end:
+            self.spans.append(start, end)
+
+
+def _pieces(
+    text: str, start: int, end: int, separator: str
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the non-empty pieces of `text[start:end]` split on `separator`, each separator
+    being kept at the start of the piece that follows it. An empty separator splits the span
+    into single characters.
+    """
+    if not separator:
+        for position in range(start, end):
+            yield position, position + 1
+        return
+    piece_start = start
+    position = text.find(separator, start, end)
+    while position >= 0:
+        if position > piece_start:
+            yield piece_start, position
+        piece_start = position
+        position = text.find(separator, position + len(separator), end)
+    if piece_start < end:
+        yield piece_start, end
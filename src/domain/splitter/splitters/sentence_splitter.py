@@ -1,7 +1,8 @@
-import re
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
-from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.base_splitter import BaseSplitter, TextSource, iter_pieces
+from src.domain.splitter.chunk_spans import ChunkSpans
+from src.domain.splitter.sentence_segmenter import SentenceSegmenter
 
 
 class SentenceSplitter(BaseSplitter):
@@ -9,18 +10,30 @@ class SentenceSplitter(BaseSplitter):
     Splits the input text into sentences.
 
     This class breaks the text into sentences by detecting sentence boundaries, typically using
-    punctuation marks such as periods, exclamation points, and question marks. It also attempts to
-    handle common edge cases, such as abbreviations, to improve accuracy.
+    punctuation marks such as periods, exclamation points, and question marks. It also handles
+    common edge cases, such as abbreviations of the configured language and initials, to improve
+    accuracy (see `SentenceSegmenter`). Sentences are found as offsets and grouped as they are
+    found, so only the sentences of the group being built are materialized.
     """
 
-    def __init__(self, num_sentences: int = 5):
+    normalizes_whitespace = True
+
+    def __init__(
+        self,
+        num_sentences: int = 5,
+        language: str = "en",
+        abbreviations: Optional[Iterable[str]] = None,
+    ):
         """
         Initialize the splitter with the number of sentences per group.
         :param num_sentences: Number of sentences to group together.
+        :param language: Language of the abbreviations that do not end a sentence.
+        :param abbreviations: Additional abbreviations that do not end a sentence.
         """
         if num_sentences <= 0:
             raise ValueError("num_sentences must be greater than 0")
         self.num_sentences = num_sentences
+        self.segmenter = SentenceSegmenter(language, abbreviations)
 
     def split(self, text: str) -> List[str]:
         """
@@ -28,11 +41,48 @@ class SentenceSplitter(BaseSplitter):
         :param text: The markdown text to split.
         :return: A list of sentence groups.
         """
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        return list(self.segmenter.groups(text, self.num_sentences))
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Split the text, or consecutive pieces of it, into groups of sentences, yielding each
+        group as soon as its last sentence ends. The last sentence found in a piece may
+        continue in the next one, so it is completed with the next piece.
+        :param text: The text to split, or an iterable of consecutive pieces.
+        :return: An iterator over the sentence groups.
+        """
+        group: List[str] = []
+        carry = ""
+        for piece in iter_pieces(text):
+            if not piece:
+                continue
+            buffer = carry + piece
+            last = None
+            for span in self.segmenter.spans(buffer):
+                if last is not None:
+                    group.append(buffer[last[0] : last[1]])
+                    if len(group) == self.num_sentences:
+                        yield " ".join(group)
+                        group = []
+                last = span
+            carry = buffer[last[0] :] if last is not None else ""
+        for start, end in self.segmenter.spans(carry):
+            group.append(carry[start:end])
+            if len(group) == self.num_sentences:
+                yield " ".join(group)
+                group = []
+        if group:
+            yield " ".join(group)
 
-        chunks = []
-        for i in range(0, len(sentences), self.num_sentences):
-            chunk = " ".join(sentences[i : i + self.num_sentences])
-            chunks.append(chunk)
-        return chunks
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Split the text into groups of sentences given as offsets into it. Each group goes
+        from its first sentence to its last one, so it keeps the whitespace of the text
+        between sentences, which `split` normalizes to single spaces.
+        :param text: The text to split.
+        :return: The spans of the sentence groups in `text`.
+        """
+        spans = ChunkSpans(text)
+        for start, end in self.segmenter.group_spans(text, self.num_sentences):
+            spans.append(start, end)
+        return spans
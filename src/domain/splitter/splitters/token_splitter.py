@@ -0,0 +1,183 @@
+import re
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.chunk_spans import ChunkSpans
+from src.domain.splitter.tokenizer import TOKEN_PATTERN, BaseTokenizer, load_tokenizer
+
+_WORD = re.compile(r"\S+")
+
+
+class TokenSplitter(BaseSplitter):
+    """
+    Splits the input text into chunks of up to a number of tokens.
+
+    Downstream embedding models and LLMs are limited in tokens, so chunks are filled up to
+    `max_tokens` tokens of an offline tokenizer (see `load_tokenizer`). Counting is
+    incremental: the text is read word by word, each word is tokenized once (counts are cached,
+    so repeated words are not tokenized again) and chunk counts are running sums, so a growing
+    chunk is never re-tokenized. A chunk is the span of the text from its first word to its
+    last one, and with `overlap` the next chunk starts with the last words of the previous one
+    that fit in `overlap` tokens.
+
+    A word with more than `max_tokens` tokens (a URL, a data URI, a long table row...) is
+    split into fragments of at most `max_tokens` tokens, cut between its basic tokens (see
+    `TOKEN_PATTERN`) or, within a basic token that is still too long, between characters.
+    Each fragment but the last is a chunk on its own, and no overlap is kept across them.
+
+    Attributes:
+        max_tokens (int): Maximum number of tokens per chunk.
+        overlap (int): Maximum number of tokens shared by consecutive chunks.
+        tokenizer (BaseTokenizer): Tokenizer used to count tokens.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        overlap: int = 0,
+        tokenizer: str = "regex",
+        vocab_path: Optional[str] = None,
+        lowercase: bool = True,
+        cache_size: int = 65536,
+    ) -> None:
+        """
+        Initialize the TokenSplitter.
+
+        Args:
+            max_tokens (int): Maximum number of tokens per chunk. Must be greater than 0.
+            overlap (int): Tokens shared by consecutive chunks. Must be lower than
+                `max_tokens`.
+            tokenizer (str): "regex" or "wordpiece".
+            vocab_path (Optional[str]): Local vocabulary file of the "wordpiece" tokenizer.
+            lowercase (bool): Whether the "wordpiece" tokenizer is uncased.
+            cache_size (int): Number of distinct words whose token counts are cached.
+
+        Raises:
+            ValueError: If `max_tokens` or `overlap` are out of range, or if the tokenizer is
+                not supported.
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be greater than 0")
+        if overlap < 0 or overlap >= max_tokens:
+            raise ValueError("overlap must be >= 0 and lower than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap = overlap
+        self.tokenizer: BaseTokenizer = load_tokenizer(tokenizer, vocab_path, lowercase)
+        self._count_word = lru_cache(maxsize=cache_size)(self.tokenizer.count)
+
+    def split(self, text: str) -> List[str]:
+        """
+        Splits the text into chunks of up to `max_tokens` tokens.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            List[str]: A list of text chunks.
+        """
+        return self.split_spans(text).to_list()
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Splits the text into chunks of up to `max_tokens` tokens, given as offsets into it.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        return self.split_counted(text)[0]
+
+    def split_counted(self, text: str) -> Tuple[ChunkSpans, List[int]]:
+        """
+        Splits the text into chunks of up to `max_tokens` tokens and returns the number of
+        tokens of each chunk, as counted while filling it.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            Tuple[ChunkSpans, List[int]]: The spans of the chunks in `text` and their token
+                counts.
+        """
+        spans = ChunkSpans(text)
+        counts: List[int] = []
+        # Start, end and token count of the words of the chunk being filled.
+        words: Deque[Tuple[int, int, int]] = deque()
+        total = 0
+        for match in _WORD.finditer(text):
+            start, end = match.span()
+            tokens = self._count_word(match.group())
+            if tokens > self.max_tokens:
+                if words:
+                    spans.append(words[0][0], words[-1][1])
+                    counts.append(total)
+                    words.clear()
+                    total = 0
+                fragments = self._split_word(text, start, end)
+                for fragment_start, fragment_end, fragment_tokens in fragments[:-1]:
+                    spans.append(fragment_start, fragment_end)
+                    counts.append(fragment_tokens)
+                start, end, tokens = fragments[-1]
+            if words and total + tokens > self.max_tokens:
+                spans.append(words[0][0], words[-1][1])
+                counts.append(total)
+                total -= words.popleft()[2]
+                while words and (
+                    total > self.overlap or total + tokens > self.max_tokens
+                ):
+                    total -= words.popleft()[2]
+            words.append((start, end, tokens))
+            total += tokens
+        if words:
+            spans.append(words[0][0], words[-1][1])
+            counts.append(total)
+        return spans, counts
+
+    def _split_word(
+        self, text: str, start: int, end: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Splits the word `text[start:end]` into consecutive fragments of at most `max_tokens`
+        tokens, each as long as possible, and returns their spans and token counts.
+        """
+        # Ends of the basic tokens of the word, which covers the whole word.
+        bounds = [match.end() for match in TOKEN_PATTERN.finditer(text, start, end)]
+        fragments: List[Tuple[int, int, int]] = []
+        while start < end:
+            candidates = bounds[bisect_right(bounds, start) :]
+            fragment = self._longest_prefix(text, start, candidates)
+            if fragment is None:
+                # The next basic token alone is too long: cut it between characters.
+                characters = range(start + 1, candidates[0] + 1)
+                fragment = self._longest_prefix(text, start, characters)
+                if fragment is None:
+                    cut = start + 1
+                    fragment = cut, self.tokenizer.count(text[start:cut])
+            fragments.append((start, *fragment))
+            start = fragment[0]
+        return fragments
+
+    def _longest_prefix(
+        self, text: str, start: int, cuts: Sequence[int]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Binary-searches the last of the increasing `cuts` such that `text[start:cut]` has at
+        most `max_tokens` tokens, returning it with that count, or None if the first one
+        already has more.
+        """
+        best = None
+        low, high = 0, len(cuts) - 1
+        while low <= high:
+            middle = (low + high) // 2
+            tokens = self.tokenizer.count(text[start : cuts[middle]])
+            if tokens <= self.max_tokens:
+                best = cuts[middle], tokens
+                low = middle + 1
+            else:
+                high = middle - 1
+        return best
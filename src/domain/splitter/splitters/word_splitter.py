@@ -1,6 +1,10 @@
-from typing import List
+import re
+from typing import Iterator, List
 
-from src.domain.splitter.base_splitter import BaseSplitter
+from src.domain.splitter.base_splitter import BaseSplitter, TextSource, iter_pieces
+from src.domain.splitter.chunk_spans import ChunkSpans, group_spans
+
+_WORD = re.compile(r"\S+")
 
 
 class WordSplitter(BaseSplitter):
@@ -11,6 +15,8 @@ class WordSplitter(BaseSplitter):
     It is particularly useful for further processing that requires analysis at the word level.
     """
 
+    normalizes_whitespace = True
+
     def __init__(self, num_words: int = 10) -> None:
         """
         Initialize the splitter with the number of words per chunk.
@@ -39,3 +45,49 @@ class WordSplitter(BaseSplitter):
             group = " ".join(words[i : i + self.num_words])
             groups.append(group)
         return groups
+
+    def split_iter(self, text: TextSource) -> Iterator[str]:
+        """
+        Split the text, or consecutive pieces of it, into chunks of words, yielding each
+        chunk as soon as it has `num_words` words. A word cut by a piece boundary is
+        completed with the next piece.
+
+        Args:
+            text (TextSource): The text to split, or an iterable of consecutive pieces.
+
+        Yields:
+            str: The text chunks.
+        """
+        words: List[str] = []
+        carry = ""
+        for piece in iter_pieces(text):
+            if not piece:
+                continue
+            buffer = carry + piece
+            carry = ""
+            words.extend(buffer.split())
+            if words and not buffer[-1].isspace():
+                # The last word may continue in the next piece.
+                carry = words.pop()
+            while len(words) >= self.num_words:
+                yield " ".join(words[: self.num_words])
+                del words[: self.num_words]
+        if carry:
+            words.append(carry)
+        for i in range(0, len(words), self.num_words):
+            yield " ".join(words[i : i + self.num_words])
+
+    def split_spans(self, text: str) -> ChunkSpans:
+        """
+        Split the text into chunks of words given as offsets into it. Each chunk goes from
+        its first word to its last one, so it keeps the whitespace of the text between
+        words, which `split` normalizes to single spaces.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            ChunkSpans: The spans of the chunks in `text`.
+        """
+        words = (match.span() for match in _WORD.finditer(text))
+        return group_spans(text, words, self.num_words)
@@ -0,0 +1,165 @@
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+# CJK ideographs, which are not separated by spaces and are one token each (as in BERT).
+_CJK = (
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+    "\U00020000-\U0002a6df\U0002a700-\U0002ceaf\U0002f800-\U0002fa1f"
+)
+# Basic tokens: CJK ideographs, runs of other word characters and punctuation characters.
+TOKEN_PATTERN = re.compile(rf"[{_CJK}]|[^\W{_CJK}]+|[^\w\s]")
+
+
+class BaseTokenizer(ABC):
+    """
+    Counts the tokens of text, offline.
+
+    Tokenizers never merge tokens across whitespace, so the token count of a text is the sum of
+    the counts of its whitespace-separated words. `TokenSplitter` relies on this to count each
+    word once and add the counts up as chunks grow.
+    """
+
+    @abstractmethod
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Splits the text into tokens.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            List[str]: The tokens.
+        """
+        pass
+
+    def count(self, text: str) -> int:
+        """
+        Returns the number of tokens of the text.
+        """
+        return len(self.tokenize(text))
+
+
+class RegexTokenizer(BaseTokenizer):
+    """
+    Tokenizes text into words, single punctuation characters and single CJK ideographs. It
+    needs no vocabulary, and approximates the token counts of subword tokenizers on plain
+    prose from below.
+    """
+
+    def tokenize(self, text: str) -> List[str]:
+        return TOKEN_PATTERN.findall(text)
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in TOKEN_PATTERN.finditer(text))
+
+
+class WordPieceTokenizer(BaseTokenizer):
+    """
+    WordPiece tokenizer (as used by BERT-style embedding models) loaded from a local vocabulary
+    file with one token per line, such as the `vocab.txt` shipped with those models.
+
+    Text is split on whitespace, punctuation and around each CJK ideograph, optionally
+    lowercased with accents removed, and each word is split into the longest vocabulary
+    entries from the left, continuation pieces being prefixed with "##". Words that cannot be
+    split are one unknown token.
+
+    Attributes:
+        vocab (Dict[str, int]): Token to id.
+        lowercase (bool): Whether text is lowercased and accents removed (uncased models).
+        unk_token (str): Token of unknown words.
+        max_chars_per_word (int): Longer words are one unknown token.
+    """
+
+    def __init__(
+        self,
+        vocab_path: str,
+        lowercase: bool = True,
+        unk_token: str = "[UNK]",
+        max_chars_per_word: int = 100,
+    ) -> None:
+        """
+        Initialize the tokenizer from a vocabulary file.
+
+        Args:
+            vocab_path (str): Path to the vocabulary file, one token per line.
+            lowercase (bool): Lowercase text and remove accents.
+            unk_token (str): Token of unknown words.
+            max_chars_per_word (int): Longer words are one unknown token.
+
+        Raises:
+            FileNotFoundError: If the vocabulary file does not exist.
+        """
+        with open(vocab_path, encoding="utf-8") as f:
+            self.vocab: Dict[str, int] = {
+                line.rstrip("\n"): index for index, line in enumerate(f)
+            }
+        self.lowercase = lowercase
+        self.unk_token = unk_token
+        self.max_chars_per_word = max_chars_per_word
+
+    def tokenize(self, text: str) -> List[str]:
+        if self.lowercase:
+            text = _strip_accents(text.lower())
+        tokens: List[str] = []
+        for word in TOKEN_PATTERN.findall(text):
+            tokens.extend(self._word_pieces(word))
+        return tokens
+
+    def _word_pieces(self, word: str) -> List[str]:
+        """
+        Splits a word into the longest vocabulary entries, from the left.
+        """
+        if len(word) > self.max_chars_per_word:
+            return [self.unk_token]
+        pieces: List[str] = []
+        start = 0
+        while start < len(word):
+            end = len(word)
+            piece: Optional[str] = None
+            while start < end:
+                candidate = word[start:end] if start == 0 else "##" + word[start:end]
+                if candidate in self.vocab:
+                    piece = candidate
+                    break
+                end -= 1
+            if piece is None:
+                return [self.unk_token]
+            pieces.append(piece)
+            start = end
+        return pieces
+
+
+def _strip_accents(text: str) -> str:
+    """
+    Removes combining marks (accents) from the text.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+
+
+def load_tokenizer(
+    name: str = "regex", vocab_path: Optional[str] = None, lowercase: bool = True
+) -> BaseTokenizer:
+    """
+    Builds a tokenizer by name.
+
+    Args:
+        name (str): "regex" or "wordpiece".
+        vocab_path (Optional[str]): Vocabulary file, required by "wordpiece".
+        lowercase (bool): Whether "wordpiece" lowercases text and removes accents.
+
+    Returns:
+        BaseTokenizer: The tokenizer.
+
+    Raises:
+        ValueError: If the tokenizer is unknown or its vocabulary is missing.
+    """
+    if name == "regex":
+        return RegexTokenizer()
+    if name == "wordpiece":
+        if not vocab_path:
+            raise ValueError("The wordpiece tokenizer requires a vocab_path")
+        return WordPieceTokenizer(vocab_path, lowercase=lowercase)
+    raise ValueError(f"Unsupported tokenizer: {name}. Use 'regex' or 'wordpiece'")
@@ -0,0 +1,285 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class TextCache:
+    """
+    Two-tier (memory + disk) cache for text values, such as converted documents.
+
+    The memory tier is an LRU bounded by the approximate size of the stored strings. The
+    optional disk tier stores one file per key under `disk_path` and is bounded by the total
+    size of those files; the least recently used files are removed first. Both tiers drop
+    entries older than `ttl` seconds. Hits and misses are counted and exposed via `stats()`.
+
+    The memory tier is guarded by one lock and the disk tier by another, and files are read
+    and written outside both (a value is written to a temporary file, then moved into place
+    with `os.replace`), so memory lookups never wait for disk I/O.
+
+    Attributes:
+        memory_max_bytes (int): Maximum size of the memory tier.
+        disk_path (Optional[str]): Directory of the disk tier. If None, only memory is used.
+        disk_max_bytes (int): Maximum size of the disk tier.
+        ttl (Optional[float]): Seconds an entry stays valid. If None, entries never expire.
+    """
+
+    def __init__(
+        self,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        disk_max_bytes: int = 1024 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the cache. If `disk_path` is given, the directory is created and its
+        current content is accounted for in the disk size limit.
+
+        Args:
+            memory_max_bytes (int): Maximum size of the memory tier, in bytes.
+            disk_path (Optional[str]): Directory used by the disk tier.
+            disk_max_bytes (int): Maximum size of the disk tier, in bytes.
+            ttl (Optional[float]): Time-to-live of each entry, in seconds.
+        """
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_path = disk_path
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl = ttl
+
+        self._memory: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        if self.disk_path:
+            os.makedirs(self.disk_path, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a key, first in memory and then on disk. Disk hits are promoted to memory.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: The cached value, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, size, stored_at = entry
+                if not self._expired(stored_at, now):
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return value
+                self._memory_remove(key)
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._memory_put(key, value, now)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store a value in both tiers, evicting least recently used entries when needed.
+
+        Args:
+            key (str): Cache key.
+            value (str): Text to store.
+        """
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, value, now)
+        self._disk_put(key, value)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from both tiers and reset the counters.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for counter in self._counters:
+                self._counters[counter] = 0
+        with self._disk_lock:
+            for path, _, _ in self._disk_entries():
+                self._remove_file(path)
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: Hit and miss counters, hit rate, and the size of each tier.
+        """
+        with self._lock:
+            hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+            lookups = hits + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    # Memory tier.
+
+    def _memory_put(self, key: str, value: str, now: float) -> None:
+        size = sys.getsizeof(value)
+        if key in self._memory:
+            self._memory_remove(key)
+        if size > self.memory_max_bytes:
+            return
+        self._memory[key] = (value, size, now)
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes:
+            oldest = next(iter(self._memory))
+            self._memory_remove(oldest)
+
+    def _memory_remove(self, key: str) -> None:
+        _, size, _ = self._memory.pop(key)
+        self._memory_bytes -= size
+
+    # Disk tier. `_disk_bytes` is only updated under `_disk_lock`.
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self.disk_path, f"{key}.md")
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        if not self.disk_path:
+            return None
+        path = self._disk_file(key)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        if self._expired(stat.st_mtime, now):
+            with self._disk_lock:
+                self._disk_remove(path, stat.st_size)
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read()
+            # Touch the file so that disk eviction follows recency of use.
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted or replaced by another thread meanwhile.
+            return None
+        return value
+
+    def _disk_put(self, key: str, value: str) -> None:
+        if not self.disk_path:
+            return
+        path = self._disk_file(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            size = os.path.getsize(tmp_path)
+            with self._disk_lock:
+                try:
+                    previous = os.path.getsize(path)
+                except FileNotFoundError:
+                    previous = 0
+                os.replace(tmp_path, path)
+                self._disk_bytes += size - previous
+                if self._disk_bytes > self.disk_max_bytes:
+                    self._disk_evict()
+        except OSError as e:
+            logging.error(f"TextCache | Could not write {path}: {e}")
+            self._remove_file(tmp_path)
+
+    def _disk_evict(self) -> None:
+        now = time.time()
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        # Recount from the scan, which also corrects any drift from concurrent writers.
+        self._disk_bytes = sum(size for _, size, _ in entries)
+        for path, size, mtime in entries:
+            if self._disk_bytes <= self.disk_max_bytes and not self._expired(
+                mtime, now
+            ):
+                break
+            self._disk_remove(path, size)
+
+    def _disk_entries(self):
+        if not self.disk_path:
+            return
+        for name in os.listdir(self.disk_path):
+            if not name.endswith(".md"):
+                continue
+            path = os.path.join(self.disk_path, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def _disk_remove(self, path: str, size: int) -> None:
+        if self._remove_file(path):
+            self._disk_bytes -= size
+
+    @staticmethod
+    def _remove_file(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+
+_shared_caches: Dict[str, TextCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(
+    namespace: str = "default",
+    memory_max_mb: float = 64,
+    disk_path: Optional[str] = None,
+    disk_max_mb: float = 1024,
+    ttl: Optional[float] = None,
+) -> TextCache:
+    """
+    Return the process-wide TextCache for the given settings, creating it on first use.
+
+    Managers are often short-lived (e.g., one per API request), so the cache must outlive
+    them for the memory tier to be useful. Caches of different namespaces are never shared,
+    so that e.g. image captions do not compete with converted documents for one budget.
+
+    Args:
+        namespace (str): Name of the cache user, e.g. "reader" or "captions".
+        memory_max_mb (float): Maximum size of the memory tier, in megabytes.
+        disk_path (Optional[str]): Directory of the disk tier. If None, only memory is used.
+        disk_max_mb (float): Maximum size of the disk tier, in megabytes.
+        ttl (Optional[float]): Time-to-live of each entry, in seconds.
+
+    Returns:
+        TextCache: The shared cache instance.
+    """
+    key = json.dumps([namespace, memory_max_mb, disk_path, disk_max_mb, ttl])
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = TextCache(
+                memory_max_bytes=int(memory_max_mb * 1024 * 1024),
+                disk_path=disk_path,
+                disk_max_bytes=int(disk_max_mb * 1024 * 1024),
+                ttl=ttl,
+            )
+            _shared_caches[key] = cache
+        return cache
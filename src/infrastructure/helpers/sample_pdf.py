@@ -0,0 +1,65 @@
+from typing import List
+
+
+def write_sample_pdf(path: str, pages: int = 1, tables: bool = False) -> str:
+    """
+    Writes a PDF with `pages` pages of text. If `tables` is set, every page also contains
+    a ruled 4x3 table. The file is built by hand so that no PDF writer is required.
+
+    Used to warm up readers and by the benchmarks.
+
+    Args:
+        path (str): Destination file.
+        pages (int): Number of pages.
+        tables (bool): Whether to draw a ruled table on every page.
+
+    Returns:
+        str: The path of the written file.
+    """
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Page tree, filled once the page objects are known.
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for number in range(1, pages + 1):
+        lines = [b"BT /F1 10 Tf 14 TL 50 780 Td"]
+        for row in range(40):
+            text = f"Page {number} line {row}: lorem ipsum dolor sit amet consectetur."
+            lines.append(f"({text}) Tj T*".encode())
+        lines.append(b"ET")
+        if tables:
+            for row in range(5):
+                y = 150 + row * 20
+                lines.append(f"50 {y} m 350 {y} l S".encode())
+            for column in range(4):
+                x = 50 + column * 100
+                lines.append(f"{x} 150 m {x} 230 l S".encode())
+        stream = b"\n".join(lines)
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+    body = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for index, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (index, obj)
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        body += b"%010d 00000 n \n" % offset
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(bytes(body))
+    return path
@@ -0,0 +1,151 @@
+import codecs
+import mmap
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional
+
+
+class SpooledText:
+    """
+    Text buffer that spills to a temporary file once it grows past a threshold.
+
+    Text is appended piece by piece with `write`. Up to `max_memory` bytes of UTF-8 encoded
+    text are kept in memory; past that, everything is moved to an anonymous temporary file
+    (encoded as UTF-8) and later pieces are appended to it, so a huge converted document
+    never has to fit in memory. Consumers read it back block by block with `iter_text`, map
+    the encoded bytes with `mapped`, or materialize it with `read` when it is small enough.
+
+    Attributes:
+        max_memory (int): Number of bytes (UTF-8 encoded) kept in memory before spilling.
+        dir (Optional[str]): Directory of the temporary file (e.g. a large scratch disk).
+            None uses the system temp dir.
+        block_size (int): Number of bytes decoded per step by `iter_text`.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(
+        self,
+        max_memory: int = 64 * 1024 * 1024,
+        dir: Optional[str] = None,
+        block_size: int = 1024 * 1024,
+    ) -> None:
+        """
+        Initialize an empty buffer.
+
+        Args:
+            max_memory (int): Number of bytes (UTF-8 encoded) kept in memory before spilling.
+            dir (Optional[str]): Directory of the temporary file.
+            block_size (int): Number of bytes decoded per step by `iter_text`.
+
+        Raises:
+            ValueError: If `max_memory` is negative or `block_size` is lower than 1.
+        """
+        if max_memory < 0 or block_size < 1:
+            raise ValueError("max_memory must be >= 0 and block_size greater than 0")
+        self.max_memory = max_memory
+        self.dir = dir
+        self.block_size = block_size
+        self._pieces: List[str] = []
+        self._length = 0
+        self._size = 0
+        self._file: Optional[BinaryIO] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "SpooledText":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def rolled(self) -> bool:
+        """
+        Whether the text has been spilled to disk.
+        """
+        return self._file is not None
+
+    def write(self, text: str) -> None:
+        """
+        Appends text, spilling the buffer to disk if it grows past `max_memory`.
+        """
+        if not text:
+            return
+        self._length += len(text)
+        if self._file is not None:
+            self._file.write(text.encode(self.encoding))
+            return
+        self._pieces.append(text)
+        # ASCII text (checked in constant time) is as long in bytes as in characters.
+        self._size += len(text) if text.isascii() else len(text.encode(self.encoding))
+        if self._size > self.max_memory:
+            self._rollover()
+
+    def read(self) -> str:
+        """
+        Returns the whole text. This materializes it in memory, even if it was spilled.
+        """
+        if self._file is None:
+            if len(self._pieces) > 1:
+                self._pieces = ["".join(self._pieces)]
+            return self._pieces[0] if self._pieces else ""
+        return "".join(self.iter_text())
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Yields the text in consecutive pieces, decoding the spilled file `block_size` bytes
+        at a time.
+        """
+        if self._file is None:
+            yield from list(self._pieces)
+            return
+        self._file.flush()
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        with self.mapped() as data:
+            view = memoryview(data)
+            try:
+                for start in range(0, len(view), self.block_size):
+                    text = decoder.decode(view[start : start + self.block_size])
+                    if text:
+                        yield text
+                text = decoder.decode(b"", final=True)
+                if text:
+                    yield text
+            finally:
+                view.release()
+
+    @contextmanager
+    def mapped(self) -> Iterator:
+        """
+        Maps the UTF-8 encoded text read-only for the duration of the context. In-memory
+        text is encoded first.
+        """
+        if self._file is None:
+            yield self.read().encode(self.encoding)
+            return
+        self._file.flush()
+        if self._file.tell() == 0:  # Empty files cannot be mapped.
+            yield b""
+            return
+        data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+    def close(self) -> None:
+        """
+        Releases the memory and deletes the temporary file.
+        """
+        self._pieces = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rollover(self) -> None:
+        self._file = tempfile.TemporaryFile(mode="w+b", dir=self.dir)
+        for piece in self._pieces:
+            self._file.write(piece.encode(self.encoding))
+        self._pieces = []
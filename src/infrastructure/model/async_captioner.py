@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import re
+import threading
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.helpers.cache import TextCache
+from src.infrastructure.model.caption_cache import caption_key, completion_response
+
+# A recorded caption request: cache key, model, messages and other request options.
+CaptionRequest = Tuple[str, str, List[Dict], Dict]
+
+
+class RecordingCaptionClient:
+    """
+    Stands in for the LLM client during a conversion, so that images can be captioned later.
+
+    Each `chat.completions.create` call is recorded and answered with a unique placeholder
+    token (a single alphanumeric word, so it survives the converters' alt-text clean-up).
+    Identical images share one token, and images already described in `cache` are answered
+    with their description straight away.
+
+    Attributes:
+        cache (Optional[TextCache]): Store of image descriptions, as used by
+            `CachedCaptionClient`.
+        requests (Dict[str, CaptionRequest]): Recorded requests by placeholder token.
+    """
+
+    def __init__(self, cache: Optional[TextCache] = None) -> None:
+        self.cache = cache
+        self.requests: Dict[str, CaptionRequest] = {}
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self._tokens: Dict[str, str] = {}
+        self._prefix = f"CAPTION{uuid.uuid4().hex}"
+
+    def create(self, *, model: str, messages: List[Dict], **kwargs) -> Any:
+        """
+        Records a caption request and returns its placeholder as the response content.
+
+        Raises:
+            ValueError: If the request does not contain any image.
+        """
+        key = caption_key(model, messages, kwargs)
+        if key is None:
+            raise ValueError("Only image caption requests can be deferred")
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return completion_response(cached)
+        token = self._tokens.get(key)
+        if token is None:
+            token = self._tokens[key] = f"{self._prefix}N{len(self._tokens)}X"
+            self.requests[token] = (key, model, messages, kwargs)
+        return completion_response(token)
+
+
+class AsyncCaptioner:
+    """
+    Captions the images of a document concurrently with an async OpenAI-compatible client.
+
+    Requests run on a dedicated event loop thread, so the captioner can be used from
+    synchronous code (including threads that already run an event loop) and the client keeps
+    its connection pool across documents. At most `concurrency` requests are in flight.
+
+    The client is bound to that loop, so the captioner takes ownership of it: give each
+    captioner its own client, and call `close` to close it and stop the loop thread.
+
+    Attributes:
+        client: An async OpenAI-compatible client (`openai.AsyncOpenAI`,
+            `openai.AsyncAzureOpenAI`...), owned by the captioner.
+        concurrency (int): Maximum number of concurrent requests.
+        cache (Optional[TextCache]): Store where descriptions are saved.
+    """
+
+    def __init__(
+        self, client: Any, concurrency: int = 8, cache: Optional[TextCache] = None
+    ) -> None:
+        """
+        Initialize the captioner.
+
+        Args:
+            client: An async OpenAI-compatible client, not shared with other captioners.
+            concurrency (int): Maximum number of concurrent requests.
+            cache (Optional[TextCache]): Store where descriptions are saved.
+
+        Raises:
+            ValueError: If `concurrency` is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0")
+        self.client = client
+        self.concurrency = concurrency
+        self.cache = cache
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def caption(self, requests: Dict[str, CaptionRequest]) -> Dict[str, str]:
+        """
+        Runs the recorded requests concurrently.
+
+        Args:
+            requests (Dict[str, CaptionRequest]): Requests by placeholder token, as recorded
+                by `RecordingCaptionClient`.
+
+        Returns:
+            Dict[str, str]: The description of each token. Failed requests yield "".
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._caption_all(requests), self._event_loop()
+        )
+        return future.result()
+
+    def close(self) -> None:
+        """
+        Closes the client and stops the event loop thread. Safe to call more than once.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        except Exception as e:
+            logging.warning(f"Failed to close the caption client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def _close_client(self) -> None:
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+
+    async def _caption_all(self, requests: Dict[str, CaptionRequest]) -> Dict[str, str]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def caption_one(token: str, request: CaptionRequest) -> Tuple[str, str]:
+            key, model, messages, options = request
+            async with semaphore:
+                try:
+                    response = await self.client.chat.completions.create(
+                        model=model, messages=messages, **options
+                    )
+                    content = response.choices[0].message.content or ""
+                except Exception as e:
+                    logging.warning(f"Image caption request failed: {e}")
+                    return token, ""
+            if content and self.cache is not None:
+                self.cache.put(key, content)
+            return token, content
+
+        results = await asyncio.gather(
+            *(caption_one(token, request) for token, request in requests.items())
+        )
+        return dict(results)
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="async-captioner", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+
+def splice_captions(markdown: str, captions: Dict[str, str]) -> str:
+    """
+    Replaces placeholder tokens with their captions.
+
+    Captions that land in a Markdown image alt text (`![...](...)`) are cleaned up the way
+    MarkItDown cleans alt texts: no brackets or line breaks, and collapsed whitespace.
+
+    Args:
+        markdown (str): Converted document containing placeholder tokens.
+        captions (Dict[str, str]): Caption of each token.
+
+    Returns:
+        str: The document with the captions in place.
+    """
+    if not captions:
+        return markdown
+    tokens = "|".join(re.escape(token) for token in captions)
+    pattern = re.compile(f"({tokens})( ?)")
+
+    def replace(match: re.Match) -> str:
+        caption = captions[match.group(1)].strip()
+        line_start = markdown.rfind("\n", 0, match.start()) + 1
+        prefix = markdown[line_start : match.start()]
+        in_alt_text = "![" in prefix and "](" not in prefix[prefix.rfind("![") :]
+        if in_alt_text:
+            caption = re.sub(r"\s+", " ", re.sub(r"[\r\n\[\]]", " ", caption)).strip()
+            # Drop the separator before the native alt text if the caption is empty.
+            return caption + match.group(2) if caption else ""
+        return caption + match.group(2)
+
+    return pattern.sub(replace, markdown)
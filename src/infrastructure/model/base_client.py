@@ -21,6 +21,15 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    def get_async_client(self) -> Optional[object]:
+        """
+        Returns a new asyncio-compatible client for the same service, if supported.
+
+        Async clients are bound to the event loop they first run on, so each call builds a
+        separate client (with its own connection pool) that the caller owns and closes.
+        """
+        return None
+
     def is_enabled(self) -> bool:
         """
         Returns True if the client is active.
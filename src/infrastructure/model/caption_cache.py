@@ -0,0 +1,151 @@
+import base64
+import hashlib
+import json
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.helpers.cache import TextCache
+
+
+class CachedCaptionClient:
+    """
+    Wraps an OpenAI-compatible client so that each distinct image is described only once.
+
+    MarkItDown captions images with `client.chat.completions.create(model=..., messages=...)`,
+    sending the image as a base64 data URI. This proxy exposes the same call: requests that
+    contain images are keyed by the model, the text of the prompt and the SHA-256 of the
+    decoded image bytes, and their answers are stored in a `TextCache` (memory and disk
+    tiers, with size-based eviction and TTL). Concurrent requests for the same image wait for
+    the first one instead of calling the API again. Requests without images, and any other
+    attribute of the client, are passed through unchanged.
+
+    Attributes:
+        client: The wrapped OpenAI or AzureOpenAI client.
+        cache (TextCache): Store of image descriptions.
+        deduplicated (int): Requests answered by waiting on an identical in-flight request.
+    """
+
+    def __init__(self, client: Any, cache: TextCache) -> None:
+        """
+        Initialize the proxy.
+
+        Args:
+            client: An OpenAI-compatible client (`openai.OpenAI`, `openai.AzureOpenAI`...).
+            cache (TextCache): Store of image descriptions.
+        """
+        self.client = client
+        self.cache = cache
+        self.deduplicated = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def create(self, *, model: str, messages: List[Dict], **kwargs) -> Any:
+        """
+        Drop-in replacement for `client.chat.completions.create`.
+
+        Args:
+            model (str): Model or deployment name.
+            messages (List[Dict]): Chat messages, possibly with `image_url` parts.
+            **kwargs: Other request options, forwarded to the client.
+
+        Returns:
+            Any: The client response, or a minimal response object with
+                `choices[0].message.content` when served from the cache.
+        """
+        key = caption_key(model, messages, kwargs)
+        if key is None:
+            return self.client.chat.completions.create(
+                model=model, messages=messages, **kwargs
+            )
+
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return completion_response(cached)
+            with self._lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    break
+                self.deduplicated += 1
+            # Another thread is describing the same image: wait and read its answer.
+            event.wait()
+
+        try:
+            response = self.client.chat.completions.create(
+                model=model, messages=messages, **kwargs
+            )
+            content = response.choices[0].message.content
+            if isinstance(content, str):
+                self.cache.put(key, content)
+            return response
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the cache statistics (see `TextCache.stats`) plus in-flight dedup count.
+        """
+        return {**self.cache.stats(), "deduplicated": self.deduplicated}
+
+
+def caption_key(model: str, messages: List[Dict], options: Dict) -> Optional[str]:
+    """
+    Builds the cache key of a chat request that contains images.
+
+    Args:
+        model (str): Model or deployment name.
+        messages (List[Dict]): Chat messages.
+        options (Dict): Other request options.
+
+    Returns:
+        Optional[str]: A SHA-256 hex digest, or None if the request has no image.
+    """
+    digest = hashlib.sha256()
+    parts: List[Any] = [model, options]
+    has_image = False
+    for message in messages:
+        content = message.get("content")
+        if not isinstance(content, list):
+            parts.append([message.get("role"), content])
+            continue
+        for part in content:
+            if part.get("type") == "image_url":
+                has_image = True
+                parts.append(["image", _image_digest(part["image_url"]["url"])])
+            else:
+                parts.append([message.get("role"), part])
+    if not has_image:
+        return None
+    digest.update(json.dumps(parts, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _image_digest(url: str) -> str:
+    """
+    Hashes the decoded bytes of a data URI, or the URL itself for remote images.
+    """
+    if url.startswith("data:") and ";base64," in url:
+        try:
+            data = base64.b64decode(url.split(";base64,", 1)[1])
+        except ValueError:
+            logging.warning("Could not decode image data URI, hashing it as is")
+        else:
+            return hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def completion_response(content: str) -> SimpleNamespace:
+    """
+    Builds a minimal chat completion response around cached content.
+    """
+    message = SimpleNamespace(role="assistant", content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(index=0, message=message)])
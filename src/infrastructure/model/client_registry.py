@@ -0,0 +1,53 @@
+import threading
+from typing import Callable, Dict, Hashable
+
+from src.infrastructure.model.base_client import BaseLLMClient
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of service clients (OpenAI, Azure OpenAI, Textract...).
+
+    SDK clients own an HTTP connection pool, so building one per request throws away warm
+    connections and pays client construction and TLS handshakes again. The registry builds
+    each client once per key and hands the same instance to every caller; the SDK clients
+    are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Hashable, BaseLLMClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], BaseLLMClient]) -> BaseLLMClient:
+        """
+        Return the client registered under `key`, building it with `factory` if needed.
+
+        Args:
+            key (Hashable): Identifier of the client, e.g. "openai".
+            factory (Callable[[], BaseLLMClient]): Builds the client on a miss.
+
+        Returns:
+            BaseLLMClient: The shared client.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """
+        Drop every registered client. New clients are built on the next `get`.
+        """
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._clients
+
+
+client_registry = ClientRegistry()
@@ -0,0 +1,56 @@
+import os
+
+import httpx
+
+# Connection pool of the HTTP clients used by the OpenAI and Azure OpenAI SDKs. Connections
+# are kept alive between requests, so that TLS handshakes are paid once per connection.
+MAX_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY: float = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60"))
+
+# Connection pool of the boto3 clients (e.g., Textract). It should be at least as large as
+# the number of concurrent calls (see `TextractReader.concurrency`).
+AWS_MAX_POOL_CONNECTIONS: int = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "32"))
+
+
+def http_limits() -> httpx.Limits:
+    """
+    Returns the connection pool limits of the LLM HTTP clients.
+    """
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def build_http_client() -> httpx.Client:
+    """
+    Returns a pooled HTTP client for the synchronous OpenAI SDK clients.
+    """
+    import openai
+
+    return openai.DefaultHttpxClient(limits=http_limits())
+
+
+def build_async_http_client() -> httpx.AsyncClient:
+    """
+    Returns a pooled HTTP client for the asynchronous OpenAI SDK clients.
+    """
+    import openai
+
+    return openai.DefaultAsyncHttpxClient(limits=http_limits())
+
+
+def build_boto_config():
+    """
+    Returns the botocore configuration of the AWS clients: a larger connection pool, TCP
+    keep-alive and standard retries.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "standard"},
+    )
@@ -1,8 +1,7 @@
 from typing import Optional
 
 from src.infrastructure.model.base_client import BaseLLMClient
-from src.infrastructure.model.models.azure_client import AzureOpenAIClient
-from src.infrastructure.model.models.openai_client import OpenAIClient
+from src.infrastructure.model.client_registry import client_registry
 
 
 class LLMClient:
@@ -16,6 +15,9 @@ class LLMClient:
       - **azure**: Uses `AzureOpenAIClient` to interface with Azure OpenAI service.
       - **none**: Disables client functionality (no LLM client is instantiated).
 
+    The underlying clients are process-wide singletons (see `ClientRegistry`): every
+    LLMClient with the same method shares one SDK client and its connection pool.
+
     The class provides helper methods to:
       - Retrieve the underlying client instance.
       - Get the model name associated with the client.
@@ -36,10 +38,19 @@ class LLMClient:
             ValueError: If an unsupported method is provided.
         """
         self.method = method.lower()
+        # Client modules import the openai SDK, so they are only loaded when needed.
         if self.method == "openai":
-            self.client_instance: Optional[BaseLLMClient] = OpenAIClient()
+            from src.infrastructure.model.models.openai_client import OpenAIClient
+
+            self.client_instance: Optional[BaseLLMClient] = client_registry.get(
+                "openai", OpenAIClient
+            )
         elif self.method == "azure":
-            self.client_instance: Optional[BaseLLMClient] = AzureOpenAIClient()
+            from src.infrastructure.model.models.azure_client import AzureOpenAIClient
+
+            self.client_instance: Optional[BaseLLMClient] = client_registry.get(
+                "azure", AzureOpenAIClient
+            )
         elif self.method == "none":
             self.client_instance = None
         else:
@@ -58,6 +69,20 @@ class LLMClient:
             return None
         return self.client_instance.get_client()
 
+    def get_async_client(self) -> Optional[object]:
+        """
+        Builds a new asyncio-compatible client for the same service.
+
+        Unlike `get_client`, the result is not shared: async clients are bound to the event
+        loop they run on, so the caller owns it and closes it.
+
+        Returns:
+            Optional[object]: The async client if available; otherwise, None.
+        """
+        if self.client_instance is None:
+            return None
+        return self.client_instance.get_async_client()
+
     def get_model(self) -> Optional[str]:
         """
         Retrieves the model name used by the LLM client.
@@ -1,24 +1,42 @@
 import openai
 
-from src.application.api.config import settings
+from src.application.api.config import get_settings
 from src.infrastructure.model.base_client import BaseLLMClient
+from src.infrastructure.model.connection_pool import (
+    build_async_http_client,
+    build_http_client,
+)
 
 
 class AzureOpenAIClient(BaseLLMClient):
     """
     Client for interacting with Azure OpenAI.
+
+    The SDK clients use pooled keep-alive HTTP connections (see `connection_pool`). Get the
+    process-wide instance through `LLMClient` rather than building one per request.
     """
 
     def __init__(self):
+        settings = get_settings()
         self.client = openai.AzureOpenAI(
             api_key=settings.azure_openai_api_key,
             api_version=settings.azure_openai_api_version,
             azure_endpoint=settings.azure_openai_endpoint,
+            http_client=build_http_client(),
         )
         self.model = settings.azure_openai_deployment
 
     def get_client(self) -> object:
         return self.client
 
+    def get_async_client(self) -> object:
+        settings = get_settings()
+        return openai.AsyncAzureOpenAI(
+            api_key=settings.azure_openai_api_key,
+            api_version=settings.azure_openai_api_version,
+            azure_endpoint=settings.azure_openai_endpoint,
+            http_client=build_async_http_client(),
+        )
+
     def get_model(self) -> str:
         return self.model
@@ -0,0 +1,57 @@
+import io
+import time
+from typing import Dict, List, Optional
+
+from src.infrastructure.model.base_client import BaseLLMClient
+
+
+class LocalTextractClient(BaseLLMClient):
+    """
+    Offline stand-in for the AWS Textract client, meant for tests and throughput benchmarks.
+
+    It implements `detect_document_text` with the same request and response shape as boto3:
+    text lines are extracted locally with pdfplumber and returned as LINE blocks. Like the
+    synchronous Textract API, only the first page of a PDF is analyzed. An optional `latency`
+    simulates the network round trip of each call.
+
+    Attributes:
+        latency (float): Seconds each call sleeps before answering.
+        calls (int): Number of `detect_document_text` calls served.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.model = None
+
+    def get_client(self) -> object:
+        return self
+
+    def get_model(self) -> Optional[str]:
+        return self.model
+
+    def detect_document_text(self, Document: Dict) -> Dict:
+        """
+        Mimics `textract.detect_document_text`.
+
+        Args:
+            Document (Dict): A dictionary with the document content under "Bytes".
+
+        Returns:
+            Dict: A Textract-like response with PAGE and LINE blocks.
+        """
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        file_bytes = Document["Bytes"]
+        blocks: List[Dict] = [{"BlockType": "PAGE", "Page": 1}]
+        if file_bytes.startswith(b"%PDF"):
+            import pdfplumber
+
+            with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+                lines = pdf.pages[0].extract_text_lines(return_chars=False)
+            blocks.extend(
+                {"BlockType": "LINE", "Page": 1, "Text": line["text"]} for line in lines
+            )
+        return {"DocumentMetadata": {"Pages": 1}, "Blocks": blocks}
@@ -5,6 +5,10 @@ import openai
 from dotenv import load_dotenv
 
 from src.infrastructure.model.base_client import BaseLLMClient
+from src.infrastructure.model.connection_pool import (
+    build_async_http_client,
+    build_http_client,
+)
 
 load_dotenv()
 
@@ -12,14 +16,25 @@ load_dotenv()
 class OpenAIClient(BaseLLMClient):
     """
     Client for interacting with OpenAI.
+
+    The SDK clients use pooled keep-alive HTTP connections (see `connection_pool`). Get the
+    process-wide instance through `LLMClient` rather than building one per request.
     """
 
     def __init__(self):
-        self.client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.client = openai.OpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"), http_client=build_http_client()
+        )
         self.model = os.environ.get("OPENAI_MODEL")
 
     def get_client(self) -> object:
         return self.client
 
+    def get_async_client(self) -> object:
+        return openai.AsyncOpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            http_client=build_async_http_client(),
+        )
+
     def get_model(self) -> Optional[str]:
         return self.model
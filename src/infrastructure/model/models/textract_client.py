@@ -4,6 +4,8 @@ from typing import Optional
 import boto3
 
 from src.infrastructure.model.base_client import BaseLLMClient
+from src.infrastructure.model.client_registry import client_registry
+from src.infrastructure.model.connection_pool import build_boto_config
 
 
 class TextractClient(BaseLLMClient):
@@ -15,6 +17,9 @@ class TextractClient(BaseLLMClient):
     - AWS_SECRET_ACCESS_KEY
     - AWS_SESSION_TOKEN (optional)
     - AWS_REGION (e.g. 'us-east-1')
+
+    The boto3 client keeps a pool of `AWS_MAX_POOL_CONNECTIONS` keep-alive connections (see
+    `connection_pool`). Get the process-wide instance through `TextractClient.shared()`.
     """
 
     def __init__(self):
@@ -24,9 +29,17 @@ class TextractClient(BaseLLMClient):
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
             aws_session_token=os.getenv("AWS_SESSION_TOKEN"),  # optional
             region_name=os.getenv("AWS_REGION", "us-east-1"),  # fallback region
+            config=build_boto_config(),
         )
         self.model = None
 
+    @classmethod
+    def shared(cls) -> "TextractClient":
+        """
+        Returns the process-wide TextractClient, building it on first use.
+        """
+        return client_registry.get("textract", cls)
+
     def get_client(self) -> object:
         return self.client
 
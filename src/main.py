@@ -44,10 +44,13 @@ class Application:
     def run(self) -> None:
         """
         Executes the main application workflow:
-        - Reads all files in the input directory.
-        - Converts each file to markdown text using the configured reader.
-        - Splits the text into chunks based on the configured splitter.
-        - Saves the resulting chunks to the output directory.
+        - Reads all files in the input directory, in batches of `file_io.batch_size`.
+        - Converts each batch to markdown text using the configured reader (readers that
+          support it, such as Docling, convert the whole batch in one run). Outputs larger
+          than `reader.spill.max_memory_mb` are spilled to disk.
+        - Splits the text into chunks based on the configured splitter, streaming it from
+          the spilled output.
+        - Saves the resulting chunks to the output directory as they are produced.
 
         If the input directory is missing or contains no valid files, an error is logged.
         """
@@ -67,27 +70,22 @@ class Application:
             return
 
         splitter_method = self.config.get("splitter", {}).get("method", "unknown")
-
-        for file in files:
-            input_file = os.path.join(input_path, file)
-            if not os.path.isfile(input_file):
-                continue
-
-            logging.info(f"Processing file: {input_file}")
-            try:
-                markdown_text = self.read_manager.read_file(file)
-            except Exception as e:
-                logging.error(f"Error reading file {input_file}: {e}")
-                continue
-
-            chunks = self.split_manager.split_text(markdown_text)
-            logging.info(f"Generated {len(chunks)} chunks from the file.")
-
-            basename = os.path.basename(input_file)
-            base_filename, original_extension = os.path.splitext(basename)
-            self.chunk_manager.save_chunks(
-                chunks, base_filename, original_extension, splitter_method
-            )
+        batch_size = self.config.get("file_io", {}).get("batch_size", 64)
+
+        files = [
+            file for file in files if os.path.isfile(os.path.join(input_path, file))
+        ]
+        for start in range(0, len(files), batch_size):
+            batch = files[start : start + batch_size]
+            logging.info(f"Processing files: {', '.join(batch)}")
+            for file, spooled in self.read_manager.iter_files_spooled(batch):
+                with spooled:
+                    chunks = self.split_manager.split_iter(spooled.iter_text())
+                    base_filename, original_extension = os.path.splitext(file)
+                    saved = self.chunk_manager.save_chunks(
+                        chunks, base_filename, original_extension, splitter_method
+                    )
+                logging.info(f"Generated {len(saved)} chunks from the file {file}.")
 
 
 def main(config_file: str = "config.yaml") -> None:
@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.application.api.routers.health import router as health_router
+from src.application.api.warmup import ReaderWarmup
 
 
 @pytest.fixture
@@ -36,3 +37,32 @@ def test_health_check(client: TestClient) -> None:
     assert timestamp is not None
     # Verify that the timestamp can be parsed as an ISO formatted datetime.
     datetime.datetime.fromisoformat(timestamp)
+
+
+def test_readiness_without_warmup(client: TestClient) -> None:
+    """
+    Test that the service is ready when no warm-up was started.
+    """
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_readiness_reports_warmup(app: FastAPI, client: TestClient) -> None:
+    """
+    Test that the readiness endpoint answers 503 until the warm-up has finished, and then
+    reports the warm-up time of each reader and the readers that failed.
+    """
+    app.state.warmup = ReaderWarmup(["custom", "unknown"])
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming_up"
+
+    app.state.warmup.run()
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert set(data["readers"]) == {"custom"}
+    assert set(data["errors"]) == {"unknown"}
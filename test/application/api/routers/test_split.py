@@ -138,3 +138,152 @@ def test_split_invalid_params(client):
     # Assuming your splitting logic validates and rejects negative num_words,
     # expect a 400 error.
     assert response.status_code == 400
+
+
+# 6. Test that a reader profile the reader does not support is rejected
+def test_split_unsupported_reader_profile(client):
+    with open("data/test/input/test_1.pdf", "rb") as file:
+        response = client.post(
+            "/split",
+            data={
+                "document_path": "data/test/input",
+                "split_method": "word",
+                "download_zip": "false",
+                "ocr_method": "none",
+                "chunk_path": "data/test/output",
+                "reader_method": "pdfplumber",
+                "reader_profile": "balanced",
+            },
+            files={"file": ("test_1.pdf", file, "application/pdf")},
+        )
+    assert response.status_code == 400
+    assert "balanced" in response.json()["detail"]
+
+
+# 7. Test that a reader profile is applied and reported
+def test_split_reader_profile(client):
+    with open("data/test/input/test_1.pdf", "rb") as file:
+        response = client.post(
+            "/split",
+            data={
+                "document_path": "data/test/input",
+                "split_method": "word",
+                "download_zip": "false",
+                "ocr_method": "none",
+                "chunk_path": "data/test/output",
+                "reader_method": "pdfplumber",
+                "reader_profile": "fast",
+            },
+            files={"file": ("test_1.pdf", file, "application/pdf")},
+        )
+    assert response.status_code == 200
+    assert response.json()["reader_profile"] == "fast"
+
+
+# 8. Test that chunk spans are returned as offsets of the returned chunks
+def test_split_chunk_spans(client):
+    with open("data/test/input/test_1.md", "rb") as file:
+        response = client.post(
+            "/split",
+            data={
+                "document_path": "data/test/input",
+                "split_method": "fixed",
+                "split_params": json.dumps({"size": 100}),
+                "download_zip": "false",
+                "ocr_method": "none",
+                "chunk_path": "data/test/output",
+                "reader_method": "custom",
+                "chunk_spans": "true",
+            },
+            files={"file": ("test_1.md", file, "text/markdown")},
+        )
+    assert response.status_code == 200
+    data = response.json()
+    spans = data["chunk_spans"]
+    assert len(spans) == len(data["chunks"])
+    assert spans[0][0] == 0
+    for (start, end), chunk in zip(spans, data["chunks"]):
+        assert end - start == len(chunk)
+
+
+# 9. Test that the token split method returns the token count of each chunk
+def test_split_token_counts(client):
+    with open("data/test/input/test_1.md", "rb") as file:
+        response = client.post(
+            "/split",
+            data={
+                "document_path": "data/test/input",
+                "split_method": "token",
+                "split_params": json.dumps({"max_tokens": 50, "overlap": 5}),
+                "download_zip": "false",
+                "ocr_method": "none",
+                "chunk_path": "data/test/output",
+                "reader_method": "custom",
+            },
+            files={"file": ("test_1.md", file, "text/markdown")},
+        )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["chunk_spans"] is None
+    assert len(data["token_counts"]) == len(data["chunks"])
+    assert all(0 < count <= 50 for count in data["token_counts"])
+
+
+# 10. Test that the OCR concurrency reaches the ReadManager configuration
+def test_split_ocr_concurrency(client, monkeypatch):
+    from src.application.api.routers import split
+
+    configs = []
+    read_manager_class = split.ReadManager
+
+    def recording_read_manager(config):
+        configs.append(config)
+        return read_manager_class(config=config)
+
+    monkeypatch.setattr(split, "ReadManager", recording_read_manager)
+    data = {
+        "document_path": "data/test/input/test_1.md",
+        "split_method": "word",
+        "ocr_method": "none",
+        "chunk_path": "data/test/output",
+        "reader_method": "custom",
+    }
+    assert client.post("/split", data=data).status_code == 200
+    assert configs[-1]["ocr"]["concurrency"] == split.DEFAULT_OCR_CONCURRENCY
+
+    data["ocr_concurrency"] = "3"
+    assert client.post("/split", data=data).status_code == 200
+    assert configs[-1]["ocr"]["concurrency"] == 3
+
+    data["ocr_concurrency"] = "0"
+    assert client.post("/split", data=data).status_code == 422
+
+
+def test_split_caption_cache_is_separate():
+    from src.application.api.routers.split import ReadManager, build_read_config
+
+    read_manager = ReadManager(config=build_read_config("data/input", "none", "custom"))
+    assert read_manager.cache is not None and read_manager.caption_cache is not None
+    assert read_manager.caption_cache is not read_manager.cache
+    assert (
+        read_manager.caption_cache.memory_max_bytes
+        < read_manager.cache.memory_max_bytes
+    )
+
+
+# 11. Test that chunk spans do not change the chunks of normalizing split methods
+def test_split_chunk_spans_keep_chunks(client):
+    data = {
+        "document_path": "data/test/input/test_1.md",
+        "split_method": "sentence",
+        "split_params": json.dumps({"num_sentences": 2}),
+        "ocr_method": "none",
+        "chunk_path": "data/test/output",
+        "reader_method": "custom",
+    }
+    plain = client.post("/split", data=data).json()
+    with_spans = client.post("/split", data={**data, "chunk_spans": "true"}).json()
+
+    assert with_spans["chunks"] == plain["chunks"]
+    assert plain["chunk_spans"] is None
+    assert len(with_spans["chunk_spans"]) == len(plain["chunks"])
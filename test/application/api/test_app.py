@@ -12,3 +12,15 @@ def test_root():
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Document Splitter API is running"}
+
+
+def test_startup_warms_up_readers(monkeypatch):
+    """
+    Test that starting the app warms up the readers listed in WARMUP_READERS.
+    """
+    monkeypatch.setenv("WARMUP_READERS", "custom")
+    with TestClient(app) as started:
+        assert app.state.warmup.wait(timeout=30)
+        response = started.get("/health/ready")
+    assert response.status_code == 200
+    assert set(response.json()["readers"]) == {"custom"}
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+
+# Libraries that must only be imported when the reader, splitter or client using them is.
+HEAVY_MODULES = [
+    "docling",
+    "markitdown",
+    "pdfplumber",
+    "langchain_text_splitters",
+    "openai",
+    "boto3",
+    "torch",
+]
+
+PROBE = """
+import json, sys
+import src.application.api.app
+from src.domain.reader.read_manager import ReadManager
+from src.domain.splitter.split_manager import SplitManager
+from src.domain.chunker.chunk_manager import ChunkManager
+print(json.dumps(sorted(set(sys.argv[1:]) & set(sys.modules))))
+"""
+
+
+def test_api_import_does_not_load_heavy_libraries():
+    """
+    Importing the API and the managers must not import any reader backend or SDK, nor need
+    the LLM settings: they are loaded on first use.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("AZURE_OPENAI_", "OPENAI_"))
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, *HEAVY_MODULES],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -91,6 +91,15 @@ class TestChunkManager:
             assert content == chunks[i - 1], f"File {filepath} content mismatch."
         print("[test_save_chunks] Test completed successfully.")
 
+    def test_save_byte_chunks(self, chunk_manager):
+        """UTF-8 byte chunks are written as they are."""
+        chunks = [memoryview("ñandú ".encode("utf-8")), "€ end".encode("utf-8")]
+        saved_files = chunk_manager.save_chunks(chunks, "bytes_file", ".txt", "fixed")
+        assert len(saved_files) == 2
+        for filepath, chunk in zip(saved_files, chunks):
+            with open(filepath, "rb") as f:
+                assert f.read() == bytes(chunk)
+
     def test_process_file_invalid_format(self, test_config):
         config_data, _ = test_config
         print(
@@ -0,0 +1,101 @@
+import io
+
+import pytest
+
+from src.domain.reader.readers.custom_reader import CustomReader
+
+TEXT = "# Título\n\nCafé, crème brûlée and naïve façade.  \n\n\n\nEnd\n"
+
+
+@pytest.fixture
+def reader():
+    return CustomReader()
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "utf-32"])
+def test_convert_detects_encoding(reader, tmp_path, encoding):
+    """Test that UTF-8 and BOM-marked encodings are detected and decoded."""
+    file_path = tmp_path / "doc.md"
+    file_path.write_bytes(TEXT.encode(encoding))
+    assert reader.convert(str(file_path)) == TEXT
+
+
+def test_convert_falls_back_to_cp1252(reader, tmp_path):
+    """Test that non UTF-8 content is decoded with the fallback encoding."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes("Café – “quoted”".encode("cp1252"))
+    assert reader.convert(str(file_path)) == "Café – “quoted”"
+
+
+def test_convert_invalid_utf8_past_the_sample(tmp_path):
+    """Test the fallback when the bytes after the sampled prefix are not UTF-8."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes(b"a" * 100 + "é".encode("cp1252"))
+    reader = CustomReader(sample_size=10)
+    assert reader.convert(str(file_path)) == "a" * 100 + "é"
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 5, 1024])
+def test_iter_text_falls_back_like_convert(tmp_path, block_size):
+    """Test that iter_text decodes invalid UTF-8 past the sample exactly as convert does."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes("añ€".encode("utf-8") * 10 + "Ça “x”".encode("cp1252"))
+    reader = CustomReader(sample_size=10, block_size=block_size)
+    expected = "añ€" * 10 + "Ça “x”"
+    assert reader.convert(str(file_path)) == expected
+    assert "".join(reader.iter_text(str(file_path))) == expected
+
+
+def test_sample_cut_inside_a_character(tmp_path):
+    """Test that a sample ending inside a multi-byte character still counts as UTF-8."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes("aé".encode("utf-8"))
+    assert CustomReader(sample_size=2).convert(str(file_path)) == "aé"
+
+
+def test_forced_encoding(tmp_path):
+    """Test that a configured encoding skips detection."""
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes("Ça".encode("latin-1"))
+    assert CustomReader(encoding="latin-1").convert(str(file_path)) == "Ça"
+
+
+def test_empty_file(reader, tmp_path):
+    """Test that empty files are read as an empty string."""
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+    assert reader.convert(str(file_path)) == ""
+    assert list(reader.iter_text(str(file_path))) == []
+
+
+def test_iter_text_matches_convert(tmp_path):
+    """Test that decoding in small blocks splits no character."""
+    file_path = tmp_path / "doc.md"
+    file_path.write_bytes(TEXT.encode("utf-8"))
+    reader = CustomReader(block_size=3)
+    pieces = list(reader.iter_text(str(file_path)))
+    assert len(pieces) > 1
+    assert "".join(pieces) == reader.convert(str(file_path))
+
+
+def test_convert_stream(reader):
+    """Test that streams are decoded like files."""
+    stream = io.BytesIO(TEXT.encode("utf-16"))
+    assert reader.convert_stream(stream, "doc.md") == TEXT
+
+
+def test_normalize_whitespace(tmp_path):
+    """Test that whitespace normalization matches the MarkItDown output."""
+    file_path = tmp_path / "doc.md"
+    file_path.write_bytes(TEXT.encode("utf-8"))
+    reader = CustomReader(normalize_whitespace=True)
+    expected = "# Título\n\nCafé, crème brûlée and naïve façade.\n\nEnd\n"
+    assert reader.convert(str(file_path)) == expected
+
+
+def test_invalid_sizes():
+    """Test that non-positive sample or block sizes are rejected."""
+    with pytest.raises(ValueError):
+        CustomReader(sample_size=0)
+    with pytest.raises(ValueError):
+        CustomReader(block_size=0)
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.domain.reader.readers.docling_reader import DoclingReader
 
 
@@ -24,3 +26,107 @@ def test_docling_reader_returns_markdown(mock_converter_class):
     assert result == "# This is markdown"
     mock_converter_instance.convert.assert_called_once_with("fake_path.txt")
     mock_document.export_to_markdown.assert_called_once()
+
+
+@patch("src.domain.reader.readers.docling_reader.DocumentConverter")
+def test_docling_reader_convert_batch(mock_converter_class):
+    """Test that convert_batch uses a single convert_all run and isolates failures."""
+    from docling.datamodel.base_models import ConversionStatus
+
+    ok = MagicMock(status=ConversionStatus.SUCCESS)
+    ok.document.export_to_markdown.return_value = "# First"
+    failed = MagicMock(status=ConversionStatus.FAILURE)
+    failed.errors = [MagicMock(error_message="broken file")]
+    mock_converter_instance = MagicMock()
+    mock_converter_instance.convert_all.return_value = iter([ok, failed])
+    mock_converter_class.return_value = mock_converter_instance
+
+    reader = DoclingReader()
+    results = list(reader.convert_batch(["a.pdf", "b.pdf"]))
+
+    mock_converter_instance.convert_all.assert_called_once_with(
+        ["a.pdf", "b.pdf"], raises_on_error=False
+    )
+    mock_converter_instance.convert.assert_not_called()
+    assert results[0] == ("a.pdf", "# First")
+    assert results[1][0] == "b.pdf"
+    assert isinstance(results[1][1], RuntimeError)
+    assert "broken file" in str(results[1][1])
+
+
+@patch("src.domain.reader.readers.docling_reader.DocumentConverter")
+def test_docling_reader_convert_batch_concurrently(mock_converter_class):
+    """Test that concurrent batches keep the order and leave Docling's settings alone."""
+    from docling.datamodel.base_models import ConversionStatus
+    from docling.datamodel.settings import settings
+
+    def convert(file_path, raises_on_error=True):
+        result = MagicMock(status=ConversionStatus.SUCCESS)
+        result.document.export_to_markdown.return_value = f"# {file_path}"
+        return result
+
+    mock_converter_instance = MagicMock()
+    mock_converter_instance.convert.side_effect = convert
+    mock_converter_class.return_value = mock_converter_instance
+    perf = settings.perf.model_dump()
+
+    reader = DoclingReader(batch_size=2, batch_concurrency=2)
+    paths = ["a.pdf", "b.pdf", "c.pdf"]
+    results = list(reader.convert_batch(paths))
+
+    assert results == [(path, f"# {path}") for path in paths]
+    mock_converter_instance.convert_all.assert_not_called()
+    assert settings.perf.model_dump() == perf
+
+
+@pytest.mark.parametrize(
+    "profile, ocr, tables, table_mode",
+    [
+        ("fast", False, False, "fast"),
+        ("balanced", False, True, "fast"),
+        ("accurate", True, True, "accurate"),
+    ],
+)
+@patch("src.domain.reader.readers.docling_reader.DocumentConverter")
+def test_docling_reader_profiles(
+    mock_converter_class, profile, ocr, tables, table_mode
+):
+    """Test that each profile configures the PDF pipeline options accordingly."""
+    from docling.datamodel.base_models import InputFormat
+
+    reader = DoclingReader(profile=profile)
+
+    format_options = mock_converter_class.call_args.kwargs["format_options"]
+    options = format_options[InputFormat.PDF].pipeline_options
+    assert reader.profile == profile
+    assert options.do_ocr is ocr
+    assert options.do_table_structure is tables
+    assert options.table_structure_options.mode.value == table_mode
+
+
+def test_docling_reader_unknown_profile():
+    """Test that an unknown profile is rejected."""
+    with pytest.raises(ValueError):
+        DoclingReader(profile="turbo")
+
+
+@patch("src.domain.reader.readers.docling_reader.DocumentConverter")
+def test_docling_reader_convert_pages(mock_converter_class):
+    """Test that Docling only processes the page range spanning the selection."""
+    document = MagicMock()
+    document.pages = {2: MagicMock(), 3: MagicMock(), 4: MagicMock()}
+    document.export_to_markdown.side_effect = lambda page_no=None: f"page {page_no}"
+    mock_converter_instance = MagicMock()
+    mock_converter_instance.convert.return_value = MagicMock(document=document)
+    mock_converter_class.return_value = mock_converter_instance
+
+    reader = DoclingReader()
+    result = reader.convert_pages("doc.pdf", pages=[4, 2])
+
+    mock_converter_instance.convert.assert_called_once_with(
+        "doc.pdf", page_range=(2, 4)
+    )
+    assert result == "page 2\n\npage 4"
+
+    reader.convert_pages("doc.pdf", max_pages=3)
+    mock_converter_instance.convert.assert_called_with("doc.pdf", page_range=(1, 3))
@@ -1,3 +1,6 @@
+import io
+import tempfile
+
 from src.domain.reader.readers.markitdown_reader import MarkItDownReader
 
 
@@ -14,6 +17,12 @@ class DummyMarkItDown:
 
         return DummyResult()
 
+    def convert_stream(self, stream, file_extension=None):
+        class DummyResult:
+            text_content = f"converted {file_extension}: {stream.read().decode()}"
+
+        return DummyResult()
+
 
 def test_markitdown_converter(monkeypatch):
     """
@@ -37,3 +46,29 @@ def test_markitdown_converter(monkeypatch):
     result = converter.convert("test_file.txt")
     expected = "converted: test_file.txt"
     assert result == expected
+
+
+def test_markitdown_convert_stream(monkeypatch):
+    """
+    Test that convert_stream passes the stream and the extension of the file name.
+    """
+    monkeypatch.setattr(
+        "src.domain.reader.readers.markitdown_reader.MarkItDown", DummyMarkItDown
+    )
+    converter = MarkItDownReader()
+    assert converter.supports_stream
+    result = converter.convert_stream(io.BytesIO(b"hello"), "notes.txt")
+    assert result == "converted .txt: hello"
+
+
+def test_markitdown_convert_spooled_stream():
+    """
+    Test that convert_stream accepts the SpooledTemporaryFile used by UploadFile.
+    """
+    with open("data/test/input/test_1.pdf", "rb") as f:
+        content = f.read()
+    with tempfile.SpooledTemporaryFile() as stream:
+        stream.write(content)
+        stream.seek(0)
+        result = MarkItDownReader().convert_stream(stream, "test_1.pdf")
+    assert result == MarkItDownReader().convert("data/test/input/test_1.pdf")
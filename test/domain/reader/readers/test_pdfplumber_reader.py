@@ -67,3 +67,203 @@ def test_pdfplumber_reader_handles_empty_tables(mock_pdf_open):
 
     assert "## Page 1" in markdown
     assert "Document: somefile.pdf" in markdown  # Still processes the document
+
+
+@patch("src.domain.reader.readers.pdfplumber_reader.pdfplumber.open")
+def test_pdfplumber_reader_iter_pages_streams_and_closes_pages(mock_pdf_open):
+    """Test that iter_pages yields one page at a time and closes each page after use."""
+    pages = []
+    for number in (1, 2):
+        page = MagicMock()
+        page.page_number = number
+        page.extract_text_lines.return_value = [{"text": f"Text {number}", "top": 10}]
+        page.lines = []
+        page.rects = []
+        page.curves = []
+        page.find_tables.return_value = []
+        pages.append(page)
+
+    mock_pdf = MagicMock()
+    mock_pdf.pages = pages
+    mock_pdf_open.return_value.__enter__.return_value = mock_pdf
+
+    reader = PDFPlumberReader()
+    iterator = reader.iter_pages("doc.pdf")
+
+    number, markdown = next(iterator)
+    assert number == 1
+    assert markdown == "## Page 1\n\nText 1\n\n"
+    pages[0].close.assert_not_called()
+
+    number, markdown = next(iterator)
+    assert number == 2
+    pages[0].close.assert_called_once()
+
+    iterator.close()
+    pages[1].close.assert_called_once()
+
+
+def test_pdfplumber_reader_iter_markdown_matches_convert():
+    """Test that convert is the concatenation of the streamed pieces on a real PDF."""
+    reader = PDFPlumberReader()
+    pieces = list(reader.iter_markdown("data/test/input/test_1.pdf"))
+
+    assert pieces[0] == "# Document: test_1.pdf\n\n"
+    assert pieces[1].startswith("## Page 1")
+    assert "".join(pieces) == reader.convert("data/test/input/test_1.pdf")
+
+
+@pytest.fixture
+def multipage_pdf(tmp_path):
+    """Build a 5-page PDF by repeating the pages of test_1.pdf."""
+    pdfium = pytest.importorskip("pypdfium2")
+    source = pdfium.PdfDocument("data/test/input/test_1.pdf")
+    document = pdfium.PdfDocument.new()
+    document.import_pages(source, [0] * 5)
+    path = tmp_path / "multipage.pdf"
+    document.save(str(path))
+    return str(path)
+
+
+def test_pdfplumber_reader_parallel_matches_sequential(multipage_pdf):
+    """Test that the process pool path yields the same pages in the same order."""
+    sequential = PDFPlumberReader().convert(multipage_pdf)
+    reader = PDFPlumberReader(workers=2, parallel_min_pages=2)
+    pages = list(reader.iter_pages(multipage_pdf))
+
+    assert [number for number, _ in pages] == [1, 2, 3, 4, 5]
+    assert reader.convert(multipage_pdf) == sequential
+
+
+def test_pdfplumber_reader_convert_pages(multipage_pdf, monkeypatch):
+    """Test that only the selected pages are rendered, in the sequential and parallel paths."""
+    rendered = []
+    render = PDFPlumberReader._page_blocks
+
+    def tracking_render(self, page, document_name):
+        if document_name == "multipage.pdf":
+            rendered.append(page.page_number)
+        return render(self, page, document_name)
+
+    monkeypatch.setattr(PDFPlumberReader, "_page_blocks", tracking_render)
+    reader = PDFPlumberReader()
+    markdown = reader.convert_pages(multipage_pdf, pages=[4, 2, 9])
+
+    assert rendered == [2, 4]
+    assert "## Page 2" in markdown and "## Page 4" in markdown
+    assert "## Page 1" not in markdown
+
+    rendered.clear()
+    assert list(reader.iter_pages(multipage_pdf, max_pages=2))[-1][0] == 2
+    assert rendered == [1, 2]
+
+    parallel = PDFPlumberReader(workers=2, parallel_min_pages=2)
+    assert parallel.convert_pages(multipage_pdf, pages=[2, 4]) == reader.convert_pages(
+        multipage_pdf, pages=[2, 4]
+    )
+
+
+def test_pdfplumber_reader_invalid_workers():
+    """Test that non-positive worker settings are rejected."""
+    with pytest.raises(ValueError):
+        PDFPlumberReader(workers=0)
+    with pytest.raises(ValueError):
+        PDFPlumberReader(parallel_min_pages=0)
+
+
+def test_pdfplumber_reader_fast_profile_skips_table_detection():
+    """Test that the fast profile only looks for tables on pages with lines, rects or curves."""
+    page = MagicMock()
+    page.page_number = 1
+    page.extract_text_lines.return_value = [{"text": "Plain text", "top": 10}]
+    page.objects = {"char": [{}]}
+
+    reader = PDFPlumberReader(profile="fast")
+    blocks = reader._page_blocks(page, "doc.pdf")
+
+    assert [text for _, text in blocks] == ["Plain text"]
+    page.find_tables.assert_not_called()
+
+    page.find_tables.return_value = []
+    for kind in ("line", "rect", "curve"):
+        page.find_tables.reset_mock()
+        page.objects = {"char": [{}], kind: [{}]}
+        reader._page_blocks(page, "doc.pdf")
+        page.find_tables.assert_called_once()
+
+
+def curve_table_pdf(path):
+    """Write a one-page PDF with a 4x3 table whose rules are drawn as polylines (curves)."""
+    xs, ys = [72, 172, 272, 372, 472], [700, 670, 640, 610]
+    ops = ["0.5 w"]
+    for y in ys:
+        ops.append(f"{xs[0]} {y} m " + " ".join(f"{x} {y} l" for x in xs[1:]) + " S")
+    for x in xs:
+        ops.append(f"{x} {ys[0]} m " + " ".join(f"{x} {y} l" for y in ys[1:]) + " S")
+    for row in range(3):
+        for col in range(4):
+            ops.append(
+                f"BT /F1 10 Tf {xs[col] + 5} {ys[row] - 20} Td (R{row}C{col}) Tj ET"
+            )
+    content = "\n".join(ops).encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+    ]
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_pdfplumber_reader_fast_profile_finds_curve_tables(tmp_path):
+    """Test that the fast profile keeps tables whose rules are only drawn as curves."""
+    path = curve_table_pdf(tmp_path / "curves.pdf")
+    accurate = PDFPlumberReader(profile="accurate").convert(path)
+
+    assert "| R1C0 | R1C1 | R1C2 | R1C3 |" in accurate
+    assert PDFPlumberReader(profile="fast").convert(path) == accurate
+
+
+def test_pdfplumber_reader_profiles_match_on_sample():
+    """Test that both profiles render the bundled PDF (which has a ruled table) identically."""
+    path = "data/test/input/test_1.pdf"
+    fast = PDFPlumberReader(profile="fast").convert(path)
+    assert fast == PDFPlumberReader(profile="accurate").convert(path)
+    assert "| --- |" in fast
+
+
+def test_pdfplumber_reader_invalid_profile():
+    """Test that an unknown profile is rejected."""
+    with pytest.raises(ValueError, match="Unsupported pdfplumber profile"):
+        PDFPlumberReader(profile="turbo")
+
+
+def test_pdfplumber_reader_convert_document(multipage_pdf):
+    """Test that the structured document renders to the same Markdown and keeps pages."""
+    from src.domain.reader.document import BlockType
+
+    reader = PDFPlumberReader()
+    document = reader.convert_document(multipage_pdf)
+
+    assert document.text == reader.convert(multipage_pdf)
+    assert [page for page, _, _ in document.page_spans()] == [1, 2, 3, 4, 5]
+    headings = [block for block in document if block.kind == BlockType.HEADING]
+    assert headings[0].text == "# Document: multipage.pdf"
+    assert [block.text for block in headings[1:]] == [
+        f"## Page {n}" for n in range(1, 6)
+    ]
@@ -1,8 +1,10 @@
-import os
+import threading
+import time
 
 import pytest
 
 from src.domain.reader.readers.textract_reader import TextractReader
+from src.infrastructure.model.models.local_textract_client import LocalTextractClient
 
 
 # A dummy client to simulate Textract's DetectDocumentText API responses.
@@ -81,3 +83,107 @@ class TestTextractReader:
         reader = TextractReader(client=dummy_client)
         with pytest.raises(RuntimeError, match="Textract detect_document_text failed"):
             reader.convert(str(dummy_file))
+
+
+@pytest.fixture
+def multipage_pdf(tmp_path):
+    """Build a 4-page PDF by repeating the page of test_1.pdf."""
+    pdfium = pytest.importorskip("pypdfium2")
+    source = pdfium.PdfDocument("data/test/input/test_1.pdf")
+    document = pdfium.PdfDocument.new()
+    document.import_pages(source, [0] * 4)
+    path = tmp_path / "multipage.pdf"
+    document.save(str(path))
+    return path
+
+
+class TestTextractReaderPageFanOut:
+    def test_split_pages_are_reassembled_in_order(self, multipage_pdf):
+        """
+        Test that every page of a multi-page PDF is sent separately and rendered in order.
+        """
+        client = LocalTextractClient()
+        reader = TextractReader(client=client, concurrency=3)
+        result = reader.convert(str(multipage_pdf))
+
+        assert client.calls == 4
+        positions = [result.index(f"## Page {page}") for page in range(1, 5)]
+        assert positions == sorted(positions)
+
+    def test_without_split_only_first_page_is_read(self, multipage_pdf):
+        """
+        Test that sending the whole PDF in one call only returns the first page.
+        """
+        client = LocalTextractClient()
+        reader = TextractReader(client=client, split_pages=False)
+        result = reader.convert(str(multipage_pdf))
+
+        assert client.calls == 1
+        assert "## Page 1" in result
+        assert "## Page 2" not in result
+
+    def test_page_selection_only_sends_selected_pages(self, multipage_pdf):
+        """
+        Test that convert_pages only submits the selected pages, keeping their numbers.
+        """
+        client = LocalTextractClient()
+        reader = TextractReader(client=client, split_pages=False)
+        result = reader.convert_pages(str(multipage_pdf), pages=[2, 4])
+
+        assert client.calls == 2
+        assert "## Page 2" in result and "## Page 4" in result
+        assert "## Page 1" not in result and "## Page 3" not in result
+
+        client.calls = 0
+        result = reader.convert_pages(str(multipage_pdf), max_pages=1)
+        assert client.calls == 1
+        assert "## Page 1" in result and "## Page 2" not in result
+
+    def test_convert_document_keeps_pages(self, multipage_pdf):
+        """
+        Test that the structured document renders like convert and tags lines with pages.
+        """
+        reader = TextractReader(client=LocalTextractClient())
+        document = reader.convert_document(str(multipage_pdf))
+
+        assert document.text == reader.convert(str(multipage_pdf))
+        assert [page for page, _, _ in document.page_spans()] == [1, 2, 3, 4]
+
+    def test_concurrency_is_bounded(self, multipage_pdf):
+        """
+        Test that no more than `concurrency` Textract calls are in flight at once.
+        """
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        class TrackingClient(LocalTextractClient):
+            def detect_document_text(self, Document):
+                with lock:
+                    state["in_flight"] += 1
+                    state["peak"] = max(state["peak"], state["in_flight"])
+                time.sleep(0.05)
+                with lock:
+                    state["in_flight"] -= 1
+                return {"Blocks": [{"BlockType": "LINE", "Page": 1, "Text": "x"}]}
+
+        TextractReader(client=TrackingClient(), concurrency=2).convert(
+            str(multipage_pdf)
+        )
+        assert state["peak"] == 2
+
+    def test_local_backend(self, multipage_pdf):
+        """
+        Test that the local backend builds the offline client.
+        """
+        reader = TextractReader(backend="local")
+        assert isinstance(reader.client, LocalTextractClient)
+        assert "## Page 4" in reader.convert(str(multipage_pdf))
+
+    def test_invalid_settings(self):
+        """
+        Test that unknown backends and non-positive concurrency are rejected.
+        """
+        with pytest.raises(ValueError):
+            TextractReader(backend="gcp")
+        with pytest.raises(ValueError):
+            TextractReader(client=DummyClient(), concurrency=0)
@@ -0,0 +1,17 @@
+import io
+
+from src.domain.reader.base_reader import BaseReader
+
+
+class FileReader(BaseReader):
+    def convert(self, file_path: str) -> str:
+        with open(file_path, encoding="utf-8") as f:
+            return f"{file_path.rsplit('/', 1)[-1]}: {f.read()}"
+
+
+def test_convert_stream_stages_to_a_named_file():
+    """Test that streams are converted from a temporary file with the original name."""
+    reader = FileReader()
+    stream = io.BytesIO("Hello, streams!".encode("utf-8"))
+
+    assert reader.convert_stream(stream, "uploads/doc.md") == "doc.md: Hello, streams!"
@@ -0,0 +1,116 @@
+import pytest
+
+from src.domain.reader.document import BlockType, Document, DocumentBuilder
+
+MARKDOWN = (
+    "# Report\n"
+    "\n"
+    "Intro line one\n"
+    "intro line two.\n"
+    "\n"
+    "Results\n"
+    "-------\n"
+    "\n"
+    "| a | b |\n"
+    "| --- | --- |\n"
+    "| 1 | 2 |\n"
+    "\f"
+    "- first\n"
+    "  continued\n"
+    "- second\n"
+    "\n"
+    "```\n"
+    "code\n"
+    "\n"
+    "more code\n"
+    "```\n"
+    "![chart](chart.png)\n"
+    "## Appendix\n"
+    "Last words."
+)
+
+
+def test_from_markdown_blocks():
+    """Test that Markdown is split into typed blocks with their page, level and offsets."""
+    document = Document.from_markdown(MARKDOWN)
+
+    assert [(block.kind, block.page, block.level) for block in document] == [
+        (BlockType.HEADING, 1, 1),
+        (BlockType.PARAGRAPH, 1, 0),
+        (BlockType.HEADING, 1, 2),
+        (BlockType.TABLE, 1, 0),
+        (BlockType.LIST, 2, 0),
+        (BlockType.CODE, 2, 0),
+        (BlockType.IMAGE, 2, 0),
+        (BlockType.HEADING, 2, 2),
+        (BlockType.PARAGRAPH, 2, 0),
+    ]
+    blocks = list(document)
+    assert blocks[1].text == "Intro line one\nintro line two."
+    assert blocks[2].text == "Results\n-------"
+    assert blocks[3].text.count("\n") == 2
+    assert blocks[4].text == "- first\n  continued\n- second"
+    assert blocks[5].text == "```\ncode\n\nmore code\n```"
+    assert all(MARKDOWN[b.start : b.end] == b.text for b in blocks)
+    assert document.to_markdown() is MARKDOWN
+
+
+def test_setext_heading_splits_paragraph():
+    """Test that only the underlined line of a paragraph becomes a heading."""
+    document = Document.from_markdown("Body text.\nTitle\n=====\nMore.")
+
+    assert [(block.kind, block.level, block.text) for block in document] == [
+        (BlockType.PARAGRAPH, 0, "Body text."),
+        (BlockType.HEADING, 1, "Title\n====="),
+        (BlockType.PARAGRAPH, 0, "More."),
+    ]
+
+
+def test_page_and_section_spans():
+    """Test that pages and sections are derived from the block arrays."""
+    document = Document.from_markdown(MARKDOWN)
+    text = document.text
+
+    pages = document.page_spans()
+    assert [page for page, _, _ in pages] == [1, 2]
+    assert text[pages[0][1] : pages[0][2]].startswith("# Report")
+    assert text[pages[1][1] : pages[1][2]].endswith("Last words.")
+
+    sections = document.section_spans()
+    assert [document.block(heading).text for heading, _, _ in sections] == [
+        "# Report",
+        "Results\n-------",
+        "## Appendix",
+    ]
+    assert len(document.section_spans(max_level=1)) == 1
+    assert Document.from_markdown("text\n# Title").section_spans()[0][0] == -1
+
+
+def test_block_at():
+    """Test that the block at an offset is found by bisection."""
+    document = Document.from_markdown(MARKDOWN)
+    offset = MARKDOWN.index("intro line two")
+
+    assert document.block_at(offset).kind == BlockType.PARAGRAPH
+    assert document.block_at(MARKDOWN.index("more code")).kind == BlockType.CODE
+    assert Document.from_markdown("\n\ntext").block_at(0) is None
+
+
+def test_builder_renders_markdown():
+    """Test that built documents render their blocks separated by blank lines."""
+    builder = DocumentBuilder()
+    builder.add(BlockType.HEADING, "## Page 1", page=1, level=2)
+    builder.add(BlockType.TABLE, "| a |\n| --- |", page=1)
+    builder.add(BlockType.PARAGRAPH, "text", page=2)
+    document = builder.build()
+
+    assert document.text == "## Page 1\n\n| a |\n| --- |\n\ntext\n\n"
+    assert [block.text for block in document] == ["## Page 1", "| a |\n| --- |", "text"]
+    assert document.page_spans() == [(1, 0, 24), (2, 26, 30)]
+
+
+@pytest.mark.parametrize("text", ["", MARKDOWN, "no blocks\n\n\n"])
+def test_dumps_loads_round_trip(text):
+    """Test that serialized documents keep their text and blocks."""
+    document = Document.from_markdown(text)
+    assert Document.loads(document.dumps()) == document
@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from src.domain.reader.format_detector import (
+    UnsupportedFormatError,
+    detect_format,
+    resolve_reader,
+    sniff_file,
+    sniff_stream,
+)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        ("test_1.pdf", "pdf"),
+        ("test_1.docx", "docx"),
+        ("test_1.pptx", "pptx"),
+        ("test_1.xlsx", "xlsx"),
+        ("test_1.md", "text"),
+        ("test_1.txt", "text"),
+        ("malicious.exe", "executable"),
+    ],
+)
+def test_sniff_test_inputs(file_name, expected):
+    """Test the formats detected for the sample input files."""
+    assert sniff_file(f"data/test/input/{file_name}") == expected
+
+
+@pytest.mark.parametrize(
+    "sample, file_name, expected",
+    [
+        (b"MZ\x90\x00\x03", "report.pdf", "executable"),
+        (b"\x7fELF\x02\x01", "notes", "executable"),
+        (b"\x89PNG\r\n\x1a\n\x00", "scan.png", "image"),
+        (b"\xff\xd8\xff\xe0", "photo", "image"),
+        (b"PK\x03\x04\x14\x00", "archive.zip", "zip"),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "book.xls", "xls"),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "legacy.doc", "binary"),
+        (b"  <!DOCTYPE html><html>", "page", "html"),
+        (b"a,b,c\n1,2,3\n", "data.csv", "text"),
+        ("café déjà vu".encode("utf-8"), "notes.txt", "text"),
+        (b"\x00\x01\x02\x03\xfe\xff", "blob.dat", "binary"),
+    ],
+)
+def test_detect_format(sample, file_name, expected):
+    """Test magic-byte and extension based detection."""
+    assert detect_format(sample, file_name) == expected
+
+
+def test_sniff_stream_rewinds():
+    """Test that sniffing a stream leaves it at the start."""
+    stream = io.BytesIO(b"%PDF-1.4 ...")
+    assert sniff_stream(stream, "upload") == "pdf"
+    assert stream.tell() == 0
+
+
+def test_resolve_reader():
+    """Test the routing rules: routes, then configured reader, then the cheapest one."""
+    assert resolve_reader("text", "docling") == "custom"
+    assert resolve_reader("html", "docling") == "markitdown"
+    assert resolve_reader("pdf", "docling") == "docling"
+    assert resolve_reader("docx", "pdfplumber") == "markitdown"
+    assert resolve_reader("pdf", "markitdown", {"pdf": "pdfplumber"}) == "pdfplumber"
+    assert resolve_reader("text", "docling", {"text": "docling"}) == "docling"
+
+
+@pytest.mark.parametrize("file_format", ["executable", "binary"])
+def test_resolve_reader_unsupported(file_format):
+    """Test that formats no reader can convert are rejected."""
+    with pytest.raises(UnsupportedFormatError, match="not supported"):
+        resolve_reader(file_format, "markitdown")
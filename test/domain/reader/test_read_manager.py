@@ -5,11 +5,14 @@ import os
 import pytest
 from fastapi import UploadFile
 
-# Import the original exception thrown by MarkItDown.
-from markitdown._markitdown import UnsupportedFormatException
-
+from src.domain.reader.base_reader import filter_pages, select_page_numbers
+from src.domain.reader.format_detector import UnsupportedFormatError
 from src.domain.reader.read_manager import ReadManager
+from src.domain.reader.reader_pool import ReaderPool
+from src.domain.reader.readers.custom_reader import CustomReader
+from src.domain.reader.readers.docling_reader import DoclingReader
 from src.domain.reader.readers.markitdown_reader import MarkItDownReader
+from src.infrastructure.model.caption_cache import CachedCaptionClient
 from src.infrastructure.model.llm_client import LLMClient
 
 
@@ -78,17 +81,38 @@ def test_read_empty_file(temp_config):
     os.remove(empty_file)
 
 
-def test_read_invalid_extension(temp_config):
-    """Test that reading a file with an unsupported extension raises the proper exception."""
+def test_read_invalid_extension(temp_config, monkeypatch):
+    """Test that a file with an unsupported extension is rejected before building a reader."""
     config, input_path = temp_config
-    invalid_file = "malicious.exe"
-    with open(invalid_file, "w", encoding="utf-8") as f:
-        f.write("EXE file content")
+
+    def fail(self, method=None):
+        raise AssertionError("no reader should be built for unsupported files")
+
+    monkeypatch.setattr(ReadManager, "_build_reader", fail)
     rm = ReadManager(config=config)
-    # Expect the UnsupportedFormatException from markitdown.
-    with pytest.raises(UnsupportedFormatException, match="not supported"):
+    with pytest.raises(UnsupportedFormatError, match="not supported"):
         rm.read_file("malicious.exe")
-    os.remove(invalid_file)
+
+
+def test_text_files_skip_configured_reader(temp_config, monkeypatch):
+    """Test that plain-text files are routed to CustomReader instead of the configured reader."""
+    config, _ = temp_config
+    config["reader"] = {"method": "docling"}
+
+    def fail(self, **kwargs):
+        raise AssertionError("docling should not be built for text files")
+
+    monkeypatch.setattr(DoclingReader, "__init__", fail)
+    rm = ReadManager(config=config)
+    assert rm.read_file("test_1.md").startswith("# Title 1")
+
+
+def test_format_routes_override(temp_config):
+    """Test that reader.formats overrides the reader used for a format."""
+    config, _ = temp_config
+    config["reader"] = {"method": "markitdown", "formats": {"pdf": "pdfplumber"}}
+    rm = ReadManager(config=config)
+    assert rm.read_file("test_1.pdf").startswith("# Document: test_1.pdf")
 
 
 def test_read_file_object(read_manager, temp_config):
@@ -135,3 +159,330 @@ def test_markitdown_instantiation(temp_config, monkeypatch):
     # Verify that the converter's stored parameters are not void.
     assert converter.llm_client == "dummy_client"
     assert converter.llm_model == "dummy_model"
+
+
+def test_read_file_uses_conversion_cache(temp_config, tmp_path, monkeypatch):
+    """Test that a second read of identical content is served from the cache."""
+    config, _ = temp_config
+    config["reader"] = {
+        "method": "markitdown",
+        "cache": {"enabled": True, "disk_path": str(tmp_path)},
+    }
+    rm = ReadManager(config=config)
+    first = rm.read_file("test_1.md")
+
+    def fail(self, file_path):
+        raise AssertionError("reader should not be called on a cache hit")
+
+    monkeypatch.setattr(MarkItDownReader, "convert", fail)
+    # A copy under another name has the same content, so it hits the same entry.
+    copy_path = tmp_path / "copy.md"
+    with open(os.path.join("data/test/input", "test_1.md"), "rb") as f:
+        copy_path.write_bytes(f.read())
+
+    assert ReadManager(config=config).read_file(str(copy_path)) == first
+    assert rm.cache.stats()["memory_hits"] == 1
+
+
+def test_read_file_object_streams_without_temp_file(temp_config, monkeypatch):
+    """Test that uploads are converted from the stream when the reader supports it."""
+    config, input_path = temp_config
+    rm = ReadManager(config=config)
+    with open(os.path.join(input_path, "test_1.pdf"), "rb") as f:
+        upload_file = UploadFile(filename="test_1.pdf", file=io.BytesIO(f.read()))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("uploads should not be staged on disk")
+
+    monkeypatch.setattr("tempfile.mkdtemp", fail)
+    result = rm.read_file_object(upload_file)
+    assert result == rm.read_file("test_1.pdf")
+
+
+def test_read_file_object_stages_in_chunks(temp_config, tmp_path, monkeypatch):
+    """Test that uploads are copied in blocks into the configured staging directory."""
+    config, _ = temp_config
+    config["file_io"].update({"staging_dir": str(tmp_path), "upload_buffer_size": 4})
+    rm = ReadManager(config=config)
+    monkeypatch.setattr(CustomReader, "supports_stream", False)
+
+    class RecordingStream(io.BytesIO):
+        sizes = []
+
+        def read(self, size=-1):
+            self.sizes.append(size)
+            return super().read(size)
+
+    staged = []
+
+    def record(self, file_path):
+        staged.append(file_path)
+        with open(file_path) as f:
+            return f.read()
+
+    monkeypatch.setattr(CustomReader, "convert", record)
+    upload_file = UploadFile(filename="notes.md", file=RecordingStream(b"# Notes\n"))
+    assert rm.read_file_object(upload_file) == "# Notes\n"
+    # Three 4-byte reads copy the 8-byte upload (the last one hits the end).
+    assert RecordingStream.sizes[-3:] == [4, 4, 4]
+    assert os.path.dirname(os.path.dirname(staged[0])) == str(tmp_path)
+    assert os.path.basename(staged[0]) == "notes.md"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_file_object_empty_stream(read_manager):
+    """Test that an empty upload raises ValueError."""
+    upload_file = UploadFile(filename="empty.md", file=io.BytesIO(b""))
+    with pytest.raises(ValueError, match="File is empty"):
+        read_manager.read_file_object(upload_file)
+
+
+def test_caption_cache_wraps_llm_client(temp_config, monkeypatch):
+    """Test that ocr.cache wraps the LLM client handed to MarkItDown."""
+    config, _ = temp_config
+    monkeypatch.setattr(
+        LLMClient, "__init__", lambda self, method: setattr(self, "method", method)
+    )
+    monkeypatch.setattr(LLMClient, "get_client", lambda self: "dummy_client")
+    monkeypatch.setattr(LLMClient, "get_model", lambda self: "dummy_model")
+    config["ocr"] = {"method": "openai", "cache": {"enabled": True}}
+
+    converter = ReadManager(config=config)._get_reader("markitdown")
+    assert isinstance(converter.llm_client, CachedCaptionClient)
+    assert converter.llm_client.client == "dummy_client"
+
+
+def test_warm_up_builds_and_runs_readers(temp_config, monkeypatch):
+    """Test that warm_up converts a sample document with each pooled reader."""
+    config, _ = temp_config
+    converted = []
+    monkeypatch.setattr(
+        CustomReader, "convert", lambda self, path: converted.append(path) or ""
+    )
+    read_manager = ReadManager(config=config)
+
+    durations = read_manager.warm_up(["custom"])
+
+    assert set(durations) == {"custom"}
+    assert converted and converted[0].endswith("warm_up.md")
+    assert read_manager._get_reader("custom") is read_manager._get_reader("custom")
+
+
+def test_warmed_readers_survive_the_idle_ttl(temp_config, monkeypatch):
+    """Test that warm_up pins its readers, so /health/ready stays truthful."""
+    config, _ = temp_config
+    now = [1000.0]
+    monkeypatch.setattr("src.domain.reader.reader_pool.time.monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        "src.domain.reader.read_manager.reader_pool", ReaderPool(idle_ttl=10)
+    )
+    monkeypatch.setattr(CustomReader, "convert", lambda self, path: "")
+    read_manager = ReadManager(config=config)
+    read_manager.warm_up(["custom"])
+    warmed = read_manager._get_reader("custom")
+    other = read_manager._get_reader("markitdown")
+
+    now[0] += 100
+
+    assert read_manager._get_reader("custom") is warmed
+    assert read_manager._get_reader("markitdown") is not other
+
+
+def test_read_files_batches_by_reader(temp_config, monkeypatch):
+    """
+    Test that read_files converts each reader's files in one convert_batch call and leaves
+    out the files that cannot be read.
+    """
+    config, _ = temp_config
+    batches = []
+
+    def convert_batch(self, file_paths):
+        batches.append((self.__class__.__name__, file_paths))
+        for file_path in file_paths:
+            yield file_path, f"converted {os.path.basename(file_path)}"
+
+    monkeypatch.setattr(CustomReader, "convert_batch", convert_batch)
+    monkeypatch.setattr(MarkItDownReader, "convert_batch", convert_batch)
+    read_manager = ReadManager(config=config)
+
+    texts = read_manager.read_files(
+        ["test_1.md", "missing.pdf", "test_1.docx", "empty.txt", "test_1.txt"]
+    )
+
+    assert list(texts) == ["test_1.md", "test_1.docx", "test_1.txt"]
+    assert texts["test_1.docx"] == "converted test_1.docx"
+    assert sorted((name, len(paths)) for name, paths in batches) == [
+        ("CustomReader", 2),
+        ("MarkItDownReader", 1),
+    ]
+
+
+def test_iter_files_spooled(temp_config, monkeypatch):
+    """
+    Test that iter_files_spooled reads files one at a time into spooled buffers, converts
+    the files of batch readers together and skips the files that cannot be read.
+    """
+    config, _ = temp_config
+    batches = []
+
+    def convert_batch(self, file_paths):
+        batches.append(file_paths)
+        for file_path in file_paths:
+            yield file_path, f"converted {os.path.basename(file_path)}"
+
+    monkeypatch.setattr(MarkItDownReader, "converts_batches", True, raising=False)
+    monkeypatch.setattr(MarkItDownReader, "convert_batch", convert_batch)
+    read_manager = ReadManager(config=config)
+
+    results = list(
+        read_manager.iter_files_spooled(
+            ["test_1.md", "missing.pdf", "test_1.docx", "empty.txt", "test_1.xlsx"]
+        )
+    )
+
+    assert [file_path for file_path, _ in results] == [
+        "test_1.md",
+        "test_1.docx",
+        "test_1.xlsx",
+    ]
+    assert len(batches) == 1 and len(batches[0]) == 2
+    texts = {}
+    for file_path, spooled in results:
+        with spooled:
+            texts[file_path] = "".join(spooled.iter_text())
+    assert texts["test_1.md"] == read_manager.read_file("test_1.md")
+    assert texts["test_1.docx"] == "converted test_1.docx"
+
+
+def test_iter_files_spooled_streams_batch_outputs(temp_config, monkeypatch):
+    """Test that each batch output is yielded before the next file is converted."""
+    config, _ = temp_config
+    events = []
+
+    def convert_batch(self, file_paths):
+        for file_path in file_paths:
+            events.append(f"convert {os.path.basename(file_path)}")
+            yield file_path, f"converted {os.path.basename(file_path)}"
+
+    monkeypatch.setattr(MarkItDownReader, "converts_batches", True, raising=False)
+    monkeypatch.setattr(MarkItDownReader, "convert_batch", convert_batch)
+    read_manager = ReadManager(config=config)
+
+    for file_path, spooled in read_manager.iter_files_spooled(
+        ["test_1.docx", "test_1.xlsx"]
+    ):
+        with spooled:
+            events.append(f"yield {file_path}")
+
+    assert events == [
+        "convert test_1.docx",
+        "yield test_1.docx",
+        "convert test_1.xlsx",
+        "yield test_1.xlsx",
+    ]
+
+
+def test_read_files_skips_failed_conversions(temp_config):
+    """Test that a file failing to convert does not stop the rest of the batch."""
+    config, _ = temp_config
+    read_manager = ReadManager(config=config)
+    reader = read_manager._get_reader("custom")
+    failing = ["test_1.md"]
+
+    def convert(file_path):
+        if os.path.basename(file_path) in failing:
+            raise ValueError("broken file")
+        return "text"
+
+    reader.convert = convert
+    try:
+        texts = read_manager.read_files(["test_1.md", "test_1.txt"])
+    finally:
+        del reader.convert
+
+    assert texts == {"test_1.txt": "text"}
+
+
+def test_select_page_numbers():
+    """Test page selections: sorted, unique, bounded by the page count and max_pages."""
+    assert select_page_numbers(5) == [1, 2, 3, 4, 5]
+    assert select_page_numbers(5, max_pages=2) == [1, 2]
+    assert select_page_numbers(None, max_pages=2) == [1, 2]
+    assert select_page_numbers(5, [4, 2, 2, 9]) == [2, 4]
+    assert select_page_numbers(None, [9, 3], max_pages=1) == [3]
+    with pytest.raises(ValueError):
+        select_page_numbers(5, [0])
+    with pytest.raises(ValueError):
+        select_page_numbers(5, max_pages=0)
+
+
+def test_filter_pages():
+    """Test the post-filter on documents whose pages are separated by form feeds."""
+    assert filter_pages("a\fb\fc", [3, 1]) == "a\fc"
+    assert filter_pages("a\fb\fc", max_pages=1) == "a"
+    assert filter_pages("single page", [2]) == ""
+    assert filter_pages("a\fb") == "a\fb"
+
+
+def test_read_file_pages(temp_config, tmp_path, monkeypatch):
+    """
+    Test that read_file keeps the selected pages, through the reader's convert_pages, and
+    caches each selection separately.
+    """
+    config, _ = temp_config
+    config = {**config, "reader": {"method": "markitdown", "cache": {"enabled": True}}}
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF-1.4 fake")
+    monkeypatch.setattr(
+        MarkItDownReader, "convert", lambda self, file_path: "one\ftwo\fthree"
+    )
+    read_manager = ReadManager(config=config)
+    read_manager.cache.clear()
+
+    assert read_manager.read_file(str(path)) == "one\ftwo\fthree"
+    assert read_manager.read_file(str(path), pages=[2]) == "two"
+    assert read_manager.read_file(str(path), max_pages=2) == "one\ftwo"
+    assert read_manager.read_file(str(path), pages=range(3, 4)) == "three"
+    with pytest.raises(ValueError):
+        read_manager.read_file(str(path), max_pages=0)
+
+
+def test_read_document_is_cached_with_blocks(temp_config):
+    """Test that read_document returns a Document and caches it with its blocks."""
+    config, _ = temp_config
+    config = {**config, "reader": {"cache": {"enabled": True}}}
+    read_manager = ReadManager(config=config)
+    read_manager.cache.clear()
+
+    document = read_manager.read_document("test_1.md")
+    assert document.text == read_manager.read_file("test_1.md")
+    assert len(document) > 1
+
+    cached = read_manager.read_document("test_1.md")
+    assert read_manager.cache.stats()["memory_hits"] >= 1
+    assert cached == document
+
+
+def test_read_file_spooled_spills_large_outputs(temp_config, monkeypatch):
+    """Test that read_file_spooled streams the reader output and spills past the limit."""
+    config, _ = temp_config
+    config = {
+        **config,
+        "reader": {"cache": {"enabled": True}, "spill": {"max_memory_mb": 0.0001}},
+    }
+    read_manager = ReadManager(config=config)
+    read_manager.cache.clear()
+    expected = read_manager.read_file("test_1.txt")
+    read_manager.cache.clear()
+
+    with read_manager.read_file_spooled("test_1.txt") as spooled:
+        assert spooled.rolled
+        assert "".join(spooled.iter_text()) == expected
+    # Spilled outputs are not cached.
+    assert read_manager.cache.stats()["memory_bytes"] == 0
+
+    read_manager.spill_max_memory = 10 * 1024 * 1024
+    with read_manager.read_file_spooled("test_1.txt") as spooled:
+        assert not spooled.rolled
+        assert spooled.read() == expected
+    assert read_manager.cache.stats()["memory_bytes"] > 0
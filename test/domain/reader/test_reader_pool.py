@@ -0,0 +1,143 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.reader.read_manager import ReadManager
+from src.domain.reader.reader_pool import ReaderPool, reader_pool
+
+
+class DummyReader:
+    def __init__(self):
+        self.closed = False
+
+    def convert(self, file_path: str) -> str:
+        return f"converted: {file_path}"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pool_builds_each_key_once():
+    """Test that the factory is only called on the first request for a key."""
+    pool = ReaderPool()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return DummyReader()
+
+    first = pool.get(("markitdown", "none", None, "{}"), factory)
+    second = pool.get(("markitdown", "none", None, "{}"), factory)
+
+    assert first is second
+    assert len(calls) == 1
+    assert len(pool) == 1
+
+
+def test_pool_separates_keys():
+    """Test that different configurations get different readers."""
+    pool = ReaderPool()
+    first = pool.get(("markitdown", "none", None, "{}"), DummyReader)
+    second = pool.get(("pdfplumber", "none", None, "{}"), DummyReader)
+
+    assert first is not second
+    assert len(pool) == 2
+
+
+def test_pool_evicts_idle_readers(monkeypatch):
+    """Test that readers unused for longer than idle_ttl are evicted."""
+    now = [1000.0]
+    monkeypatch.setattr("src.domain.reader.reader_pool.time.monotonic", lambda: now[0])
+    pool = ReaderPool(idle_ttl=10)
+    first = pool.get("key", DummyReader)
+
+    now[0] += 5
+    assert pool.evict_idle() == 0
+    assert "key" in pool
+
+    now[0] += 11
+    assert pool.evict_idle() == 1
+    assert "key" not in pool
+    assert first.closed
+    assert pool.get("key", DummyReader) is not first
+
+
+def test_pool_closes_readers_evicted_on_access(monkeypatch):
+    """Test that idle readers evicted by a lookup, or by clear, are closed."""
+    now = [1000.0]
+    monkeypatch.setattr("src.domain.reader.reader_pool.time.monotonic", lambda: now[0])
+    pool = ReaderPool(idle_ttl=10)
+    idle = pool.get("idle", DummyReader)
+    now[0] += 11
+    active = pool.get("active", DummyReader)
+
+    assert idle.closed and "idle" not in pool
+    assert not active.closed
+
+    pool.clear()
+    assert active.closed and len(pool) == 0
+
+
+def test_pool_keeps_pinned_readers(monkeypatch):
+    """Test that pinned readers survive the idle TTL, unlike the others."""
+    now = [1000.0]
+    monkeypatch.setattr("src.domain.reader.reader_pool.time.monotonic", lambda: now[0])
+    pool = ReaderPool(idle_ttl=10)
+    pinned = pool.get("pinned", DummyReader, pin=True)
+    pool.get("other", DummyReader)
+
+    now[0] += 100
+    assert pool.evict_idle() == 1
+    assert pool.get("pinned", DummyReader) is pinned
+    assert not pinned.closed
+
+
+def test_pool_does_not_cache_failed_builds():
+    """Test that a factory error leaves the pool untouched."""
+    pool = ReaderPool()
+
+    def factory():
+        raise ValueError("Unsupported reader method: foo")
+
+    with pytest.raises(ValueError):
+        pool.get("key", factory)
+    assert "key" not in pool
+
+
+def test_read_managers_share_pooled_reader():
+    """Test that two ReadManagers with the same configuration reuse one reader."""
+    config = {
+        "file_io": {"input_path": "data/test/input"},
+        "ocr": {"method": "none"},
+        "reader": {"method": "pdfplumber"},
+    }
+    first = ReadManager(config=config)._get_reader()
+    second = ReadManager(config=config)._get_reader()
+
+    assert first is second
+    reader_pool.clear()
+
+
+def test_pool_builds_outside_the_pool_lock():
+    """Test that a slow build only blocks the callers of its own key."""
+    pool = ReaderPool()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return DummyReader()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(pool.get, "docling", slow_factory)
+        assert started.wait(5)
+        second = executor.submit(pool.get, "docling", slow_factory)
+        other = executor.submit(pool.get, "markitdown", DummyReader)
+        assert isinstance(other.result(timeout=5), DummyReader)
+        assert not first.done()
+        release.set()
+        assert first.result(timeout=5) is second.result(timeout=5)
+    assert len(calls) == 1
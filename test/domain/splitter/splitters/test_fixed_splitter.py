@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from src.domain.splitter.splitters.fixed_splitter import FixedSplitter
@@ -111,3 +113,66 @@ class TestFixedSplitter(unittest.TestCase):
             len(SAMPLE_TEXT),
             "The single chunk should equal the text length.",
         )
+
+    def test_split_iter_matches_split(self):
+        """
+        Test that split_iter over consecutive pieces yields the same chunks as split on the
+        whole text.
+        """
+        splitter = FixedSplitter(size=37)
+        text = SAMPLE_TEXT + "  Trailing words!\n\n  end"
+        expected = splitter.split(text)
+        for piece_size in (1, 7, 64, 10_000):
+            with self.subTest(piece_size=piece_size):
+                pieces = (
+                    text[i : i + piece_size] for i in range(0, len(text), piece_size)
+                )
+                self.assertEqual(list(splitter.split_iter(pieces)), expected)
+        self.assertEqual(list(splitter.split_iter(text)), expected)
+        self.assertEqual(list(splitter.split_iter(iter(["", ""]))), [])
+
+    def test_split_bytes_respects_character_boundaries(self):
+        """
+        Test that byte chunks are at most `size` bytes, cut at UTF-8 character boundaries,
+        and cover the text without gaps.
+        """
+        text = "Añade 3 €, ñandú y 漢字 😀. " * 20
+        data = text.encode("utf-8")
+        splitter = FixedSplitter(size=7)
+        chunks = list(splitter.split_bytes(data))
+        self.assertTrue(all(0 < len(chunk) <= 7 for chunk in chunks))
+        self.assertEqual("".join(bytes(c).decode("utf-8") for c in chunks), text)
+        self.assertIsInstance(chunks[0], memoryview)
+
+        # With overlap, each chunk starts at most `overlap` bytes before the previous end.
+        overlapping = list(splitter.split_bytes(data, overlap=3))
+        self.assertGreater(len(overlapping), len(chunks))
+        for chunk in overlapping:
+            bytes(chunk).decode("utf-8")
+        self.assertEqual(bytes(overlapping[-1]), data[-len(overlapping[-1]) :])
+
+        # Characters longer than the chunk size are kept whole.
+        wide = list(FixedSplitter(size=1).split_bytes("a😀b".encode("utf-8")))
+        self.assertEqual([bytes(c).decode("utf-8") for c in wide], ["a", "😀", "b"])
+
+        with self.assertRaises(ValueError):
+            list(splitter.split_bytes(data, overlap=7))
+
+    def test_split_file(self):
+        """
+        Test that split_file gives the same chunks as split_bytes over the file contents.
+        """
+        data = SAMPLE_TEXT.encode("utf-8")
+        splitter = FixedSplitter(size=100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dump.txt")
+            with open(path, "wb") as f:
+                f.write(data)
+            chunks = [bytes(c) for c in splitter.split_file(path, overlap=10)]
+            self.assertEqual(
+                chunks, [bytes(c) for c in splitter.split_bytes(data, overlap=10)]
+            )
+
+            empty = os.path.join(tmp, "empty.txt")
+            open(empty, "wb").close()
+            self.assertEqual(list(splitter.split_file(empty)), [])
@@ -59,3 +59,20 @@ class TestParagraphSplitter(unittest.TestCase):
         self.assertEqual(
             str(context.exception), "Number of paragraphs must be greater than 0"
         )
+
+    def test_split_iter_matches_split(self):
+        """
+        Test that split_iter over consecutive pieces yields the same chunks as split on the
+        whole text.
+        """
+        splitter = ParagraphSplitter(num_paragraphs=2)
+        text = SAMPLE_TEXT + "  Trailing words!\n\n  end"
+        expected = splitter.split(text)
+        for piece_size in (1, 7, 64, 10_000):
+            with self.subTest(piece_size=piece_size):
+                pieces = (
+                    text[i : i + piece_size] for i in range(0, len(text), piece_size)
+                )
+                self.assertEqual(list(splitter.split_iter(pieces)), expected)
+        self.assertEqual(list(splitter.split_iter(text)), expected)
+        self.assertEqual(list(splitter.split_iter(iter(["", ""]))), [])
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from src.domain.splitter.splitters.recursive_splitter import RecursiveSplitter
@@ -74,3 +75,42 @@ class TestRecursiveSplitter(unittest.TestCase):
             str(context.exception),
             "Chunk size and overlap parameters should be greater than 0",
         )
+
+    def test_overlap_larger_than_size_raises_exception(self):
+        """Test that an overlap larger than the chunk size raises a ValueError."""
+        with self.assertRaises(ValueError):
+            RecursiveSplitter(size=10, overlap=11)
+
+    def test_split_spans_match_split(self):
+        """Test that the chunk spans point to the chunks returned by split."""
+        splitter = RecursiveSplitter(size=100, overlap=25)
+        spans = splitter.split_spans(SAMPLE_TEXT)
+        self.assertEqual(spans.to_list(), splitter.split(SAMPLE_TEXT))
+        for (start, end), chunk in zip(spans.spans(), spans):
+            self.assertLessEqual(len(chunk), 100)
+            self.assertEqual(SAMPLE_TEXT[start:end], chunk)
+
+    def test_matches_langchain(self):
+        """
+        Test that the chunks are the same as langchain's RecursiveCharacterTextSplitter on
+        random texts, sizes and overlaps.
+        """
+        try:
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
+        except ImportError:
+            self.skipTest("langchain-text-splitters is not installed")
+
+        rng = random.Random(42)
+        tokens = ["a", "bb", "word", "é", " ", "  ", "\t", "\n", "\n\n", "\n \n"]
+        texts = [SAMPLE_TEXT] + [
+            "".join(rng.choice(tokens) for _ in range(rng.randint(0, 400)))
+            for _ in range(300)
+        ]
+        for index, text in enumerate(texts):
+            size = rng.randint(1, 120)
+            overlap = rng.randint(1, size)
+            expected = RecursiveCharacterTextSplitter(
+                chunk_size=size, chunk_overlap=overlap
+            ).split_text(text)
+            with self.subTest(text=index, size=size, overlap=overlap):
+                self.assertEqual(RecursiveSplitter(size, overlap).split(text), expected)
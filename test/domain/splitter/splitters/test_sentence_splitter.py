@@ -80,3 +80,39 @@ def test_split_into_chunks_of_0():
 def test_split_into_chunks_of_negative():
     with pytest.raises(ValueError, match="num_sentences must be greater than 0"):
         SentenceSplitter(num_sentences=-3)
+
+
+@pytest.mark.parametrize("piece_size", [1, 7, 64, 10_000])
+def test_split_iter_matches_split(piece_size):
+    """split_iter over consecutive pieces yields the same chunks as split on the whole text."""
+    splitter = SentenceSplitter(num_sentences=2)
+    text = SAMPLE_TEXT + "  Trailing words!\n\n  end"
+    pieces = (text[i : i + piece_size] for i in range(0, len(text), piece_size))
+    assert list(splitter.split_iter(pieces)) == splitter.split(text)
+    assert list(splitter.split_iter(text)) == splitter.split(text)
+    assert list(splitter.split_iter(iter(["", " ", ""]))) == splitter.split(" ")
+
+
+def test_abbreviations_do_not_split():
+    """Abbreviations of the configured language do not end a sentence."""
+    text = "Dr. Smith arrived, e.g. at noon. Then he left."
+    assert SentenceSplitter(num_sentences=1).split(text) == [
+        "Dr. Smith arrived, e.g. at noon.",
+        "Then he left.",
+    ]
+    text = "Der Vertrag, z.B. mit Dr. Meier. Ende."
+    assert SentenceSplitter(num_sentences=1, language="de").split(text) == [
+        "Der Vertrag, z.B. mit Dr. Meier.",
+        "Ende.",
+    ]
+
+
+def test_single_letter_endings_split():
+    """A sentence ending in a single letter is not merged with the next one."""
+    text = "Plan A. It failed. Vitamin C. Good."
+    assert SentenceSplitter(num_sentences=1).split(text) == [
+        "Plan A.",
+        "It failed.",
+        "Vitamin C.",
+        "Good.",
+    ]
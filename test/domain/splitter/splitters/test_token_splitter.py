@@ -0,0 +1,108 @@
+import pytest
+
+from src.domain.splitter.splitters.token_splitter import TokenSplitter
+
+SAMPLE_TEXT = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Donec eget purus non est "
+    "porta rutrum.\n\nSuspendisse euismod lectus laoreet sem pellentesque egestas et et "
+    "sem. Pellentesque ex felis, cursus eget ornare eu, posuere vitae ante. Nam et "
+    "hendrerit neque, sed ornare tortor.\n\nQuisque sodales scelerisque odio ut sodales."
+)
+
+
+class TestTokenSplitter:
+    def test_chunks_fit_in_max_tokens(self):
+        """Chunks have at most max_tokens tokens and keep all the words in order."""
+        splitter = TokenSplitter(max_tokens=12)
+        chunks = splitter.split(SAMPLE_TEXT)
+        assert len(chunks) > 1
+        assert all(splitter.tokenizer.count(chunk) <= 12 for chunk in chunks)
+        assert " ".join(chunks).split() == SAMPLE_TEXT.split()
+
+    def test_chunks_are_filled(self):
+        """A chunk is only closed when the next word does not fit."""
+        splitter = TokenSplitter(max_tokens=12)
+        spans, counts = splitter.split_counted(SAMPLE_TEXT)
+        words = SAMPLE_TEXT.split()
+        position = 0
+        for chunk, count in zip(spans.to_list()[:-1], counts):
+            position += len(chunk.split())
+            assert count + splitter.tokenizer.count(words[position]) > 12
+
+    def test_split_counted(self):
+        """The counts are those of the tokenizer on each chunk."""
+        splitter = TokenSplitter(max_tokens=10, overlap=3)
+        spans, counts = splitter.split_counted(SAMPLE_TEXT)
+        assert spans.text is SAMPLE_TEXT
+        assert counts == [splitter.tokenizer.count(chunk) for chunk in spans]
+        assert spans.to_list() == splitter.split(SAMPLE_TEXT)
+
+    def test_overlap(self):
+        """Consecutive chunks share their boundary words, up to overlap tokens."""
+        splitter = TokenSplitter(max_tokens=10, overlap=3)
+        spans = splitter.split_spans(SAMPLE_TEXT)
+        for (_, end), (start, _) in zip(spans.spans(), spans.spans()[1:]):
+            assert start < end
+            assert splitter.tokenizer.count(SAMPLE_TEXT[start:end]) <= 3
+
+    def test_oversized_word(self):
+        """A word with more tokens than max_tokens is split between its tokens."""
+        splitter = TokenSplitter(max_tokens=3)
+        spans, counts = splitter.split_counted("a b a.b.c.d c d")
+        assert spans.to_list() == ["a b", "a.b", ".c.", "d c d"]
+        assert counts == [2, 3, 3, 3]
+
+    def test_long_unbroken_token(self, tmp_path):
+        """A long token without whitespace is cut between characters to fit max_tokens."""
+        vocab = tmp_path / "vocab.txt"
+        vocab.write_text("[UNK]\na\n##a\n##b\n", encoding="utf-8")
+        splitter = TokenSplitter(
+            max_tokens=4, overlap=1, tokenizer="wordpiece", vocab_path=str(vocab)
+        )
+        text = "data " + "ab" * 20 + " end"
+        spans, counts = splitter.split_counted(text)
+
+        assert spans.to_list() == ["data"] + ["abab"] * 10 + ["end"]
+        assert counts == [1] + [4] * 10 + [1]
+
+    def test_long_url(self):
+        """A URL longer than max_tokens is split into chunks within the budget."""
+        splitter = TokenSplitter(max_tokens=8)
+        url = "https://example.com/" + "/".join(f"part{n}" for n in range(30))
+        spans, counts = splitter.split_counted(f"See {url} for details.")
+
+        assert len(spans) > 2
+        assert all(count <= 8 for count in counts)
+        assert counts == [splitter.tokenizer.count(chunk) for chunk in spans]
+        assert "".join(spans.to_list()[1:-1]) + spans[-1].split()[0] == url
+
+    def test_wordpiece_tokenizer(self, tmp_path):
+        """Chunks can be counted in the subword tokens of a local vocabulary."""
+        vocab = tmp_path / "vocab.txt"
+        vocab.write_text("[UNK]\nsplit\n##ter\n##s\nthe\n", encoding="utf-8")
+        splitter = TokenSplitter(
+            max_tokens=4, tokenizer="wordpiece", vocab_path=str(vocab)
+        )
+        spans, counts = splitter.split_counted("the splitters the splitter the")
+        assert spans.to_list() == ["the splitters", "the splitter the"]
+        assert counts == [4, 4]
+
+    def test_empty_text(self):
+        """Empty text gives no chunks."""
+        assert TokenSplitter().split("") == []
+        assert TokenSplitter().split_counted(" \n ")[1] == []
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"max_tokens": 0},
+            {"max_tokens": 10, "overlap": 10},
+            {"overlap": -1},
+            {"tokenizer": "unknown"},
+            {"tokenizer": "wordpiece"},
+        ],
+    )
+    def test_invalid_parameters(self, params):
+        """Invalid parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            TokenSplitter(**params)
@@ -88,3 +88,14 @@ class TestWordSplitter:
         """
         with pytest.raises(ValueError, match="num_words must be greater than 0"):
             WordSplitter(num_words=-3)
+
+
+@pytest.mark.parametrize("piece_size", [1, 7, 64, 10_000])
+def test_split_iter_matches_split(piece_size):
+    """split_iter over consecutive pieces yields the same chunks as split on the whole text."""
+    splitter = WordSplitter(num_words=3)
+    text = SAMPLE_TEXT + "  Trailing words!\n\n  end"
+    pieces = (text[i : i + piece_size] for i in range(0, len(text), piece_size))
+    assert list(splitter.split_iter(pieces)) == splitter.split(text)
+    assert list(splitter.split_iter(text)) == splitter.split(text)
+    assert list(splitter.split_iter(iter(["", " ", ""]))) == splitter.split(" ")
@@ -0,0 +1,41 @@
+from array import array
+
+import pytest
+
+from src.domain.splitter.chunk_spans import (
+    ChunkSpans,
+    group_spans,
+    strip_span,
+)
+
+
+def test_chunk_spans_materialize_on_access():
+    """Chunks are read from the source text by index, slice and iteration."""
+    spans = ChunkSpans(
+        "alpha beta gamma", array("q", [0, 6, 11]), array("q", [5, 10, 16])
+    )
+    assert len(spans) == 3
+    assert spans[1] == "beta"
+    assert spans[-1] == "gamma"
+    assert spans[:2].to_list() == ["alpha", "beta"]
+    assert list(spans) == ["alpha", "beta", "gamma"]
+    assert spans.spans() == [(0, 5), (6, 10), (11, 16)]
+
+
+def test_locate_overlapping_chunks():
+    """Overlapping and repeated chunks are located in order."""
+    text = "abcabcabc"
+    spans = ChunkSpans.locate(text, ["abc", "cab", "abc", "abc"])
+    assert spans.spans() == [(0, 3), (2, 5), (3, 6), (6, 9)]
+    with pytest.raises(ValueError):
+        ChunkSpans.locate(text, ["abc", "xyz"])
+
+
+def test_strip_and_group_spans():
+    """Whitespace is stripped from spans, and units are grouped into chunks."""
+    text = "  one two  three "
+    assert strip_span(text, 0, len(text)) == (2, 16)
+    assert strip_span(text, 0, 2) == (2, 2)
+    units = [(2, 5), (6, 9), (11, 16)]
+    assert group_spans(text, units, 2).to_list() == ["one two", "three"]
+    assert len(group_spans(text, [], 2)) == 0
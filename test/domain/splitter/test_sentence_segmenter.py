@@ -0,0 +1,70 @@
+import pytest
+
+from src.domain.splitter.sentence_segmenter import SentenceSegmenter
+
+
+def sentences(text, **kwargs):
+    return [text[start:end] for start, end in SentenceSegmenter(**kwargs).spans(text)]
+
+
+def test_sentence_boundaries():
+    """Sentences end at ., ! or ? followed by whitespace, without surrounding whitespace."""
+    text = "  First one.  Second!!\nThird?  Last without period "
+    assert sentences(text) == [
+        "First one.",
+        "Second!!",
+        "Third?",
+        "Last without period",
+    ]
+    assert sentences("") == []
+    assert sentences(" \n ") == []
+
+
+def test_abbreviations_initials_and_decimals():
+    """Abbreviations, initials and decimal numbers do not end a sentence."""
+    text = "Dr. Smith met J. R. Doe, e.g. at 3.5 km (i.e. close). It cost 3.14 USD."
+    assert sentences(text) == [
+        "Dr. Smith met J. R. Doe, e.g. at 3.5 km (i.e. close).",
+        "It cost 3.14 USD.",
+    ]
+
+
+def test_single_letters_end_sentences():
+    """A lone letter before a period ends the sentence; only runs of initials do not."""
+    assert sentences("Plan A. It failed. Vitamin C. Good.") == [
+        "Plan A.",
+        "It failed.",
+        "Vitamin C.",
+        "Good.",
+    ]
+    assert sentences("J. R. R. Tolkien wrote it. Fine.") == [
+        "J. R. R. Tolkien wrote it.",
+        "Fine.",
+    ]
+
+
+def test_language_and_custom_abbreviations():
+    """Abbreviations depend on the language and can be extended."""
+    text = "La Sra. Pérez llegó. Vio el núm. tres. Fin approx. aquí."
+    assert sentences(text, language="es") == [
+        "La Sra. Pérez llegó.",
+        "Vio el núm. tres.",
+        "Fin approx.",
+        "aquí.",
+    ]
+    assert len(sentences(text, language="es", abbreviations=["Approx."])) == 3
+    with pytest.raises(ValueError):
+        SentenceSegmenter(language="xx")
+
+
+def test_groups_and_group_spans():
+    """Groups join their sentences with a space; group spans cover them in the text."""
+    text = " One.  Two!\nThree? Four. Five "
+    segmenter = SentenceSegmenter()
+    assert list(segmenter.groups(text, 2)) == ["One. Two!", "Three? Four.", "Five"]
+    assert [text[s:e] for s, e in segmenter.group_spans(text, 2)] == [
+        "One.  Two!",
+        "Three? Four.",
+        "Five",
+    ]
+    assert list(segmenter.groups("   ", 2)) == []
@@ -0,0 +1,119 @@
+import pytest
+
+from src.domain.reader.document import Document
+from src.domain.splitter.split_manager import SplitManager
+
+MARKDOWN = "# One\n\nalpha beta\n\fgamma\n\n# Two\n\ndelta epsilon"
+
+
+@pytest.fixture
+def split_manager():
+    config = {"splitter": {"method": "word", "methods": {"word": {"num_words": 100}}}}
+    return SplitManager(config=config)
+
+
+def test_split_document_whole(split_manager):
+    """Test that without boundaries the whole text is split."""
+    document = Document.from_markdown(MARKDOWN)
+    assert split_manager.split_document(document) == split_manager.split_text(MARKDOWN)
+
+
+def test_split_document_by_page(split_manager):
+    """Test that no chunk spans two pages."""
+    chunks = split_manager.split_document(Document.from_markdown(MARKDOWN), by="page")
+    assert len(chunks) == 2
+    assert "gamma" not in chunks[0] and "alpha" not in chunks[1]
+
+
+def test_split_document_by_section(split_manager):
+    """Test that no chunk spans two sections."""
+    chunks = split_manager.split_document(
+        Document.from_markdown(MARKDOWN), by="section"
+    )
+    assert len(chunks) == 2
+    assert chunks[0].startswith("# One") and chunks[1].startswith("# Two")
+
+
+def test_split_document_invalid_boundary(split_manager):
+    """Test that unknown boundaries are rejected."""
+    with pytest.raises(ValueError):
+        split_manager.split_document(Document.from_markdown(MARKDOWN), by="chapter")
+
+
+def test_split_iter_over_pages(split_manager):
+    """Test that split_iter yields the chunks of split_text from the pages of a document."""
+    pages = MARKDOWN.split("\f")
+    pieces = [page + "\f" for page in pages[:-1]] + pages[-1:]
+    assert list(split_manager.split_iter(iter(pieces))) == split_manager.split_text(
+        MARKDOWN
+    )
+
+
+def test_split_iter_empty_text(split_manager, caplog):
+    """Test that split_iter yields nothing and warns on whitespace-only pieces."""
+    with caplog.at_level("WARNING"):
+        assert list(split_manager.split_iter(iter(["  ", "\n"]))) == []
+    assert "Empty text provided for splitting." in caplog.text
+
+
+def test_split_iter_default_joins_pieces():
+    """Test that splitters without a streaming split_iter split the joined pieces."""
+    split_manager = SplitManager(
+        {
+            "splitter": {
+                "method": "recursive",
+                "methods": {"recursive": {"size": 20, "overlap": 5}},
+            }
+        }
+    )
+    text = "alpha beta gamma delta epsilon zeta eta theta"
+    assert list(split_manager.split_iter([text[:9], text[9:]])) == (
+        split_manager.split_text(text)
+    )
+
+
+@pytest.mark.parametrize(
+    "method, params",
+    [
+        ("word", {"num_words": 3}),
+        ("sentence", {"num_sentences": 2}),
+        ("paragraph", {"num_paragraphs": 2}),
+        ("fixed", {"size": 17}),
+        ("recursive", {"size": 20, "overlap": 5}),
+        ("token", {"max_tokens": 4}),
+    ],
+)
+def test_split_spans_point_into_the_text(method, params):
+    """Test that split_spans gives the chunks of split_text up to whitespace."""
+    text = "First  sentence here. Second one!\n\n  Third\tline?\nLast words of it."
+    split_manager = SplitManager(
+        {"splitter": {"method": method, "methods": {method: params}}}
+    )
+    spans = split_manager.split_spans(text)
+    assert spans.text is text
+    assert [" ".join(chunk.split()) for chunk in spans] == [
+        " ".join(chunk.split()) for chunk in split_manager.split_text(text)
+    ]
+    if not split_manager.splitter.normalizes_whitespace:
+        assert spans.to_list() == split_manager.split_text(text)
+
+
+def test_split_spans_empty_text(split_manager):
+    """Test that split_spans gives no chunks for empty text."""
+    assert len(split_manager.split_spans("  \n")) == 0
+
+
+def test_split_counted():
+    """Token chunks come with their token counts, other chunks without them."""
+    text = "One two three, four five. Six seven eight nine ten."
+    split_manager = SplitManager(
+        {"splitter": {"method": "token", "methods": {"token": {"max_tokens": 5}}}}
+    )
+    spans, counts = split_manager.split_counted(text)
+    assert spans.to_list() == split_manager.split_text(text)
+    assert counts == [split_manager.splitter.tokenizer.count(chunk) for chunk in spans]
+    assert split_manager.split_counted("  ") == (split_manager.split_spans("  "), [])
+
+    spans, counts = SplitManager(split_method="word").split_counted(text)
+    assert counts is None
+    assert len(spans) == 1
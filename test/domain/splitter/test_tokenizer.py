@@ -0,0 +1,85 @@
+import pytest
+
+from src.domain.splitter.tokenizer import (
+    RegexTokenizer,
+    WordPieceTokenizer,
+    load_tokenizer,
+)
+
+VOCAB = ["[PAD]", "[UNK]", "the", "token", "##izer", "##s", "split", "##ter", ",", "."]
+
+
+@pytest.fixture
+def vocab_path(tmp_path):
+    path = tmp_path / "vocab.txt"
+    path.write_text("\n".join(VOCAB) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_regex_tokenizer():
+    """Words and punctuation characters are tokens."""
+    tokenizer = RegexTokenizer()
+    assert tokenizer.tokenize("Hello, world... 42!") == [
+        "Hello",
+        ",",
+        "world",
+        ".",
+        ".",
+        ".",
+        "42",
+        "!",
+    ]
+    assert tokenizer.count("Hello, world... 42!") == 8
+    assert tokenizer.count("  ") == 0
+
+
+def test_wordpiece_tokenizer(vocab_path):
+    """Words are split into the longest vocabulary entries, unknown words are [UNK]."""
+    tokenizer = WordPieceTokenizer(vocab_path)
+    assert tokenizer.tokenize("The Tokenizers, splitter.") == [
+        "the",
+        "token",
+        "##izer",
+        "##s",
+        ",",
+        "split",
+        "##ter",
+        ".",
+    ]
+    assert tokenizer.tokenize("thé tokenx") == ["the", "[UNK]"]
+    assert tokenizer.count("the splitters") == 4
+
+
+def test_cjk_ideographs_are_single_tokens(vocab_path):
+    """CJK ideographs are one token each, as BERT splits around them."""
+    assert RegexTokenizer().tokenize("東京 tower") == ["東", "京", "tower"]
+    assert WordPieceTokenizer(vocab_path).tokenize("東京the") == [
+        "[UNK]",
+        "[UNK]",
+        "the",
+    ]
+
+
+def test_wordpiece_tokenizer_cased(vocab_path):
+    """A cased tokenizer keeps the case of the text."""
+    assert WordPieceTokenizer(vocab_path, lowercase=False).tokenize("The the") == [
+        "[UNK]",
+        "the",
+    ]
+
+
+def test_wordpiece_counts_add_up_over_words(vocab_path):
+    """The count of a text is the sum of the counts of its whitespace-separated words."""
+    tokenizer = WordPieceTokenizer(vocab_path)
+    text = "the tokenizers, split the splitter. unknown"
+    assert tokenizer.count(text) == sum(tokenizer.count(w) for w in text.split())
+
+
+def test_load_tokenizer(vocab_path):
+    """Tokenizers are built by name, and wordpiece requires a vocabulary."""
+    assert isinstance(load_tokenizer(), RegexTokenizer)
+    assert isinstance(load_tokenizer("wordpiece", vocab_path), WordPieceTokenizer)
+    with pytest.raises(ValueError):
+        load_tokenizer("wordpiece")
+    with pytest.raises(ValueError):
+        load_tokenizer("bpe")
@@ -0,0 +1,115 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.infrastructure.helpers.cache import TextCache, get_shared_cache
+
+
+def test_memory_hit_and_miss():
+    """Test that stored values are returned and counted as memory hits."""
+    cache = TextCache()
+    assert cache.get("missing") is None
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_memory_lru_eviction():
+    """Test that the least recently used entry is evicted when the memory tier is full."""
+    value = "x" * 1000
+    cache = TextCache(memory_max_bytes=2500)
+    cache.put("a", value)
+    cache.put("b", value)
+    cache.get("a")  # "b" becomes the least recently used entry.
+    cache.put("c", value)
+
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get("a") == value
+    assert cache.get("b") is None
+
+
+def test_disk_tier_survives_new_instances(tmp_path):
+    """Test that a fresh cache on the same directory is served from disk."""
+    TextCache(disk_path=str(tmp_path)).put("key", "persisted")
+
+    cache = TextCache(disk_path=str(tmp_path))
+    assert cache.get("key") == "persisted"
+    assert cache.stats()["disk_hits"] == 1
+    # Promoted to memory on the disk hit.
+    assert cache.get("key") == "persisted"
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_disk_size_eviction(tmp_path):
+    """Test that the oldest files are removed when the disk tier exceeds its size."""
+    cache = TextCache(memory_max_bytes=0, disk_path=str(tmp_path), disk_max_bytes=2500)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, "x" * 1000)
+        path = tmp_path / f"{key}.md"
+        os.utime(path, (1000 + i, 1000 + i))
+
+    cache.put("d", "x" * 1000)
+    assert sorted(os.listdir(tmp_path)) == ["c.md", "d.md"]
+    assert cache.stats()["disk_bytes"] == 2000
+
+
+def test_memory_gets_do_not_wait_for_disk_writes(tmp_path, monkeypatch):
+    """Test that a put stuck writing to disk does not block memory lookups."""
+    cache = TextCache(disk_path=str(tmp_path))
+    cache.put("ready", "in memory")
+    writing, release = threading.Event(), threading.Event()
+    replace = os.replace
+
+    def slow_replace(src, dst):
+        writing.set()
+        release.wait(5)
+        replace(src, dst)
+
+    monkeypatch.setattr("src.infrastructure.helpers.cache.os.replace", slow_replace)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = executor.submit(cache.put, "slow", "x" * 1000)
+        assert writing.wait(5)
+        try:
+            assert executor.submit(cache.get, "ready").result(1) == "in memory"
+            assert executor.submit(cache.get, "slow").result(1) == "x" * 1000
+        finally:
+            release.set()
+        pending.result()
+
+    assert (tmp_path / "slow.md").read_text() == "x" * 1000
+    assert cache.stats()["disk_bytes"] == 1000 + len("in memory")
+
+
+def test_ttl_expiration(tmp_path, monkeypatch):
+    """Test that entries older than the TTL are treated as misses on both tiers."""
+    now = [1000.0]
+    monkeypatch.setattr("src.infrastructure.helpers.cache.time.time", lambda: now[0])
+    cache = TextCache(disk_path=str(tmp_path), ttl=10)
+    cache.put("key", "value")
+    os.utime(tmp_path / "key.md", (now[0], now[0]))
+
+    now[0] += 5
+    assert cache.get("key") == "value"
+    now[0] += 20
+    assert cache.get("key") is None
+    assert not (tmp_path / "key.md").exists()
+
+
+def test_shared_cache_is_reused():
+    """Test that the same settings return the same cache instance."""
+    assert get_shared_cache(memory_max_mb=1) is get_shared_cache(memory_max_mb=1)
+    assert get_shared_cache(memory_max_mb=1) is not get_shared_cache(memory_max_mb=2)
+    assert get_shared_cache("reader") is not get_shared_cache("captions")
+
+
+def test_clear_memory_only():
+    """Clearing a memory-only cache empties it without touching any directory."""
+    cache = TextCache(memory_max_bytes=1024)
+    cache.put("a", "alpha")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats()["memory_bytes"] == 0
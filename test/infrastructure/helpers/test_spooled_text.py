@@ -0,0 +1,62 @@
+import pytest
+
+from src.infrastructure.helpers.spooled_text import SpooledText
+
+
+def test_small_text_stays_in_memory():
+    """Text under the threshold is kept in memory and read back as is."""
+    with SpooledText(max_memory=100) as spooled:
+        spooled.write("héllo ")
+        spooled.write("world")
+        assert not spooled.rolled
+        assert len(spooled) == 11
+        assert spooled.read() == "héllo world"
+        assert "".join(spooled.iter_text()) == "héllo world"
+        with spooled.mapped() as data:
+            assert bytes(data) == "héllo world".encode("utf-8")
+
+
+def test_large_text_spills_to_disk(tmp_path):
+    """Text past the threshold is moved to a temporary file and decoded block by block."""
+    pieces = ["ñandú " * 10, "€uro " * 10, "end"]
+    with SpooledText(max_memory=20, dir=str(tmp_path), block_size=7) as spooled:
+        for piece in pieces:
+            spooled.write(piece)
+        assert spooled.rolled
+        assert len(spooled) == sum(map(len, pieces))
+
+        blocks = list(spooled.iter_text())
+        assert len(blocks) > 1
+        assert "".join(blocks) == "".join(pieces)
+        assert spooled.read() == "".join(pieces)
+        with spooled.mapped() as data:
+            assert data[:7] == "ñandú".encode("utf-8")
+
+
+def test_threshold_counts_encoded_bytes(tmp_path):
+    """The memory threshold is compared with the UTF-8 size, not the number of characters."""
+    with SpooledText(max_memory=8, dir=str(tmp_path)) as spooled:
+        spooled.write("abcdefgh")
+        assert not spooled.rolled
+    with SpooledText(max_memory=8, dir=str(tmp_path)) as spooled:
+        spooled.write("€€€")  # 3 characters, 9 bytes
+        assert spooled.rolled
+        assert spooled.read() == "€€€"
+
+
+def test_empty_spooled_text():
+    """An empty buffer reads as an empty string, in memory and spilled."""
+    assert SpooledText().read() == ""
+    spooled = SpooledText(max_memory=0)
+    spooled.write("")
+    assert spooled.read() == ""
+    with spooled.mapped() as data:
+        assert data == b""
+
+
+def test_invalid_settings():
+    """Negative thresholds and empty blocks are rejected."""
+    with pytest.raises(ValueError):
+        SpooledText(max_memory=-1)
+    with pytest.raises(ValueError):
+        SpooledText(block_size=0)
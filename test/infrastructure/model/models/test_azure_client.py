@@ -12,7 +12,7 @@ def test_azure_client(monkeypatch):
 
     # Create a dummy AzureOpenAI class to replace openai.AzureOpenAI.
     class DummyAzureOpenAI:
-        def __init__(self, api_key, api_version, azure_endpoint):
+        def __init__(self, api_key, api_version, azure_endpoint, http_client=None):
             self.api_key = api_key
             self.api_version = api_version
             self.azure_endpoint = azure_endpoint
@@ -14,8 +14,9 @@ def test_openai_client(monkeypatch):
 
     # Define a dummy OpenAI class that just stores the api_key.
     class DummyOpenAI:
-        def __init__(self, api_key):
+        def __init__(self, api_key, http_client=None):
             self.api_key = api_key
+            self.http_client = http_client
 
     # Replace openai.OpenAI with DummyOpenAI.
     monkeypatch.setattr(openai, "OpenAI", DummyOpenAI)
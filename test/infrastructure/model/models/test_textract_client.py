@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -34,7 +34,11 @@ def test_initialize_textract_client(mock_boto_client, mock_getenv):
         aws_secret_access_key="fake-secret-key",
         aws_session_token="fake-session-token",
         region_name="us-west-2",
+        config=ANY,
     )
+    config = mock_boto_client.call_args.kwargs["config"]
+    assert config.max_pool_connections >= 16
+    assert config.tcp_keepalive
 
     assert client.client == fake_client
     assert client.model is None
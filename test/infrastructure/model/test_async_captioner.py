@@ -0,0 +1,212 @@
+import asyncio
+import base64
+import hashlib
+import io
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.reader.readers.markitdown_reader import MarkItDownReader
+from src.infrastructure.helpers.cache import TextCache
+from src.infrastructure.model.async_captioner import (
+    AsyncCaptioner,
+    RecordingCaptionClient,
+    splice_captions,
+)
+
+
+def describe(messages) -> str:
+    """Deterministic caption of the image in a request, with characters to clean up."""
+    url = messages[0]["content"][1]["image_url"]["url"]
+    data = base64.b64decode(url.split(";base64,", 1)[1])
+    return f"A [picture]\nwith hash {hashlib.sha256(data).hexdigest()[:8]}."
+
+
+def response(content: str) -> SimpleNamespace:
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeSyncClient:
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        return response(describe(messages))
+
+
+class FakeAsyncClient:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.loops = set()
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        self.loops.add(asyncio.get_running_loop())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("service unavailable")
+            return response(describe(messages))
+        finally:
+            self.in_flight -= 1
+
+    async def close(self):
+        self.loops.add(asyncio.get_running_loop())
+        self.closed = True
+
+
+def image_messages(data: bytes):
+    uri = f"data:image/png;base64,{base64.b64encode(data).decode()}"
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Caption"},
+                {"type": "image_url", "image_url": {"url": uri}},
+            ],
+        }
+    ]
+
+
+def record(recorder: RecordingCaptionClient, data: bytes) -> str:
+    result = recorder.chat.completions.create(model="m", messages=image_messages(data))
+    return result.choices[0].message.content
+
+
+def test_recording_client_shares_tokens_for_identical_images():
+    """Test that identical images get one placeholder and one recorded request."""
+    recorder = RecordingCaptionClient()
+    first = record(recorder, b"logo")
+    assert record(recorder, b"logo") == first
+    assert record(recorder, b"other") != first
+    assert len(recorder.requests) == 2
+    assert first.isalnum()
+
+
+def test_recording_client_answers_cached_images():
+    """Test that images already in the cache are not deferred."""
+    cache = TextCache()
+    recorder = RecordingCaptionClient(cache)
+    token = record(recorder, b"logo")
+    cache.put(recorder.requests[token][0], "A logo")
+    assert record(RecordingCaptionClient(cache), b"logo") == "A logo"
+
+
+def test_captions_run_concurrently_under_the_limit():
+    """Test that requests overlap, but never beyond the configured concurrency."""
+    client = FakeAsyncClient(delay=0.1)
+    captioner = AsyncCaptioner(client, concurrency=4, cache=TextCache())
+    recorder = RecordingCaptionClient()
+    tokens = [record(recorder, bytes([i])) for i in range(12)]
+
+    start = time.perf_counter()
+    captions = captioner.caption(recorder.requests)
+    elapsed = time.perf_counter() - start
+    captioner.close()
+
+    assert client.max_in_flight == 4
+    assert elapsed < 0.8  # 3 waves of 0.1 s, against 1.2 s one after another.
+    assert [captions[token] for token in tokens] == [
+        describe(image_messages(bytes([i]))) for i in range(12)
+    ]
+    assert captioner.cache.stats()["memory_entries"] == 12
+
+
+def test_failed_captions_are_empty():
+    """Test that a failing request yields an empty caption and is not cached."""
+    captioner = AsyncCaptioner(FakeAsyncClient(fail=True), cache=TextCache())
+    recorder = RecordingCaptionClient()
+    token = record(recorder, b"logo")
+    assert captioner.caption(recorder.requests) == {token: ""}
+    assert captioner.cache.stats()["memory_entries"] == 0
+    captioner.close()
+
+
+def test_close_closes_the_client_on_its_loop():
+    """Test that each captioner's client runs on one loop, closed with the thread."""
+    clients = [FakeAsyncClient(), FakeAsyncClient()]
+    captioners = [AsyncCaptioner(client, concurrency=2) for client in clients]
+    for captioner in captioners:
+        recorder = RecordingCaptionClient()
+        record(recorder, b"logo")
+        captioner.caption(recorder.requests)
+    threads = [captioner._thread for captioner in captioners]
+
+    for captioner in captioners:
+        captioner.close()
+        captioner.close()
+
+    assert all(client.closed and len(client.loops) == 1 for client in clients)
+    assert clients[0].loops != clients[1].loops
+    assert not any(thread.is_alive() for thread in threads)
+
+
+def test_invalid_concurrency():
+    """Test that the concurrency must be positive."""
+    with pytest.raises(ValueError):
+        AsyncCaptioner(FakeAsyncClient(), concurrency=0)
+
+
+def test_splice_captions():
+    """Test that alt-text captions are cleaned up like MarkItDown does."""
+    markdown = "![TOKENAX alt](a.jpg)\n![TOKENBX](b.jpg)\n# Description:\nTOKENAX\n"
+    captions = {"TOKENAX": " A [red]\nlogo ", "TOKENBX": ""}
+    assert splice_captions(markdown, captions) == (
+        "![A red logo alt](a.jpg)\n![](b.jpg)\n# Description:\nA [red]\nlogo\n"
+    )
+
+
+@pytest.fixture
+def pptx_with_images():
+    """A presentation with three pictures, two of them identical."""
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    presentation = Presentation()
+    for color in ("red", "blue", "red"):
+        image = io.BytesIO()
+        Image.new("RGB", (8, 8), color).save(image, format="PNG")
+        image.seek(0)
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = f"A {color} slide"
+        slide.shapes.add_picture(image, Inches(1), Inches(1))
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+def test_concurrent_captions_match_sequential_output(pptx_with_images):
+    """Test that the concurrent path produces the same document as MarkItDown alone."""
+    sequential = MarkItDownReader(FakeSyncClient(), "model").convert_stream(
+        io.BytesIO(pptx_with_images), "deck.pptx"
+    )
+    async_client = FakeAsyncClient(delay=0.05)
+    reader = MarkItDownReader(
+        FakeSyncClient(), "model", async_llm_client=async_client, caption_concurrency=4
+    )
+
+    async def convert_inside_event_loop():
+        return reader.convert_stream(io.BytesIO(pptx_with_images), "deck.pptx")
+
+    concurrent = asyncio.run(convert_inside_event_loop())
+    thread = reader.captioner._thread
+    reader.close()
+
+    assert async_client.closed and not thread.is_alive()
+
+    assert "with hash" in sequential
+    assert concurrent == sequential
+    assert async_client.calls == 2
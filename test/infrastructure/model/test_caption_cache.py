@@ -0,0 +1,127 @@
+import base64
+import io
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.helpers.cache import TextCache
+from src.infrastructure.model.caption_cache import CachedCaptionClient, caption_key
+
+
+class FakeVisionClient:
+    """OpenAI-like client that describes images by counting calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+        self.api_key = "secret"
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        message = SimpleNamespace(content=f"description {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def image_messages(data: bytes, mimetype: str = "image/png", prompt: str = "Caption"):
+    uri = f"data:{mimetype};base64,{base64.b64encode(data).decode()}"
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prompt},
+                {"type": "image_url", "image_url": {"url": uri}},
+            ],
+        }
+    ]
+
+
+@pytest.fixture
+def client():
+    return FakeVisionClient()
+
+
+def test_identical_images_are_described_once(client):
+    """Test that the same image bytes hit the cache, whatever their declared type."""
+    cached = CachedCaptionClient(client, TextCache())
+    first = cached.chat.completions.create(model="m", messages=image_messages(b"logo"))
+    second = cached.chat.completions.create(
+        model="m", messages=image_messages(b"logo", mimetype="image/octet-stream")
+    )
+    assert client.calls == 1
+    assert second.choices[0].message.content == first.choices[0].message.content
+    assert cached.stats()["memory_hits"] == 1
+
+
+def test_key_depends_on_image_prompt_and_model():
+    """Test that the image content, the prompt and the model all change the key."""
+    key = caption_key("m", image_messages(b"logo"), {})
+    assert key == caption_key("m", image_messages(b"logo", "image/jpeg"), {})
+    assert key != caption_key("m", image_messages(b"other"), {})
+    assert key != caption_key("m", image_messages(b"logo", prompt="Other"), {})
+    assert key != caption_key("other", image_messages(b"logo"), {})
+
+
+def test_requests_without_images_pass_through(client):
+    """Test that text-only requests are never cached."""
+    cached = CachedCaptionClient(client, TextCache())
+    messages = [{"role": "user", "content": "Hello"}]
+    assert caption_key("m", messages, {}) is None
+    cached.chat.completions.create(model="m", messages=messages)
+    cached.chat.completions.create(model="m", messages=messages)
+    assert client.calls == 2
+    assert cached.api_key == "secret"
+
+
+def test_concurrent_requests_are_deduplicated():
+    """Test that simultaneous requests for one image make a single API call."""
+    client = FakeVisionClient(delay=0.1)
+    cached = CachedCaptionClient(client, TextCache())
+    results = []
+
+    def describe():
+        response = cached.chat.completions.create(
+            model="m", messages=image_messages(b"signature")
+        )
+        results.append(response.choices[0].message.content)
+
+    threads = [threading.Thread(target=describe) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.calls == 1
+    assert results == ["description 1"] * 5
+    assert cached.stats()["deduplicated"] >= 1
+
+
+def test_descriptions_persist_on_disk(client, tmp_path):
+    """Test that a new cache over the same directory serves stored descriptions."""
+    messages = image_messages(b"header")
+    CachedCaptionClient(
+        client, TextCache(disk_path=str(tmp_path))
+    ).chat.completions.create(model="m", messages=messages)
+    reopened = CachedCaptionClient(client, TextCache(disk_path=str(tmp_path)))
+    reopened.chat.completions.create(model="m", messages=messages)
+    assert client.calls == 1
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_markitdown_uses_cached_client(client):
+    """Test that MarkItDown image captioning goes through the cache."""
+    from PIL import Image
+
+    from src.domain.reader.readers.markitdown_reader import MarkItDownReader
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format="PNG")
+    reader = MarkItDownReader(CachedCaptionClient(client, TextCache()), "model")
+    for _ in range(2):
+        buffer.seek(0)
+        assert "description 1" in reader.convert_stream(buffer, "logo.png")
+    assert client.calls == 1
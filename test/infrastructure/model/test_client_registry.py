@@ -0,0 +1,45 @@
+import threading
+
+from src.infrastructure.model.client_registry import ClientRegistry
+
+
+def test_get_builds_each_client_once():
+    """Test that a key is built once and then shared."""
+    registry = ClientRegistry()
+    built = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    first = registry.get("openai", factory)
+    assert registry.get("openai", factory) is first
+    assert registry.get("azure", factory) is not first
+    assert len(built) == 2
+    assert "openai" in registry and len(registry) == 2
+
+
+def test_concurrent_get_builds_once():
+    """Test that concurrent first uses do not build duplicate clients."""
+    registry = ClientRegistry()
+    built = []
+    barrier = threading.Barrier(8)
+
+    def use():
+        barrier.wait()
+        registry.get("textract", lambda: built.append(object()) or built[-1])
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1
+
+
+def test_clear():
+    """Test that clearing drops every client."""
+    registry = ClientRegistry()
+    registry.get("openai", object)
+    registry.clear()
+    assert len(registry) == 0
@@ -1,8 +1,17 @@
 import pytest
 
+from src.infrastructure.model.client_registry import client_registry
 from src.infrastructure.model.llm_client import LLMClient
 
 
+@pytest.fixture(autouse=True)
+def clear_client_registry():
+    """Clients are process-wide singletons: start each test from an empty registry."""
+    client_registry.clear()
+    yield
+    client_registry.clear()
+
+
 def test_llm_client_none():
     """Test that when method is 'none', no client is created."""
     llm = LLMClient("none")
@@ -57,3 +66,15 @@ def test_llm_client_invalid():
     """Test that an invalid method raises a ValueError."""
     with pytest.raises(ValueError):
         LLMClient("invalid")
+
+
+def test_llm_client_instances_share_the_sdk_client(monkeypatch):
+    """Test that LLMClients with the same method share one underlying client."""
+    from src.infrastructure.model.models.openai_client import OpenAIClient
+
+    built = []
+    monkeypatch.setattr(OpenAIClient, "__init__", lambda self: built.append(self))
+
+    first, second = LLMClient("openai"), LLMClient("openai")
+    assert first.client_instance is second.client_instance
+    assert len(built) == 1